@@ -0,0 +1,58 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import json
+import platform
+
+import pycord18n
+
+from . import bench_catalog, bench_hot_paths, bench_memory
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the pycord18n lookup and formatting hot paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=bench_hot_paths.SIZES,
+                        help="catalog sizes, in keys")
+    parser.add_argument("--depths", type=int, nargs="+", default=bench_hot_paths.DEPTHS,
+                        help="catalog nesting depths")
+    parser.add_argument("--number", type=int, default=20000,
+                        help="lookups per timing repeat")
+    parser.add_argument("--locales", type=int, default=bench_memory.LOCALES,
+                        help="locales per catalog in the memory benchmark")
+    parser.add_argument("--output", help="write the JSON here instead of stdout")
+    args = parser.parse_args()
+
+    report = {
+        "version": pycord18n.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "results": bench_hot_paths.run(args.sizes, args.depths, args.number),
+        "memory": bench_memory.run(args.sizes, args.depths, args.locales),
+        "catalog": bench_catalog.run(args.sizes, args.depths, args.number),
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
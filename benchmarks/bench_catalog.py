@@ -0,0 +1,128 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import multiprocessing
+import random
+import tempfile
+import timeit
+from typing import Dict, List
+
+from pycord18n.catalog import CatalogLanguage, compile_catalog
+from pycord18n.language import Language
+
+from benchmarks.bench_hot_paths import DEPTHS, SIZES, leaf_key, make_translations
+
+
+def _memory_kib():
+    """Return (rss, private) memory of this process in KiB, Linux only"""
+    rss = private = 0
+    try:
+        with open("/proc/self/smaps_rollup") as file:
+            for line in file:
+                if line.startswith("Rss:"):
+                    rss = int(line.split()[1])
+                elif line.startswith(("Private_Clean:", "Private_Dirty:")):
+                    private += int(line.split()[1])
+    except OSError:
+        import resource
+        rss = private = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss, private
+
+
+def _measure(kind: str, path: str, keys: List[str], number: int) -> Dict:
+    before_rss, before_private = _memory_kib()
+    start = timeit.default_timer()
+    if kind == "dict":
+        with open(path, encoding="utf-8") as file:
+            language = Language("English", "en", json.load(file))
+    else:
+        language = CatalogLanguage("English", "en", path)
+    language._get_index()
+    load = timeit.default_timer() - start
+
+    timer = timeit.Timer(lambda: [language.get_text(key) for key in keys])
+    repeats = max(1, number // len(keys))
+    latency = min(timer.repeat(repeat=5, number=repeats)) / (repeats * len(keys)) * 1e9
+
+    after_rss, after_private = _memory_kib()
+    return {
+        "load_ms": load * 1e3,
+        "ns_per_call": latency,
+        "rss_kib": after_rss - before_rss,
+        "private_kib": after_private - before_private,
+    }
+
+
+def bench_size(size: int, depth: int, number: int) -> List[Dict]:
+    """Measure dict-backed against mmap-backed languages, each in a fresh process"""
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "en.json")
+        catalog_path = os.path.join(directory, "en.p18c")
+        translations = make_translations(size, depth)
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump(translations, file)
+        compile_catalog(translations, catalog_path)
+        del translations
+
+        picks = random.Random(size * 10 + depth).sample(range(size), min(size, 1000))
+        keys = [leaf_key(i, depth) for i in picks]
+
+        context = multiprocessing.get_context("spawn")
+        results = []
+        for kind, path in (("dict", json_path), ("mmap", catalog_path)):
+            with context.Pool(1) as pool:
+                record = pool.apply(_measure, (kind, path, keys, number))
+            results.append({"benchmark": f"catalog.{kind}", "size": size, "depth": depth, **record})
+        return results
+
+
+def run(sizes=SIZES, depths=DEPTHS, number: int = 20000) -> List[Dict]:
+    """
+    Measure loading time, lookup time and memory of languages loaded from
+    JSON against memory mapped catalogs, each in a fresh process
+
+    Parameters
+    ----------
+    sizes : Iterable[int]
+        Number of leaves in the synthetic catalogs
+    depths : Iterable[int]
+        Nesting depths of the synthetic catalogs
+    number : int
+        Roughly how many lookups each timing repeat runs
+
+    Returns
+    -------
+    List[Dict]
+        One record per representation, size and depth
+    """
+    results = []
+    for size in sizes:
+        for depth in depths:
+            results.extend(bench_size(size, depth, number))
+    return results
+
+
+if __name__ == "__main__":
+    for record in run():
+        print(
+            f"{record['benchmark']:<13} {record['size']:>6} keys, depth {record['depth']}: "
+            f"load {record['load_ms']:.1f} ms, lookup {record['ns_per_call']:.0f} ns, "
+            f"rss +{record['rss_kib']} KiB, private +{record['private_kib']} KiB")
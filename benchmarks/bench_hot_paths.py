@@ -0,0 +1,147 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+import timeit
+from typing import Callable, Dict, List
+
+from pycord18n.extension import I18nExtension
+from pycord18n.i18n import I18n
+from pycord18n.language import Language
+
+SIZES = (100, 10000, 100000)
+DEPTHS = (1, 3)
+
+
+def make_translations(size: int, depth: int, prefix: str = "Value") -> Dict:
+    """
+    Make a synthetic catalog of ``size`` leaves, nested ``depth`` levels deep
+
+    Leaves are spread over groups so that every dotted key has ``depth``
+    segments. A few extra top-level keys are used for interpolation, nested
+    translations, lists and plurals.
+    """
+    translations = {}
+    for i in range(size):
+        group = translations
+        for level in range(depth - 1):
+            group = group.setdefault(f"g{level}_{i % 10}", {})
+        group[f"key_{i}"] = f"{prefix} number {i}"
+
+    translations["greeting"] = "Hello {name}, welcome to {brand}!"
+    translations["brand"] = "Pycord18n"
+    translations["signature"] = "{team} :wave:"
+    translations["team"] = "The {brand} team"
+    translations["farewell"] = "Goodbye {name}, from {signature}"
+    translations["members"] = "Members: {people}"
+    translations["and_"] = "and"
+    translations["apples"] = {"one": "{count} apple", "other": "{count} apples"}
+    translations["apples_one"] = "{count} apple"
+    translations["apples_other"] = "{count} apples"
+    return translations
+
+
+def leaf_key(i: int, depth: int) -> str:
+    return ".".join([f"g{level}_{i % 10}" for level in range(depth - 1)] + [f"key_{i}"])
+
+
+def time_call(func: Callable[[], object], number: int) -> float:
+    """Return the best time of one call in nanoseconds"""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def bench_size(size: int, depth: int, number: int) -> List[Dict]:
+    """Run every hot path benchmark against one catalog shape"""
+    english = Language("English", "en", make_translations(size, depth))
+    # Half translated, so half of the lookups fall back
+    french = Language("French", "fr", make_translations(size // 2, depth, "Valeur"))
+    i18n = I18n([english, french], fallback="en")
+    extension = I18nExtension([english, french], fallback="en", default=True)
+    extension.set_current_locale("fr")
+
+    picks = random.Random(size * 10 + depth).sample(range(size), min(size, 100))
+    keys = [leaf_key(i, depth) for i in picks]
+    fallback_keys = [leaf_key(i, depth) for i in picks if i >= size // 2] or keys
+    top_keys = [
+        key for key, value in english._translations.items()
+        if isinstance(value, str) and "{" not in value
+    ][:100]
+    people = [f"member{i}" for i in range(50)]
+    handles = [i18n.key(key) for key in keys]
+
+    def each(keys, func):
+        return lambda: [func(key) for key in keys]
+
+    cases = {
+        "language.plain": (each(top_keys, english.get_text), len(top_keys)),
+        "language.dotted": (each(keys, english.get_text), len(keys)),
+        "language.use_translations": (lambda: english.get_text("greeting", name="Bob"), 1),
+        "i18n.plain": (each(top_keys, lambda key: i18n.get_text(key, "en")), len(top_keys)),
+        "i18n.key_handle": (each(handles, lambda key: i18n.get_text(key, "en")), len(handles)),
+        "i18n.fallback": (each(fallback_keys, lambda key: i18n.get_text(key, "fr")), len(fallback_keys)),
+        "i18n.use_translations": (lambda: i18n.get_text("greeting", "en", name="Bob"), 1),
+        "i18n.nested_translations": (lambda: i18n.get_text("farewell", "en", name="Bob"), 1),
+        "i18n.list_formatter": (
+            lambda: i18n.get_text("members", "en", list_formatter=english.and_, people=people), 1),
+        "i18n.plural": (
+            each(range(10), lambda count: i18n.get_text("apples", "en", count=count)), 10),
+        # What callers did before plural forms existed
+        "i18n.plural_by_hand": (
+            each(range(10), lambda count: i18n.get_text(
+                "apples_one" if count == 1 else "apples_other", "en", count=count)), 10),
+        "extension.contextual": (
+            each(keys, lambda key: I18nExtension.contextual_get_text(key)), len(keys)),
+    }
+
+    results = []
+    for name, (func, calls) in cases.items():
+        results.append({
+            "benchmark": name,
+            "size": size,
+            "depth": depth,
+            "ns_per_call": time_call(func, max(1, number // calls)) / calls,
+        })
+    return results
+
+
+def run(sizes=SIZES, depths=DEPTHS, number: int = 20000) -> List[Dict]:
+    """
+    Run the hot path benchmarks for every catalog size and depth
+
+    Parameters
+    ----------
+    sizes : Iterable[int]
+        Number of leaves in the synthetic catalogs
+    depths : Iterable[int]
+        Nesting depths of the synthetic catalogs
+    number : int
+        Roughly how many lookups each timing repeat runs
+
+    Returns
+    -------
+    List[Dict]
+        One record per benchmark, size and depth
+    """
+    results = []
+    for size in sizes:
+        for depth in depths:
+            results.extend(bench_size(size, depth, number))
+    return results
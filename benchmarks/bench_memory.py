@@ -0,0 +1,130 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import gc
+import json
+import tracemalloc
+from typing import Callable, Dict, List
+
+from pycord18n.compact import compact
+from pycord18n.i18n import I18n
+from pycord18n.language import Language
+
+from benchmarks.bench_hot_paths import DEPTHS, make_translations
+
+SIZES = (100, 10000, 100000)
+LOCALES = 10
+
+
+def make_catalogs(size: int, depth: int, locales: int) -> List[Dict]:
+    """
+    Make ``locales`` catalogs as if each was loaded from its own JSON file.
+    Half of every catalog but the first is untranslated, copied from it.
+    """
+    source = json.dumps(make_translations(size, depth))
+    catalogs = [json.loads(source)]
+    for locale in range(1, locales):
+        translated = json.loads(source.replace("Value number", f"Value {locale} number", size // 2))
+        catalogs.append(translated)
+    return catalogs
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated by what ``build`` returns"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+def bench_size(size: int, depth: int, locales: int) -> List[Dict]:
+    """Measure plain and compact languages of one catalog shape"""
+    codes = [f"l{i}" for i in range(locales)]
+
+    def plain():
+        languages = [
+            Language(code, code, catalog)
+            for code, catalog in zip(codes, make_catalogs(size, depth, locales))
+        ]
+        i18n = I18n(languages, fallback=codes[0])
+        for code in codes:
+            i18n._get_table(code)
+        return i18n
+
+    def compacted():
+        languages = compact(
+            Language(code, code, catalog)
+            for code, catalog in zip(codes, make_catalogs(size, depth, locales))
+        )
+        i18n = I18n(languages, fallback=codes[0])
+        for code in codes:
+            i18n._get_table(code)
+        return i18n
+
+    results = []
+    for name, build in (("memory.plain", plain), ("memory.compact", compacted)):
+        results.append({
+            "benchmark": name,
+            "size": size,
+            "depth": depth,
+            "locales": locales,
+            "bytes": measure(build),
+        })
+    return results
+
+
+def run(sizes=SIZES, depths=DEPTHS, locales: int = LOCALES) -> List[Dict]:
+    """
+    Measure the memory held by an :class:`I18n` instance with every
+    resolution table built, for plain and compact languages
+
+    Parameters
+    ----------
+    sizes : Iterable[int]
+        Number of leaves in the synthetic catalogs
+    depths : Iterable[int]
+        Nesting depths of the synthetic catalogs
+    locales : int
+        Number of locales
+
+    Returns
+    -------
+    List[Dict]
+        One record per representation, size and depth
+    """
+    results = []
+    for size in sizes:
+        for depth in depths:
+            results.extend(bench_size(size, depth, locales))
+    return results
+
+
+if __name__ == "__main__":
+    for record in run():
+        print(
+            f"{record['benchmark']:<15} {record['size']:>6} keys, depth {record['depth']}: "
+            f"{record['bytes'] / 2 ** 20:.1f} MiB")
@@ -15,8 +15,12 @@
 # You should have received a copy of the GNU General Public License
 # along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
 
-from .i18n import I18n
-from .language import Language
+from .i18n import I18n, Namespace
+from .language import Language, LazyLanguage
 from .extension import I18nExtension
+from .catalog import CatalogLanguage, compile_catalog
+from .compact import CompactLanguage, compact
+from .loader import load_language
+from .validation import validate
 
 __version__ = "1.0.3"
\ No newline at end of file
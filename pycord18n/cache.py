@@ -0,0 +1,179 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Hashable, Optional
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+MISSING = object()
+
+# Keyword argument types whose values fully determine how they render
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def make_key(*args: Hashable, kwargs: dict) -> Optional[tuple]:
+    """
+    Build a cache key from positional parts and keyword arguments
+
+    Only keyword values of simple immutable types are accepted, and their
+    type is part of the key so that for example ``1`` and ``True`` do not
+    share an entry. Floats are keyed by their repr.
+
+    Parameters
+    ----------
+    *args : Hashable
+        Positional parts of the key
+    kwargs : dict
+        Keyword arguments of the call
+
+    Returns
+    -------
+    Optional[tuple]
+        The key, or None if the call should not be cached
+    """
+    if not kwargs:
+        return args
+
+    items = []
+    for name, value in kwargs.items():
+        kind = type(value)
+        if kind not in _CACHEABLE_TYPES:
+            return None
+        if kind is float:
+            # 0.0 and -0.0 are equal but render differently, and NaN never
+            # equals itself
+            value = repr(value)
+        items.append((name, kind, value))
+
+    items.sort(key=lambda item: item[0])
+    return (*args, tuple(items))
+
+
+class RenderCache:
+    """
+    A bounded LRU cache of rendered strings, with an optional time to live
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of entries kept
+        ttl : float, optional
+            Seconds an entry stays valid for, by default None (forever)
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Get an entry, marking it as recently used
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the entry
+
+        Returns
+        -------
+        Any
+            The cached value, or :data:`MISSING`
+        """
+        try:
+            value, expires = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return MISSING
+
+        if expires is not None and expires < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return MISSING
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Add an entry, evicting the least recently used one if full
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the entry
+        value : Any
+            The value to cache
+        """
+        expires = None
+        if self.ttl is not None:
+            expires = time.monotonic() + self.ttl
+
+        self._data[key] = (value, expires)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def evict(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove every entry whose key matches a predicate
+
+        Parameters
+        ----------
+        predicate : Callable[[Hashable], bool]
+            Called with each key, entries are removed when it returns True
+
+        Returns
+        -------
+        int
+            The number of removed entries
+        """
+        keys = [key for key in self._data if predicate(key)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Remove every entry. The hit and miss counters are kept.
+        """
+        self._data.clear()
+
+    def info(self) -> CacheInfo:
+        """
+        Get the cache statistics
+
+        Returns
+        -------
+        CacheInfo
+            Hits, misses, maximum size and current size
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
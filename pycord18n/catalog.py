@@ -0,0 +1,279 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, Union
+
+from .language import Language, _flatten_leaves
+from .plural import PluralForms
+
+MAGIC = b"P18C"
+VERSION = 2
+
+# magic, version, number of entries, reserved
+_HEADER = struct.Struct("<4sIII")
+# key offset, key length, value offset, value length, value kind
+_ENTRY = struct.Struct("<IIIII")
+
+KIND_STRING = 0
+# Plural forms, stored as a JSON object
+KIND_PLURAL = 1
+
+
+def compile_catalog(
+    translations: Union[Dict[str, Any], str, os.PathLike],
+    path: Union[str, os.PathLike]
+) -> int:
+    """
+    Compile translations into a binary catalog file that can be served by
+    :class:`CatalogLanguage`.
+
+    The file holds a header, a table of entries sorted by the UTF-8 bytes of
+    their dotted key, and a pool of the key and value strings. Identical
+    values are only stored once. Nested groups are flattened, so only
+    string leaves and plural forms can be looked up.
+
+    The file is written to a temporary file first and then moved into
+    place, so processes that have the old catalog mapped are not affected.
+
+    Parameters
+    ----------
+    translations : Union[Dict[str, Any], str, os.PathLike]
+        The (possibly nested) translations, or the path to a JSON file
+    path : Union[str, os.PathLike]
+        Where to write the catalog
+
+    Returns
+    -------
+    int
+        The number of entries written
+
+    Raises
+    ------
+    TypeError
+        A translation is neither a string nor a nested group
+    """
+    if not isinstance(translations, dict):
+        with open(translations, encoding="utf-8") as file:
+            translations = json.load(file)
+
+    entries = []
+    for key, value in _flatten_leaves(translations):
+        kind = KIND_STRING
+        if type(value) is PluralForms:
+            kind = KIND_PLURAL
+            value = json.dumps(value, ensure_ascii=False)
+        entries.append((key.encode("utf-8"), value.encode("utf-8"), kind))
+    entries.sort()
+
+    pool_start = _HEADER.size + _ENTRY.size * len(entries)
+    pool = bytearray()
+    values: Dict[bytes, int] = {}
+    table = bytearray()
+    for key, value, kind in entries:
+        key_offset = pool_start + len(pool)
+        pool += key
+
+        value_offset = values.get(value)
+        if value_offset is None:
+            value_offset = values[value] = pool_start + len(pool)
+            pool += value
+
+        table += _ENTRY.pack(key_offset, len(key), value_offset, len(value), kind)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, len(entries), 0))
+            file.write(table)
+            file.write(pool)
+        # mkstemp creates the file readable by its owner only, give it the
+        # usual permissions so that processes of other users can map it
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temporary, 0o666 & ~umask)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+    return len(entries)
+
+
+class Catalog(Mapping[str, str]):
+    """
+    Read-only mapping of dotted keys to translations, served from a memory
+    mapped catalog file written by :func:`compile_catalog`.
+
+    Lookups binary search the sorted entry table. Decoded values are kept
+    so that keys which are actually used are only decoded once.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Map a catalog file.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            The catalog file
+
+        Raises
+        ------
+        ValueError
+            The file is not a catalog, or was written by another version
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, _ = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            self._buffer.close()
+            raise ValueError(f"{path} is not a version {VERSION} catalog")
+
+        self._count = count
+        self._decoded: Dict[str, str] = {}
+
+    def close(self) -> None:
+        """
+        Unmap the file
+        """
+        self._decoded = {}
+        self._buffer.close()
+
+    def _entry(self, index: int) -> Tuple[int, int, int, int, int]:
+        return _ENTRY.unpack_from(self._buffer, _HEADER.size + _ENTRY.size * index)
+
+    def _find(self, key: str) -> Optional[Tuple[int, int, int, int, int]]:
+        """
+        Binary search the entry of a key
+        """
+        try:
+            target = key.encode("utf-8")
+        except (AttributeError, UnicodeEncodeError):
+            return None
+
+        buffer = self._buffer
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            entry = self._entry(middle)
+            probe = buffer[entry[0]:entry[0] + entry[1]]
+            if probe < target:
+                low = middle + 1
+            elif probe > target:
+                high = middle
+            else:
+                return entry
+        return None
+
+    def __getitem__(self, key: str) -> Union[str, PluralForms]:
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+
+        entry = self._find(key)
+        if entry is None:
+            raise KeyError(key)
+
+        _, _, value_offset, value_length, kind = entry
+        value = self._buffer[value_offset:value_offset + value_length].decode("utf-8")
+        if kind == KIND_PLURAL:
+            value = PluralForms(json.loads(value))
+        self._decoded[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._decoded or self._find(key) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        buffer = self._buffer
+        for index in range(self._count):
+            key_offset, key_length, _, _, _ = self._entry(index)
+            yield buffer[key_offset:key_offset + key_length].decode("utf-8")
+
+    def non_empty_keys(self) -> Iterator[str]:
+        """
+        Iterate over the keys with a non-empty translation, without decoding
+        the translations
+        """
+        buffer = self._buffer
+        for index in range(self._count):
+            key_offset, key_length, _, value_length, _ = self._entry(index)
+            if value_length:
+                yield buffer[key_offset:key_offset + key_length].decode("utf-8")
+
+
+class CatalogLanguage(Language):
+    """
+    A :class:`Language` served straight from a memory mapped catalog file
+    written by :func:`compile_catalog`.
+
+    Processes mapping the same file share its pages, and loading it does
+    not parse anything. Only string translations and plural forms are
+    stored, so looking up any other group of translations raises a KeyError.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, name: str, code: str, path: Union[str, os.PathLike]) -> None:
+        """
+        Initialize the language by mapping its catalog.
+
+        Parameters
+        ----------
+        name : str
+            The name of the language
+        code : str
+            The locale code of the language
+        path : Union[str, os.PathLike]
+            The catalog file
+        """
+        super().__init__(name, code, Catalog(path))
+
+    def _source_paths(self) -> Tuple[str, ...]:
+        if isinstance(self._translations, Catalog):
+            return (self._translations.path,)
+        return ()
+
+    def _reload(self) -> Optional["CatalogLanguage"]:
+        paths = self._source_paths()
+        if not paths:
+            return None
+        return CatalogLanguage(self.name, self.code, paths[0])
+
+    def _build_index(self) -> Mapping[str, Any]:
+        if isinstance(self._translations, Catalog):
+            # Already flat
+            self._index = self._translations
+            return self._index
+        return super()._build_index()
+
+    def _served_keys(self) -> Iterator[str]:
+        if isinstance(self._translations, Catalog):
+            return self._translations.non_empty_keys()
+        return super()._served_keys()
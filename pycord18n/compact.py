@@ -0,0 +1,309 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .language import Language, _flatten_leaves
+from .plural import PluralForms
+
+# Marks the keys a table has no translation for
+_ABSENT = object()
+
+
+class KeyStore:
+    """
+    Keys and values shared by the :class:`CompactTable` of several
+    languages.
+
+    Every key gets an ID, its position in the tables of every language, so
+    a key is only stored once however many languages translate it.
+    Identical values are also only stored once, such as untranslated
+    strings copied from another language.
+
+    A store only ever grows: keys and values stay in it after the
+    translations holding them are replaced. Languages whose translations
+    change often should be compacted into a new store from time to time,
+    for example with :func:`compact` when reloading them.
+    """
+
+    __slots__ = ("ids", "keys", "_values")
+
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.keys: List[str] = []
+        self._values: Dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def key_id(self, key: str) -> int:
+        """
+        Get the ID of a key, giving it one if it has none yet
+
+        Parameters
+        ----------
+        key : str
+            The dotted key
+
+        Returns
+        -------
+        int
+            The ID
+        """
+        key_id = self.ids.get(key)
+        if key_id is None:
+            key = sys.intern(key)
+            key_id = self.ids[key] = len(self.keys)
+            self.keys.append(key)
+        return key_id
+
+    def share(self, value: Union[str, PluralForms]) -> Union[str, PluralForms]:
+        """
+        Get the stored value equal to ``value``, storing it if there is none
+
+        Parameters
+        ----------
+        value : Union[str, PluralForms]
+            A translation string or plural forms
+
+        Returns
+        -------
+        Union[str, PluralForms]
+            The shared value
+        """
+        # Plural forms are not hashable, and must not match a string
+        marker = (PluralForms, tuple(value.items())) if type(value) is PluralForms else value
+        return self._values.setdefault(marker, value)
+
+
+class CompactTable(Mapping[str, Any]):
+    """
+    Read-only mapping of dotted keys to translations, stored as a tuple
+    indexed by the key IDs of a :class:`KeyStore`.
+
+    Nested groups are flattened, so only string leaves and plural forms can
+    be looked up, as with :class:`pycord18n.catalog.Catalog`.
+    """
+
+    __slots__ = ("store", "_values", "_count")
+
+    def __init__(self, translations: Dict[str, Any], store: KeyStore) -> None:
+        """
+        Flatten translations into a table.
+
+        Parameters
+        ----------
+        translations : Dict[str, Any]
+            The (possibly nested) translations
+        store : KeyStore
+            The store holding the keys and values
+
+        Raises
+        ------
+        TypeError
+            A translation is neither a string nor a nested group
+        """
+        self.store = store
+        found = {}
+        for key, value in _flatten_leaves(translations):
+            found[store.key_id(key)] = store.share(value)
+        self._set_values(found)
+
+    @classmethod
+    def from_ids(cls, values: Dict[int, Any], store: KeyStore) -> "CompactTable":
+        """
+        Make a table from values already keyed by their ID in ``store``,
+        for example by :func:`pycord18n.loader.load_language`
+
+        Parameters
+        ----------
+        values : Dict[int, Any]
+            Shared values by key ID
+        store : KeyStore
+            The store that gave the IDs
+
+        Returns
+        -------
+        CompactTable
+            The table
+        """
+        table = cls.__new__(cls)
+        table.store = store
+        table._set_values(values)
+        return table
+
+    def _set_values(self, found: Dict[int, Any]) -> None:
+        values = [_ABSENT] * len(self.store)
+        for key_id, value in found.items():
+            values[key_id] = value
+        self._values = tuple(values)
+        self._count = len(found)
+
+    def __getitem__(self, key: str) -> Union[str, PluralForms]:
+        key_id = self.store.ids[key]
+        values = self._values
+        # Keys added to the store after this table was built are absent
+        if key_id >= len(values) or values[key_id] is _ABSENT:
+            raise KeyError(key)
+        return values[key_id]
+
+    def __contains__(self, key: object) -> bool:
+        key_id = self.store.ids.get(key)
+        return key_id is not None and key_id < len(self._values) and self._values[key_id] is not _ABSENT
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        keys = self.store.keys
+        for key_id, value in enumerate(self._values):
+            if value is not _ABSENT:
+                yield keys[key_id]
+
+    def non_empty_keys(self) -> Iterator[str]:
+        """
+        Iterate over the keys with a non-empty translation
+        """
+        keys = self.store.keys
+        for key_id, value in enumerate(self._values):
+            if value is not _ABSENT and value != "":
+                yield keys[key_id]
+
+
+class CompactLanguage(Language):
+    """
+    A :class:`Language` stored in a :class:`CompactTable`, sharing its keys
+    and values with the other languages of the same :class:`KeyStore`.
+
+    Only string translations and plural forms are stored, so looking up any
+    other group of translations raises a KeyError.
+    """
+
+    __slots__ = ("_store", "_sources")
+
+    def __init__(
+        self,
+        name: str,
+        code: str,
+        translations: Dict[str, Any],
+        store: Optional[KeyStore] = None,
+        plural_rules: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Initialize the language by flattening its translations into a table.
+
+        Parameters
+        ----------
+        name : str
+            The name of the language
+        code : str
+            The locale code of the language
+        translations : Dict[str, Any]
+            The (possibly nested) translations
+        store : KeyStore, optional
+            The store to share with other languages, by default a new one
+        plural_rules : Dict[str, str], optional
+            CLDR plural rules by category, by default None (the built-in
+            rules for the locale code)
+        """
+        self._store = store if store is not None else KeyStore()
+        # Catalog files read by :func:`pycord18n.loader.load_language`, if any
+        self._sources: Tuple[Any, ...] = ()
+        if not isinstance(translations, CompactTable):
+            translations = CompactTable(translations, self._store)
+        super().__init__(name, code, translations, plural_rules=plural_rules)
+
+    @property
+    def translations(self) -> CompactTable:
+        """
+        The translations of this language, as a flat :class:`CompactTable`
+
+        Assigned translations are flattened into the same store, which
+        keeps the keys and values of the old ones (see :class:`KeyStore`).
+        """
+        return self._translations
+
+    @translations.setter
+    def translations(self, translations: Dict[str, Any]) -> None:
+        if not isinstance(translations, CompactTable):
+            translations = CompactTable(translations, self._store)
+        self._translations = translations
+        self.invalidate()
+
+    def _source_paths(self) -> Tuple[str, ...]:
+        return tuple(
+            os.fspath(source[1] if isinstance(source, tuple) else source)
+            for source in self._sources
+        )
+
+    def _reload(self) -> Optional["CompactLanguage"]:
+        if not self._sources:
+            return None
+        # The loader builds on this module
+        from .loader import load_language
+        return load_language(
+            self.name, self.code, *self._sources,
+            store=self._store, plural_rules=self._plural_rules)
+
+    def _build_index(self) -> Mapping[str, Any]:
+        # Already flat
+        self._index = self._translations
+        return self._index
+
+    def _served_keys(self) -> Iterator[str]:
+        return self._translations.non_empty_keys()
+
+
+def compact(languages: Iterable[Language], store: Optional[KeyStore] = None) -> List[CompactLanguage]:
+    """
+    Convert languages to :class:`CompactLanguage` sharing one
+    :class:`KeyStore`, for example before giving them to :class:`I18n`.
+
+        >>> i18n = I18n(compact([english, french]), fallback="en")
+
+    Languages that are already compact in the same store are kept as they
+    are.
+
+    Parameters
+    ----------
+    languages : Iterable[Language]
+        The languages
+    store : KeyStore, optional
+        The store to use, by default a new one
+
+    Returns
+    -------
+    List[CompactLanguage]
+        The compact languages, in order
+    """
+    if store is None:
+        store = KeyStore()
+
+    compacted = []
+    for language in languages:
+        if isinstance(language, CompactLanguage) and language._store is store:
+            compacted.append(language)
+            continue
+        converted = CompactLanguage(
+            language.name, language.code, language.translations, store,
+            plural_rules=language._plural_rules)
+        if isinstance(language, CompactLanguage):
+            converted._sources = language._sources
+        compacted.append(converted)
+    return compacted
@@ -16,17 +16,107 @@
 # along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import asyncio
 import contextvars
-from typing import Any, Callable, List, Optional, Union, Coroutine
+import functools
+import inspect
+import weakref
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union, Coroutine
 
+import discord
+from discord.commands.core import valid_locales as DISCORD_LOCALES
 from discord.ext import commands
 
+from .cache import MISSING, RenderCache
 from .i18n import I18n
 from .language import Language
 
+# The instance serving the current command, so that concurrent bots with
+# their own extension do not share the class-wide default
+_current_instance: contextvars.ContextVar = contextvars.ContextVar("_current_instance")
+# Tokens of the scopes entered in the current context, innermost last, so
+# that one scope can be entered by concurrent tasks
+_scope_tokens: contextvars.ContextVar = contextvars.ContextVar("_scope_tokens", default=())
+
+
+class LocaleScope:
+    """
+    Sets the current locale (and i18n instance) of an :class:`I18nExtension`
+    and restores the previous ones on exit.
+
+    Usable as a context manager, an async context manager, or a decorator
+    for regular and coroutine functions. Made by
+    :func:`I18nExtension.locale_scope`.
+
+    Tasks created inside the scope copy the context they are created in, so
+    they keep the scope's locale even after the scope has been left.
+    """
+
+    __slots__ = ("_i18n", "_locale")
+
+    def __init__(self, i18n: "I18nExtension", locale: Union[str, Callable[..., Any]]) -> None:
+        self._i18n = i18n
+        self._locale = locale
+
+    def _enter(self, locale: str) -> None:
+        tokens = (
+            self._i18n.set_current_locale(locale),
+            _current_instance.set(self._i18n),
+        )
+        _scope_tokens.set(_scope_tokens.get() + (tokens,))
+
+    def _exit(self) -> None:
+        stack = _scope_tokens.get()
+        locale_token, instance_token = stack[-1]
+        _scope_tokens.set(stack[:-1])
+        _current_instance.reset(instance_token)
+        self._i18n.reset_current_locale(locale_token)
+
+    def __enter__(self) -> "I18nExtension":
+        if callable(self._locale):
+            raise TypeError("A locale function can only be used when decorating")
+        self._enter(self._locale)
+        return self._i18n
+
+    def __exit__(self, *exc_info) -> None:
+        self._exit()
+
+    async def __aenter__(self) -> "I18nExtension":
+        return self.__enter__()
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._exit()
+
+    def __call__(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        locale = self._locale
+        i18n = self._i18n
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                code = locale(*args, **kwargs) if callable(locale) else locale
+                if inspect.isawaitable(code):
+                    code = await code
+                # A fresh scope per call, calls may interleave
+                scope = LocaleScope(i18n, code)
+                async with scope:
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            code = locale(*args, **kwargs) if callable(locale) else locale
+            with LocaleScope(i18n, code):
+                return func(*args, **kwargs)
+
+        return wrapper
+
 
 class I18nExtension(I18n):
     default_i18n_instance = None
+    # The extension initialized on each bot, see :func:`for_bot`
+    _bot_instances: "weakref.WeakKeyDictionary[commands.Bot, I18nExtension]" = weakref.WeakKeyDictionary()
 
     def __init__(
         self,
@@ -34,7 +124,11 @@ class I18nExtension(I18n):
         fallback: Union[str, int],
         bot: Optional[commands.Bot] = None,
         get_locale_func: Callable[..., Coroutine[Any, Any, Any]] = None,
-        default: bool = True
+        default: bool = True,
+        fallbacks: Optional[Dict[str, Iterable[str]]] = None,
+        derive_parents: bool = True,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None
     ) -> None:
         """
         Initialize the extension class.
@@ -62,30 +156,60 @@ class I18nExtension(I18n):
             it is always set.
 
             The default is used by :func:`I18nExtension.contextual_get_text`.
+        fallbacks : Dict[str, Iterable[str]], optional
+            Explicit fallback locales per locale, by default None
+
+            .. seealso: documentation for :func:`I18n.__init__`
+        derive_parents : bool, optional
+            Whether locales fall back to their BCP-47 parent, by default True
+        cache_size : int, optional
+            Maximum number of rendered strings to cache, by default 0 (no cache)
+        cache_ttl : float, optional
+            Seconds a rendered string stays cached, by default None
         """
-        super().__init__(languages, fallback)
+        super().__init__(languages, fallback, fallbacks=fallbacks,
+                         derive_parents=derive_parents, cache_size=cache_size,
+                         cache_ttl=cache_ttl)
         self._current_locale = contextvars.ContextVar("_current_locale")
         self._bot = None
+        self._get_locale_func = lambda *_: self._fallback
+        self._locale_cache: Optional[RenderCache] = None
+        self._locale_cache_key = default_locale_cache_key
+        # In-flight locale lookups, shared by concurrent invocations
+        self._pending_locales: Dict[Hashable, asyncio.Future] = {}
+        # (prefix, locales) -> (generation, localizations by key)
+        self._command_localizations: Dict[Tuple[str, Tuple[str, ...]], Tuple[int, Dict[str, Dict[str, str]]]] = {}
 
         if default or I18nExtension.default_i18n_instance is None:
             I18nExtension.default_i18n_instance = self
         
-        if self._bot and get_locale_func:
-            self.init_bot(self._bot, get_locale_func)
+        if bot and get_locale_func:
+            self.init_bot(bot, get_locale_func)
 
-    def init_bot(self, bot: commands.Bot, get_locale_func: Callable[..., Coroutine[Any, Any, Any]] = None):
+    def init_bot(
+        self,
+        bot: commands.Bot,
+        get_locale_func: Callable[..., Coroutine[Any, Any, Any]] = None,
+        locale_cache_size: int = 0,
+        locale_cache_ttl: Optional[float] = None,
+        locale_cache_key: Callable[[commands.Context], Hashable] = None
+    ):
         """
-        Initialize the given bot with the pre-invoke hooks to set the current
-        context. 
+        Initialize the given bot with the pre- and post-invoke hooks to set
+        the current context.
+
+        The locale and this instance are set for the duration of each
+        command and restored afterwards, so several bots, each with their
+        own extension, can run in one process.
 
         .. note ::
 
             Due to how discord.py works, this will override any previously
-            set global pre-invoke hook.
+            set global pre- and post-invoke hooks.
 
             I recommend creating an override to have multiple pre- and post-
             invoke hooks if required, or setting the current locale yourself
-            with :func:`set_current_locale`.
+            with :func:`locale_scope`.
 
         Parameters
         ----------
@@ -94,28 +218,344 @@ class I18nExtension(I18n):
         get_locale_func : Callable, coroutine, optional
             The function that provides the locale code for the context, by default None
 
-            It should take one argument, of type :cls:`discord.ext.commands.Context`
+            It should take one argument, of type :cls:`discord.ext.commands.Context`,
+            and may be a regular function or a coroutine function
+        locale_cache_size : int, optional
+            Maximum number of resolved locales to cache, by default 0 (no cache)
+
+            Concurrent invocations with the same cache key share a single
+            call to ``get_locale_func``. Use :func:`invalidate_locale` when
+            a user or guild changes its language.
+        locale_cache_ttl : float, optional
+            Seconds a resolved locale stays cached, by default None (until
+            evicted or invalidated)
+        locale_cache_key : Callable, optional
+            Function giving the cache key of a context, by default
+            :func:`default_locale_cache_key`, a ``(guild_id, user_id)`` tuple
         """
         self._bot = bot
         if get_locale_func is None:
             # Just use the fallback
             get_locale_func = lambda *_: self._fallback
+        self._get_locale_func = get_locale_func
+
+        self._locale_cache = None
+        if locale_cache_size:
+            self._locale_cache = RenderCache(locale_cache_size, ttl=locale_cache_ttl)
+        self._locale_cache_key = locale_cache_key or default_locale_cache_key
+        self._pending_locales = {}
+
+        I18nExtension._bot_instances[bot] = self
 
         async def pre(ctx):
-            self.set_current_locale(get_locale_func(ctx))
+            scope = LocaleScope(self, await self.resolve_locale(ctx))
+            scope.__enter__()
+            ctx._i18n_locale_scope = scope
+
+        async def post(ctx):
+            scope = getattr(ctx, "_i18n_locale_scope", None)
+            if scope is not None:
+                del ctx._i18n_locale_scope
+                scope.__exit__(None, None, None)
 
         self._bot.before_invoke(pre)
+        self._bot.after_invoke(post)
+
+    @classmethod
+    def for_bot(cls, bot: commands.Bot) -> Optional["I18nExtension"]:
+        """
+        Get the extension that was initialized on a bot
+
+        Parameters
+        ----------
+        bot : commands.Bot
+            The bot
+
+        Returns
+        -------
+        Optional[I18nExtension]
+            The extension, or None if :func:`init_bot` was not called for it
+        """
+        return cls._bot_instances.get(bot)
+
+    async def _call_locale_func(self, ctx: commands.Context) -> str:
+        locale = self._get_locale_func(ctx)
+        if inspect.isawaitable(locale):
+            locale = await locale
+        return locale
+
+    async def resolve_locale(self, ctx: commands.Context) -> str:
+        """
+        Get the locale for a context using the function given to
+        :func:`init_bot`, going through the locale cache if enabled
 
-    def set_current_locale(self, locale: str) -> str:
+        Parameters
+        ----------
+        ctx : commands.Context
+            The invocation context
+
+        Returns
+        -------
+        str
+            The locale
+        """
+        cache = self._locale_cache
+        if cache is None:
+            return await self._call_locale_func(ctx)
+
+        key = self._locale_cache_key(ctx)
+        locale = cache.get(key)
+        if locale is not MISSING:
+            return locale
+
+        pending = self._pending_locales.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._call_locale_func(ctx))
+            self._pending_locales[key] = pending
+
+            def done(future, key=key):
+                # Only cache if not invalidated while the lookup was running
+                if self._pending_locales.get(key) is future:
+                    del self._pending_locales[key]
+                    if not future.cancelled() and future.exception() is None:
+                        cache.set(key, future.result())
+
+            pending.add_done_callback(done)
+
+        # Shielded so one cancelled invocation does not cancel the others
+        return await asyncio.shield(pending)
+
+    def invalidate_locale(
+        self,
+        key: Hashable = None,
+        *,
+        user_id: Optional[int] = None,
+        guild_id: Optional[int] = None
+    ) -> int:
+        """
+        Forget cached locales, for example after a user changes language.
+        Without arguments, every cached locale is forgotten.
+
+        ``user_id`` and ``guild_id`` match keys made by
+        :func:`default_locale_cache_key`.
+
+        Parameters
+        ----------
+        key : Hashable, optional
+            The exact cache key to forget
+        user_id : int, optional
+            Forget every locale cached for this user
+        guild_id : int, optional
+            Forget every locale cached for this guild
+
+        Returns
+        -------
+        int
+            The number of forgotten entries
+        """
+        if key is None and user_id is None and guild_id is None:
+            predicate = lambda _: True
+        elif key is not None:
+            predicate = lambda cached: cached == key
+        else:
+            def predicate(cached):
+                if not isinstance(cached, tuple) or len(cached) != 2:
+                    return False
+                return (
+                    (guild_id is None or cached[0] == guild_id)
+                    and (user_id is None or cached[1] == user_id)
+                )
+
+        for cached in [cached for cached in self._pending_locales if predicate(cached)]:
+            del self._pending_locales[cached]
+
+        if self._locale_cache is None:
+            return 0
+        return self._locale_cache.evict(predicate)
+
+    def command_localizations(
+        self,
+        prefix: str = "commands",
+        locales: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Get every translation under ``prefix`` in every locale, in one pass
+        over the resolution table of each locale
+
+        Translations that a locale only gets from the global fallback are
+        left out, since Discord already shows the command's own name and
+        description then. The result is memoized until the languages change.
+
+            >>> i18n.command_localizations()["commands.ping.description"]
+            {"en-US": "Ping the bot", "fr": "Tester le bot"}
+
+        Parameters
+        ----------
+        prefix : str, optional
+            The key holding the command translations, by default "commands"
+        locales : Iterable[str], optional
+            The locales to collect, by default every locale of this instance
+            that Discord supports
+
+        Returns
+        -------
+        Dict[str, Dict[str, str]]
+            Translations by locale, for each key under ``prefix``. Do not
+            modify it, it is shared with later calls.
+
+        Raises
+        ------
+        InvalidLocaleError
+            If one of the given locales does not exist on this instance
+        """
+        if locales is None:
+            locales = [locale for locale in self._chains if locale in DISCORD_LOCALES]
+        locales = tuple(locales)
+        memo_key = (prefix, locales)
+
+        generation = self._generation
+        memo = self._command_localizations.get(memo_key)
+        if memo is not None and memo[0] == generation:
+            return memo[1]
+
+        start = prefix + "."
+        localizations: Dict[str, Dict[str, str]] = {}
+        for locale in locales:
+            table = self._get_table(locale)
+            for key, language in table.items():
+                if not key.startswith(start):
+                    continue
+                if language.code == self._fallback and locale != self._fallback:
+                    continue
+                # Groups and plural forms are not names nor descriptions
+                if not isinstance(language._get_translation_from_key(key), str):
+                    continue
+                localizations.setdefault(key, {})[locale] = language.get_text(key)
+
+        self._command_localizations[memo_key] = (generation, localizations)
+        return localizations
+
+    def localize_commands(
+        self,
+        application_commands: Optional[Iterable[discord.ApplicationCommand]] = None,
+        prefix: str = "commands",
+        locales: Optional[Iterable[str]] = None
+    ) -> int:
+        """
+        Fill in the ``name_localizations`` and ``description_localizations``
+        of application commands, their options and their choices. Run it
+        before the commands are synced.
+
+        A command's qualified name gives its keys, with spaces replaced by
+        dots. For ``/music play`` with a ``song`` option and the default
+        prefix, they are:
+
+        - ``commands.music.play.name``
+        - ``commands.music.play.description``
+        - ``commands.music.play.options.song.name``
+        - ``commands.music.play.options.song.description``
+        - ``commands.music.play.options.song.choices.<choice name>``
+
+        Parameters
+        ----------
+        application_commands : Iterable[discord.ApplicationCommand], optional
+            The commands to localize, by default every command added to the
+            bot given to :func:`init_bot`, including subcommands
+        prefix : str, optional
+            The key holding the command translations, by default "commands"
+        locales : Iterable[str], optional
+            The locales to localize in, by default every locale of this
+            instance that Discord supports
+
+        Returns
+        -------
+        int
+            The number of localization dicts that were set
+
+        Raises
+        ------
+        ValueError
+            If no commands are given and no bot was initialized
+        """
+        if application_commands is None:
+            if self._bot is None:
+                raise ValueError("No commands given and no bot has been initialized!")
+            application_commands = _walk_commands(self._bot.pending_application_commands)
+
+        localizations = self.command_localizations(prefix, locales)
+        if not localizations:
+            return 0
+
+        count = 0
+        for command in application_commands:
+            base = ".".join((prefix, *command.qualified_name.split()))
+            count += _localize(command, base, localizations)
+
+            for option in getattr(command, "options", None) or ():
+                option_base = f"{base}.options.{option.name}"
+                count += _localize(option, option_base, localizations)
+                for choice in option.choices or ():
+                    choice_key = f"{option_base}.choices.{choice.name}"
+                    count += _localize(choice, choice_key, localizations, name_key=choice_key)
+
+        return count
+
+    def set_current_locale(self, locale: str) -> contextvars.Token:
         """
         Set the current locale (for this context)
 
+        Prefer :func:`locale_scope`, which restores the previous locale.
+
         Parameters
         ----------
         locale : str
             The locale
+
+        Returns
+        -------
+        contextvars.Token
+            Token to give to :func:`reset_current_locale`
+        """
+        return self._current_locale.set(locale)
+
+    def reset_current_locale(self, token: contextvars.Token) -> None:
+        """
+        Restore the locale that was current before :func:`set_current_locale`
+
+        Parameters
+        ----------
+        token : contextvars.Token
+            The token returned by :func:`set_current_locale`
+        """
+        self._current_locale.reset(token)
+
+    def locale_scope(self, locale: Union[str, Callable[..., Any]]) -> LocaleScope:
         """
-        self._current_locale.set(locale)
+        Set the current locale, and make this the current instance for
+        :func:`contextual_get_text`, until the scope is left
+
+        .. code-block:: python
+
+            async with i18n.locale_scope("fr"):
+                await channel.send(_("hello"))
+
+            @i18n.locale_scope(lambda ctx, *_: get_locale(ctx))
+            async def announce(ctx):
+                ...
+
+        Parameters
+        ----------
+        locale : Union[str, Callable]
+            The locale, or when decorating, a function taking the decorated
+            function's arguments and returning the locale (or an awaitable
+            of it, for coroutine functions)
+
+        Returns
+        -------
+        LocaleScope
+            A context manager, async context manager and decorator
+        """
+        return LocaleScope(self, locale)
 
     def get_current_locale(self) -> str:
         """
@@ -140,6 +580,10 @@ class I18nExtension(I18n):
         """
         Wraps :func:`get_text` to use the current context's locale
 
+        The current context's instance is used, as set by the hooks of
+        :func:`init_bot` or by :func:`locale_scope`, otherwise the default
+        instance.
+
         .. seealso: documentation for :func:`Language.get_text`
 
         Parameters
@@ -163,7 +607,7 @@ class I18nExtension(I18n):
         NameError
             If there is no current i18n instance set
         """
-        i18n = cls.default_i18n_instance
+        i18n = _current_instance.get(None) or cls.default_i18n_instance
         if i18n is None:
             raise NameError("No default i18n instance has been initialized!")
 
@@ -172,5 +616,96 @@ class I18nExtension(I18n):
             use_translations=use_translations, should_fallback=should_fallback,
             **kwargs)
 
+    @classmethod
+    def contextual_get_text_many(
+        cls,
+        keys_or_specs: Iterable[Union[str, Tuple[str, Dict[str, Any]]]],
+        list_formatter: bool = None,
+        use_translations: bool = True,
+        should_fallback: bool = True,
+        **kwargs
+    ) -> List[str]:
+        """
+        Wraps :func:`get_text_many` to use the current context's locale
+
+        .. seealso: documentation for :func:`I18n.get_text_many`
+
+        Parameters
+        ----------
+        keys_or_specs : Iterable[Union[str, Tuple[str, Dict[str, Any]]]]
+            Keys, or ``(key, kwargs)`` tuples
+        list_formatter : bool, optional
+            Function to format lists, by default None
+        use_translations : bool, optional
+            Whether to use translations in formatting, by default True
+        should_fallback : bool, optional
+            Should fallback to default locale, by default True
+
+        Returns
+        -------
+        List[str]
+            Translated and formatted strings, in order
+
+        Raises
+        ------
+        NameError
+            If there is no current i18n instance set
+        """
+        i18n = _current_instance.get(None) or cls.default_i18n_instance
+        if i18n is None:
+            raise NameError("No default i18n instance has been initialized!")
+
+        return i18n.get_text_many(
+            keys_or_specs, i18n.get_current_locale(), list_formatter=list_formatter,
+            use_translations=use_translations, should_fallback=should_fallback,
+            **kwargs)
+
+
+def _walk_commands(
+    application_commands: Iterable[discord.ApplicationCommand]
+) -> Iterable[discord.ApplicationCommand]:
+    """
+    Yield the given application commands and every subcommand of groups
+    """
+    for command in application_commands:
+        yield command
+        if isinstance(command, discord.SlashCommandGroup):
+            yield from command.walk_commands()
+
+
+def _localize(
+    obj: Any,
+    base: str,
+    localizations: Dict[str, Dict[str, str]],
+    name_key: Optional[str] = None
+) -> int:
+    """
+    Set the localizations of a command, option or choice, keeping those
+    already set for other locales. Returns the number of dicts set.
+    """
+    count = 0
+    for attribute, key in (
+        ("name_localizations", name_key or f"{base}.name"),
+        ("description_localizations", f"{base}.description"),
+    ):
+        found = localizations.get(key)
+        if not found or not hasattr(obj, attribute):
+            continue
+        current = getattr(obj, attribute)
+        if current is discord.utils.MISSING or current is None:
+            current = {}
+        setattr(obj, attribute, {**current, **found})
+        count += 1
+    return count
+
+
+def default_locale_cache_key(ctx: commands.Context) -> Hashable:
+    """
+    Default locale cache key, the ``(guild_id, user_id)`` of the context.
+    The guild ID is None in direct messages.
+    """
+    guild = ctx.guild
+    return (guild.id if guild is not None else None, ctx.author.id)
+
 
 _ = I18nExtension.contextual_get_text
@@ -0,0 +1,239 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Mapping, Tuple, Union
+
+# Format specs that are rendered by the formatters of the language instead
+# of `format`, as in "{count:number}"
+NAMED_FORMATS = frozenset({"number", "date", "time", "datetime", "duration", "relative"})
+
+# Decimal and group separators by language, used when the catalog does not
+# set its own
+SEPARATORS: Dict[str, Tuple[str, str]] = {
+    "en": (".", ","), "ja": (".", ","), "ko": (".", ","), "zh": (".", ","),
+    "hi": (".", ","), "th": (".", ","), "he": (".", ","),
+    "de": (",", "."), "nl": (",", "."), "it": (",", "."), "es": (",", "."),
+    "pt": (",", "."), "tr": (",", "."), "id": (",", "."), "da": (",", "."),
+    "el": (",", "."), "hr": (",", "."), "ro": (",", "."), "vi": (",", "."),
+    "fr": (",", "\u202f"), "ru": (",", "\xa0"), "uk": (",", "\xa0"),
+    "pl": (",", "\xa0"), "cs": (",", "\xa0"), "sv": (",", "\xa0"),
+    "fi": (",", "\xa0"), "no": (",", "\xa0"), "nb": (",", "\xa0"),
+    "bg": (",", "\xa0"), "hu": (",", "\xa0"), "lt": (",", "\xa0"),
+}
+
+DEFAULT_SETTINGS: Dict[str, Any] = {
+    "date": "%Y-%m-%d",
+    "time": "%H:%M",
+    "datetime": "%Y-%m-%d %H:%M",
+    "duration_separator": " ",
+    "now": "now",
+    "future": "in {0}",
+    "past": "{0} ago",
+    "units": {
+        "day": {"one": "{count} day", "other": "{count} days"},
+        "hour": {"one": "{count} hour", "other": "{count} hours"},
+        "minute": {"one": "{count} minute", "other": "{count} minutes"},
+        "second": {"one": "{count} second", "other": "{count} seconds"},
+    },
+}
+
+UNITS = (("day", 86400), ("hour", 3600), ("minute", 60), ("second", 1))
+
+Seconds = Union[int, float, Decimal, datetime.timedelta]
+
+
+def _seconds(value: Seconds) -> float:
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
+class NumberFormatter:
+    """
+    Formats numbers with the decimal and group separators of a locale
+
+        >>> NumberFormatter(",", ".")(1234567.5)
+        "1.234.567,5"
+    """
+
+    __slots__ = ("decimal", "group", "_table")
+
+    def __init__(self, decimal: str = ".", group: str = ",") -> None:
+        self.decimal = decimal
+        self.group = group
+        self._table = str.maketrans({",": group, ".": decimal})
+
+    def __call__(self, value: Any) -> str:
+        if isinstance(value, str):
+            # Left as is, for example missing placeholders
+            return value
+        return format(value, ",").translate(self._table)
+
+
+class DateFormatter:
+    """
+    Formats dates and times with a :func:`time.strftime` pattern
+    """
+
+    __slots__ = ("pattern",)
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+
+    def __call__(self, value: Any) -> str:
+        if isinstance(value, (int, float)):
+            value = datetime.datetime.fromtimestamp(value, datetime.timezone.utc)
+        elif not isinstance(value, (datetime.date, datetime.time)):
+            return str(value)
+        return value.strftime(self.pattern)
+
+
+class DurationFormatter:
+    """
+    Formats a number of seconds, or a :class:`datetime.timedelta`, as the
+    units it spans, such as "2 hours 5 minutes"
+    """
+
+    __slots__ = ("units", "separator", "plural")
+
+    def __init__(
+        self,
+        units: Mapping[str, Any],
+        plural: Callable[[Any, Any], str],
+        separator: str = " "
+    ) -> None:
+        """
+        Initialize the formatter.
+
+        Parameters
+        ----------
+        units : Mapping[str, Any]
+            Unit words by unit (``day``, ``hour``, ``minute``, ``second``),
+            each a string or plural forms with a ``{count}`` placeholder
+        plural : Callable[[Any, Any], str]
+            Chooses the form of a unit for a count
+        separator : str, optional
+            Text between units, by default " "
+        """
+        self.units = units
+        self.plural = plural
+        self.separator = separator
+
+    def unit(self, unit: str, count: int) -> str:
+        """Format a count of one unit"""
+        return self.plural(self.units[unit], count).replace("{count}", str(count))
+
+    def parts(self, seconds: float, largest_only: bool = False) -> list:
+        seconds = int(abs(seconds))
+        parts = []
+        for unit, size in UNITS:
+            count, seconds = divmod(seconds, size)
+            if count:
+                parts.append(self.unit(unit, count))
+                if largest_only:
+                    break
+        return parts or [self.unit("second", 0)]
+
+    def __call__(self, value: Any) -> str:
+        if isinstance(value, str):
+            return value
+        return self.separator.join(self.parts(_seconds(value)))
+
+
+class RelativeFormatter:
+    """
+    Formats a moment relative to now, such as "in 3 hours" or "5 minutes
+    ago", using its largest unit. Takes an aware or naive (UTC)
+    :class:`datetime.datetime`, or an offset from now in seconds or as a
+    :class:`datetime.timedelta`.
+    """
+
+    __slots__ = ("duration", "now", "future", "past")
+
+    def __init__(self, duration: DurationFormatter, now: str, future: str, past: str) -> None:
+        self.duration = duration
+        self.now = now
+        self.future = future
+        self.past = past
+
+    def __call__(self, value: Any) -> str:
+        if isinstance(value, str):
+            return value
+        if isinstance(value, datetime.datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=datetime.timezone.utc)
+            offset = (value - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+        else:
+            offset = _seconds(value)
+
+        if abs(offset) < 1:
+            return self.now
+        text = self.duration.parts(offset, largest_only=True)[0]
+        return (self.future if offset > 0 else self.past).replace("{0}", text)
+
+
+def build_formatters(
+    code: str,
+    setting: Callable[[str], Any],
+    plural: Callable[[Any, Any], str]
+) -> Dict[str, Callable[[Any], str]]:
+    """
+    Build the named formatters of a locale
+
+    Parameters
+    ----------
+    code : str
+        The locale code, used for the default separators
+    setting : Callable[[str], Any]
+        Returns the catalog value of a setting such as ``decimal`` or
+        ``units.hour``, or None if the catalog does not set it
+    plural : Callable[[Any, Any], str]
+        Chooses between plural forms for a count
+
+    Returns
+    -------
+    Dict[str, Callable[[Any], str]]
+        Formatters by name, see :data:`NAMED_FORMATS`
+    """
+    language = code.replace("_", "-").split("-")[0]
+    default_decimal, default_group = SEPARATORS.get(language, SEPARATORS["en"])
+
+    def get(name: str, default: Any) -> Any:
+        value = setting(name)
+        return default if value is None or value == "" else value
+
+    units = {
+        unit: get(f"units.{unit}", DEFAULT_SETTINGS["units"][unit])
+        for unit, _ in UNITS
+    }
+    duration = DurationFormatter(units, plural, get("duration_separator", DEFAULT_SETTINGS["duration_separator"]))
+
+    return {
+        "number": NumberFormatter(get("decimal", default_decimal), get("group", default_group)),
+        "date": DateFormatter(get("date", DEFAULT_SETTINGS["date"])),
+        "time": DateFormatter(get("time", DEFAULT_SETTINGS["time"])),
+        "datetime": DateFormatter(get("datetime", DEFAULT_SETTINGS["datetime"])),
+        "duration": duration,
+        "relative": RelativeFormatter(
+            duration,
+            get("now", DEFAULT_SETTINGS["now"]),
+            get("future", DEFAULT_SETTINGS["future"]),
+            get("past", DEFAULT_SETTINGS["past"]),
+        ),
+    }
@@ -15,9 +15,25 @@
 # You should have received a copy of the GNU General Public License
 # along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import List, Union
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-from .language import Language
+from .cache import MISSING, CacheInfo, RenderCache, make_key
+from .catalog import Catalog
+from .keys import TranslationKey
+from .language import Language, LazyLanguage, SafeDict
+from .metrics import DEFAULT_BUCKETS, FALLBACK, HIT, MISSING as MISSING_KEY, Metrics
+
+_log = logging.getLogger(__name__)
+
+# Separates the locale and key of the snapshot entries recording the
+# locale serving a key, when it is not the locale itself
+SERVED_SEPARATOR = "\0"
 
 
 class Py18nError(KeyError):
@@ -29,15 +45,86 @@ class InvalidLocaleError(Py18nError):
         super().__init__(*args)
         self.locale = locale
 
+    def __reduce__(self):
+        # Pickled with the keyword only argument, for worker processes
+        return (functools.partial(type(self), locale=self.locale), self.args)
+
 
 class InvalidTranslationKeyError(Py18nError):
     def __init__(self, *args, key: str) -> None:
         super().__init__(*args)
         self.key = key
 
+    def __reduce__(self):
+        return (functools.partial(type(self), key=self.key), self.args)
+
+
+def parent_locale(locale: str) -> Optional[str]:
+    """
+    Derive the BCP-47 parent of a locale by dropping its last subtag
+
+        >>> parent_locale("zh-Hant-TW")
+        "zh-Hant"
+        >>> parent_locale("pt_BR")
+        "pt"
+        >>> parent_locale("en") is None
+        True
+
+    Parameters
+    ----------
+    locale : str
+        The locale code
+
+    Returns
+    -------
+    Optional[str]
+        The parent locale, or None if the locale has no subtags
+    """
+    cut = max(locale.rfind("-"), locale.rfind("_"))
+    if cut <= 0:
+        return None
+    return locale[:cut]
+
 
 class I18n:
-    def __init__(self, languages: List[Language], fallback: Union[str, int]) -> None:
+    def __init__(
+        self,
+        languages: List[Language],
+        fallback: Union[str, int],
+        fallbacks: Optional[Dict[str, Iterable[str]]] = None,
+        derive_parents: bool = True,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None
+    ) -> None:
+        """
+        Initialize the i18n instance.
+
+        Parameters
+        ----------
+        languages : List[Language]
+            List of lanugages to use
+        fallback : Union[str, int]
+            String ID or list index of the fallback locale, used last by
+            every fallback chain
+        fallbacks : Dict[str, Iterable[str]], optional
+            Explicit fallback locales per locale, by default None
+
+            For example ``{"es-ES": ["es-419", "es"]}``. Each listed locale
+            is then followed by its own fallbacks. Locales given here are
+            valid for lookups even without a language of their own.
+        derive_parents : bool, optional
+            Whether locales without explicit fallbacks fall back to their
+            BCP-47 parent (``pt-BR`` -> ``pt``), by default True
+        cache_size : int, optional
+            Maximum number of rendered strings to keep in an LRU cache, by
+            default 0 (no cache)
+
+            Calls are only cached when all keyword arguments are strings,
+            numbers, booleans or None. Other calls bypass the cache.
+        cache_ttl : float, optional
+            Seconds a rendered string stays cached, by default None (until
+            evicted or the languages change)
+        """
         self._languages = {
             language.code: language
             for language in languages
@@ -51,12 +138,536 @@ class I18n:
                 raise KeyError(
                     f"No language found with code {fallback} as fallback")
         elif isinstance(fallback, int):
-            self._fallback = self._languages[languages[fallback].code]
+            self._fallback = languages[fallback].code
 
         if self._fallback is None:
             raise KeyError(
                 f"No fallback language set. Check documentation for correct usage")
 
+        self._fallbacks: Dict[str, Tuple[str, ...]] = {
+            locale: tuple(chain)
+            for locale, chain in (fallbacks or {}).items()
+        }
+        self._derive_parents = derive_parents
+
+        # Ordered locale codes to try for each locale, ending with the
+        # fallback locale
+        self._chains: Dict[str, Tuple[str, ...]] = {}
+        # Maps each locale to a `{key: Language}` dict telling which language
+        # of its chain serves the key, so that falling back needs no
+        # exception handling
+        self._resolution: Dict[str, Dict[str, Language]] = {}
+        self._language_keys: Dict[str, Dict[str, Language]] = {}
+        # Guards every change of languages and table building, lookups
+        # hitting an existing table never take it
+        self._lock = threading.RLock()
+        # Bumped whenever derived state is dropped, so that a render started
+        # before a change is not cached after it
+        self._generation = 0
+        self._watcher: Optional[asyncio.Task] = None
+        self._metrics: Optional[Metrics] = None
+        self._cache: Optional[RenderCache] = None
+        # Prerendered strings served for calls without parameters
+        self._snapshot: Optional[Catalog] = None
+        if cache_size:
+            self._cache = RenderCache(cache_size, ttl=cache_ttl)
+        # Translations partitioned by feature, see `add_namespace`
+        self._namespaces: Dict[str, Namespace] = {}
+
+        for language in self._languages.values():
+            language._add_listener(self._on_language_changed)
+        self._build_resolution()
+
+    def _on_language_changed(self, language: Language) -> None:
+        """
+        Called by a language of this instance when its translations change
+        """
+        with self._lock:
+            if self._languages.get(language.code) is language:
+                self._build_resolution()
+
+    def _resolve_chain(self, locale: str) -> Tuple[str, ...]:
+        """
+        Resolve the fallback chain of a locale, only keeping locales that
+        have a language
+
+        Parameters
+        ----------
+        locale : str
+            The locale code
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The locales to try in order, always ending with the fallback
+        """
+        chain = []
+        seen = set()
+        pending = [locale]
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+
+            if current in self._languages:
+                chain.append(current)
+
+            if current in self._fallbacks:
+                parents = self._fallbacks[current]
+            elif self._derive_parents:
+                parent = parent_locale(current)
+                parents = (parent,) if parent else ()
+            else:
+                parents = ()
+            # Depth first, in the given order
+            pending.extend(reversed(parents))
+
+        if self._fallback not in chain:
+            chain.append(self._fallback)
+        else:
+            # The fallback is always the last resort
+            chain.remove(self._fallback)
+            chain.append(self._fallback)
+
+        return tuple(chain)
+
+    def _build_resolution(self) -> None:
+        """
+        Rebuild the fallback chain of every locale and drop the resolution
+        tables, which are built again on first use. Must be called whenever
+        the languages of this instance change, while holding the lock.
+        """
+        self._generation += 1
+        self._chains = {
+            locale: self._resolve_chain(locale)
+            for locale in {*self._languages, *self._fallbacks}
+        }
+        # Tables are built per locale on first use, so that languages
+        # which are loaded lazily are only loaded when needed
+        self._resolution = {}
+        self._language_keys = {}
+        if self._cache is not None:
+            self._cache.clear()
+        # Rendered from the previous languages
+        self._snapshot = None
+        for namespace in self._namespaces.values():
+            with namespace._lock:
+                namespace._build_resolution()
+
+    def _build_table(self, locale: str) -> Dict[str, Language]:
+        """
+        Build the resolution table of a locale from its fallback chain
+
+        Parameters
+        ----------
+        locale : str
+            The locale code
+
+        Returns
+        -------
+        Dict[str, Language]
+            The language serving each key
+
+        Raises
+        ------
+        InvalidLocaleError
+            If the locale does not exist on this instance
+        """
+        with self._lock:
+            # The languages may have changed while waiting for the lock
+            table = self._resolution.get(locale)
+            if table is not None:
+                return table
+            if locale not in self._chains:
+                raise InvalidLocaleError(
+                    f"Given locale `{locale}` does not exist!", locale=locale)
+
+            chain = self._chains[locale]
+            language_keys = self._language_keys
+            for code in chain:
+                if code not in language_keys:
+                    language = self._languages[code]
+                    language_keys[code] = dict.fromkeys(language._served_keys(), language)
+
+            if len(chain) == 1:
+                table = language_keys[chain[0]]
+            else:
+                table = {}
+                for code in reversed(chain):
+                    table.update(language_keys[code])
+
+            self._resolution[locale] = table
+            return table
+
+    def unload_unused(self, max_idle: float) -> List[str]:
+        """
+        Unload every :class:`LazyLanguage` that has not been used for
+        ``max_idle`` seconds. They are loaded again on next use.
+
+        This could be called periodically, for example from a task loop.
+
+        Parameters
+        ----------
+        max_idle : float
+            Seconds since the last lookup after which a language is unloaded
+
+        Returns
+        -------
+        List[str]
+            The codes of the unloaded languages
+        """
+        now = time.monotonic()
+        unloaded = []
+        for code, language in self._languages.items():
+            if not isinstance(language, LazyLanguage) or not language.is_loaded:
+                continue
+            if language.last_used is not None and now - language.last_used < max_idle:
+                continue
+
+            unloaded.append(code)
+
+        if unloaded:
+            with self._lock:
+                for code in unloaded:
+                    self._languages[code].unload()
+                # Drop the tables referring to the unloaded keys
+                for code in unloaded:
+                    self._language_keys.pop(code, None)
+                for locale, chain in self._chains.items():
+                    if any(code in chain for code in unloaded):
+                        self._resolution.pop(locale, None)
+
+        return unloaded
+
+    @property
+    def metrics(self) -> Optional[Metrics]:
+        """The metrics enabled with :func:`enable_metrics`, if any"""
+        return self._metrics
+
+    def enable_metrics(
+        self,
+        sample_rate: float = 1.0,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        callback: Optional[Callable[[str, str, str, float], Any]] = None
+    ) -> Metrics:
+        """
+        Start recording lookup counts, fallbacks, missing keys and latency
+        of :func:`get_text`.
+
+        While disabled, :func:`get_text` is not instrumented at all.
+
+        .. seealso: documentation for :class:`Metrics`
+
+        Parameters
+        ----------
+        sample_rate : float, optional
+            Fraction of lookups recorded, by default 1.0
+        buckets : Sequence[float], optional
+            Latency histogram bucket upper bounds in seconds
+        callback : Callable[[str, str, str, float], Any], optional
+            Called with the locale, key, outcome and latency of every
+            recorded lookup
+
+        Returns
+        -------
+        Metrics
+            The metrics, also available as :attr:`metrics`
+        """
+        self._metrics = Metrics(sample_rate, buckets, callback)
+        # Shadow the method on this instance only, so that the uninstrumented
+        # path does not even check whether metrics are enabled
+        self.get_text = self._instrumented_get_text
+        return self._metrics
+
+    def disable_metrics(self) -> None:
+        """
+        Stop recording metrics and remove the instrumentation
+        """
+        self._metrics = None
+        self.__dict__.pop("get_text", None)
+
+    def _instrumented_get_text(
+        self,
+        key: str,
+        locale: str,
+        list_formatter: bool = None,
+        use_translations: bool = True,
+        should_fallback: bool = True,
+        **kwargs
+    ) -> str:
+        metrics = self._metrics
+        if metrics is None or not metrics.should_sample():
+            return self._lookup(
+                key, locale, list_formatter, use_translations, should_fallback, kwargs, None)
+
+        # Filled with the code of the serving language by the lookup
+        served = [locale]
+        start = time.perf_counter()
+        try:
+            result = self._lookup(
+                key, locale, list_formatter, use_translations, should_fallback, kwargs, served)
+        except InvalidTranslationKeyError:
+            metrics.record(locale, key, MISSING_KEY, time.perf_counter() - start)
+            raise
+        seconds = time.perf_counter() - start
+
+        outcome = FALLBACK if served[0] != locale else HIT
+        metrics.record(locale, key, outcome, seconds)
+        return result
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """
+        Get the statistics of the rendered string cache
+
+        Returns
+        -------
+        Optional[CacheInfo]
+            Hits, misses, maximum size and current size, or None if caching
+            is disabled
+        """
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    def clear_cache(self) -> None:
+        """
+        Empty the rendered string cache, if enabled
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
+    def get_fallback_chain(self, locale: str) -> Tuple[str, ...]:
+        """
+        Get the locales tried, in order, when looking up text for a locale
+
+        Parameters
+        ----------
+        locale : str
+            The locale code
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The locale codes, starting with the locale itself if it has a
+            language and ending with the fallback locale
+
+        Raises
+        ------
+        InvalidLocaleError
+            If the locale does not exist on this instance
+        """
+        if locale not in self._chains:
+            raise InvalidLocaleError(
+                f"Given locale `{locale}` does not exist!", locale=locale)
+        return self._chains[locale]
+
+    def add_language(self, language: Language) -> None:
+        """
+        Add a language to this instance, or replace the language with the
+        same code
+
+        Parameters
+        ----------
+        language : Language
+            The language to add
+        """
+        self._replace_languages({language.code: language})
+
+    def _replace_languages(self, replacements: Dict[str, Language]) -> None:
+        """
+        Swap in new languages by code. The languages map, fallback chains,
+        resolution tables and rendered string cache all change together.
+        """
+        with self._lock:
+            languages = dict(self._languages)
+            for code, language in replacements.items():
+                previous = languages.get(code)
+                if previous is not None:
+                    previous._remove_listener(self._on_language_changed)
+                language._add_listener(self._on_language_changed)
+                languages[code] = language
+
+            self._languages = languages
+            self._build_resolution()
+
+    def remove_language(self, code: str) -> Language:
+        """
+        Remove a language from this instance
+
+        Parameters
+        ----------
+        code : str
+            The code of the language to remove
+
+        Returns
+        -------
+        Language
+            The removed language
+
+        Raises
+        ------
+        InvalidLocaleError
+            If the locale does not exist on this instance
+        ValueError
+            If trying to remove the fallback language
+        """
+        with self._lock:
+            if code not in self._languages:
+                raise InvalidLocaleError(
+                    f"Given locale `{code}` does not exist!", locale=code)
+            if code == self._fallback:
+                raise ValueError("The fallback language cannot be removed")
+
+            languages = dict(self._languages)
+            language = languages.pop(code)
+            language._remove_listener(self._on_language_changed)
+            self._languages = languages
+            self._build_resolution()
+            return language
+
+    def _load_reloaded(self, codes: Optional[Iterable[str]]) -> Dict[str, Language]:
+        """
+        Build fresh copies of the reloadable languages. Only reads the
+        current state, so it can run in a worker thread.
+        """
+        languages = self._languages
+        if codes is None:
+            codes = list(languages)
+
+        reloaded = {}
+        for code in codes:
+            if code not in languages:
+                raise InvalidLocaleError(
+                    f"Given locale `{code}` does not exist!", locale=code)
+            language = languages[code]._reload()
+            if language is not None:
+                reloaded[code] = language
+        return reloaded
+
+    def reload(self, codes: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Reload languages from their source files, such as
+        :class:`LazyLanguage` and :class:`CatalogLanguage`. Languages built
+        from a dict are left untouched.
+
+        The new languages are fully loaded before being swapped in all at
+        once, together with the caches derived from the old ones. Lookups
+        already running finish with the old languages.
+
+        .. seealso: :func:`reload_async` to avoid blocking the event loop
+
+        Parameters
+        ----------
+        codes : Iterable[str], optional
+            The locales to reload, by default every language
+
+        Returns
+        -------
+        List[str]
+            The codes of the reloaded languages
+
+        Raises
+        ------
+        InvalidLocaleError
+            If one of the locales does not exist on this instance
+        """
+        reloaded = self._load_reloaded(codes)
+        if reloaded:
+            self._replace_languages(reloaded)
+        return list(reloaded)
+
+    async def reload_async(self, codes: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Like :func:`reload`, but files are read and parsed in a worker thread
+        and the languages are swapped in on the event loop
+
+        Parameters
+        ----------
+        codes : Iterable[str], optional
+            The locales to reload, by default every language
+
+        Returns
+        -------
+        List[str]
+            The codes of the reloaded languages
+        """
+        loop = asyncio.get_running_loop()
+        reloaded = await loop.run_in_executor(None, self._load_reloaded, codes)
+        if reloaded:
+            self._replace_languages(reloaded)
+        return list(reloaded)
+
+    def _source_mtimes(self) -> Dict[str, Optional[Tuple[int, ...]]]:
+        mtimes = {}
+        for code, language in self._languages.items():
+            paths = language._source_paths()
+            if not paths:
+                continue
+            try:
+                mtimes[code] = tuple(os.stat(path).st_mtime_ns for path in paths)
+            except OSError:
+                mtimes[code] = None
+        return mtimes
+
+    def watch(self, interval: float = 5.0) -> asyncio.Task:
+        """
+        Poll the source files of the languages for changes and reload the
+        changed ones with :func:`reload_async`. Must be called from a
+        running event loop.
+
+        Languages that fail to reload, for example from a malformed or half
+        written file, are logged and kept as they were, and tried again on
+        the next check.
+
+        Only languages read from files are watched: :class:`LazyLanguage`
+        with a path, :class:`pycord18n.catalog.CatalogLanguage`, and
+        languages made by :func:`pycord18n.loader.load_language`. Languages
+        built from a dict are not.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Seconds between checks, by default 5.0
+
+        Returns
+        -------
+        asyncio.Task
+            The watching task, also stopped by :func:`stop_watching`
+        """
+        self.stop_watching()
+
+        if not self._source_mtimes():
+            _log.warning(
+                "None of the languages have source files, so watching will never reload them")
+
+        async def poll():
+            known = self._source_mtimes()
+            while True:
+                await asyncio.sleep(interval)
+                current = self._source_mtimes()
+                for code, mtime in current.items():
+                    if mtime is None or known.get(code) == mtime:
+                        continue
+                    try:
+                        await self.reload_async([code])
+                    except Exception:
+                        # Possibly half written, retried on the next check
+                        _log.exception("Could not reload the %s language", code)
+                        current[code] = known.get(code)
+                known = current
+
+        self._watcher = asyncio.get_running_loop().create_task(poll())
+        return self._watcher
+
+    def stop_watching(self) -> None:
+        """
+        Stop the task started by :func:`watch`, if any
+        """
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher = None
+
     def get_text(
         self,
         key: str,
@@ -95,31 +706,497 @@ class I18n:
             If the key could not be found in the locale, nor in the fallback
             if `should_fallback` is `True`
         """
-        # Get locale
-        if locale not in self._languages:
-            raise InvalidLocaleError(
-                f"Given locale `{locale}` does not exist!", locale=locale)
+        return self._lookup(
+            key, locale, list_formatter, use_translations, should_fallback, kwargs, None)
+
+    def _lookup(
+        self,
+        key: str,
+        locale: str,
+        list_formatter,
+        use_translations: bool,
+        should_fallback: bool,
+        kwargs: dict,
+        served: Optional[List[str]]
+    ) -> str:
+        """
+        Implementation of :func:`get_text`, through the snapshot and the
+        rendered string cache. If given, ``served`` gets the code of the
+        language serving the key.
+        """
+        snapshot = self._snapshot
+        if (
+            snapshot is not None and not kwargs and list_formatter is None
+            and use_translations and should_fallback and type(locale) is str
+        ):
+            try:
+                result = snapshot[locale + "." + key]
+            except KeyError:
+                pass
+            else:
+                if served is not None:
+                    # Only keys served by another locale are recorded
+                    served[0] = snapshot.get(locale + SERVED_SEPARATOR + key, locale)
+                return result
+
+        cache = self._cache
+        if cache is None:
+            return self._get_text(
+                key, locale, list_formatter, use_translations, should_fallback, kwargs, served)
+
+        cache_key = make_key(
+            locale, key, list_formatter, use_translations, should_fallback, kwargs=kwargs)
+        if cache_key is None:
+            return self._get_text(
+                key, locale, list_formatter, use_translations, should_fallback, kwargs, served)
+
+        entry = cache.get(cache_key)
+        if entry is MISSING:
+            generation = self._generation
+            # Cached with the serving language, for metrics
+            code = [locale]
+            result = self._get_text(
+                key, locale, list_formatter, use_translations, should_fallback, kwargs, code)
+            entry = (result, code[0])
+            if generation == self._generation:
+                cache.set(cache_key, entry)
+        if served is not None:
+            served[0] = entry[1]
+        return entry[0]
+
+    def _get_text(
+        self,
+        key: str,
+        locale: str,
+        list_formatter,
+        use_translations: bool,
+        should_fallback: bool,
+        kwargs: dict,
+        served: Optional[List[str]] = None
+    ) -> str:
+        """
+        Uncached implementation of :func:`get_text`
+        """
+        if type(key) is TranslationKey and key._owner is self:
+            entries = key._entries
+            generation = self._generation
+            if key._generation != generation:
+                entries = key._entries = {}
+                key._generation = generation
+
+            entry = entries.get(locale)
+            if entry is None:
+                table = self._get_table(locale)
+                language = table.get(key)
+                if language is not None:
+                    value = language._get_translation_from_key(key, raise_on_empty=False)
+                    template = language._get_template(value) if isinstance(value, str) else None
+                    entry = entries[locale] = (language, template)
+
+            if entry is not None and entry[1] is not None:
+                language, template = entry
+                if should_fallback or language.code == locale:
+                    if served is not None:
+                        served[0] = language.code
+                    try:
+                        return language._render_template(
+                            key, template, list_formatter, use_translations, SafeDict, kwargs)
+                    except KeyError as exc:
+                        raise InvalidTranslationKeyError(
+                            f"Translation {key} could not be formatted for {language.code}", key=key) from exc
+
+        return self._render(
+            self._get_table(locale), key, locale, list_formatter,
+            use_translations, should_fallback, kwargs, served)
+
+    def load_snapshot(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Serve calls to :func:`get_text` without parameters from a snapshot
+        written by :func:`pycord18n.snapshot.prerender`, for example one
+        made once per deployment and shared by every shard.
+
+        The snapshot must have been made from the same translations. It is
+        dropped when the languages of this instance change.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            The snapshot file
+
+        Raises
+        ------
+        ValueError
+            The file is not a snapshot
+        """
+        snapshot = Catalog(path)
+        with self._lock:
+            self._snapshot = snapshot
+
+    def key(self, key: str) -> TranslationKey:
+        """
+        Make a handle for a key, which :func:`get_text` resolves only once
+        per locale. Handles can be made before the key or its languages
+        exist, for example as module level constants.
+
+            >>> COOLDOWN = i18n.key("errors.cooldown")
+            >>> i18n.get_text(COOLDOWN, "fr", seconds=3)
 
-        language = self._languages[locale]
+        Parameters
+        ----------
+        key : str
+            The key
 
+        Returns
+        -------
+        TranslationKey
+            The handle, a :class:`str` equal to the key
+        """
+        return TranslationKey(key, self)
+
+    def add_namespace(self, name: str, languages: List[Language]) -> "Namespace":
+        """
+        Add a namespace, a partition of the translations with languages of
+        its own, for example the translations of one cog.
+
+        Keys of a namespace are looked up in its languages, then in those
+        of this instance, which are shared by every namespace. Placeholders
+        are filled in the same way. Namespaces use the fallbacks of this
+        instance, and must have a language for its fallback locale.
+
+        Namespaces load and unload independently: with :class:`LazyLanguage`,
+        the translations of a namespace are only read once it is used, and
+        :func:`Namespace.unload_unused` unloads them again.
+
+            >>> music = i18n.add_namespace("music", [
+                    LazyLanguage("English", "en", "locales/en/music.json"),
+                    LazyLanguage("French", "fr", "locales/fr/music.json"),
+                ])
+            >>> music.get_text("now_playing", "fr", title=title)
+
+        Parameters
+        ----------
+        name : str
+            The name of the namespace
+        languages : List[Language]
+            The languages of the namespace
+
+        Returns
+        -------
+        Namespace
+            The namespace
+
+        Raises
+        ------
+        KeyError
+            If the namespace already exists, or has no language for the
+            fallback locale
+        """
+        with self._lock:
+            if name in self._namespaces:
+                raise KeyError(f"Namespace {name} already exists")
+            namespace = self._namespaces[name] = Namespace(name, self, languages)
+        return namespace
+
+    def namespace(self, name: str) -> "Namespace":
+        """
+        Get a namespace added with :func:`add_namespace`
+
+        Parameters
+        ----------
+        name : str
+            The name of the namespace
+
+        Returns
+        -------
+        Namespace
+            The namespace
+
+        Raises
+        ------
+        KeyError
+            If there is no such namespace
+        """
         try:
-            result = language.get_text(
-                key, list_formatter=list_formatter, use_translations=use_translations, **kwargs)
-        except KeyError as exc:
-            # If we shouldn't fallback or this is the fallback
+            return self._namespaces[name]
+        except KeyError:
+            raise KeyError(f"No namespace {name}") from None
+
+    def remove_namespace(self, name: str) -> "Namespace":
+        """
+        Remove a namespace, for example when its cog is unloaded
+
+        Parameters
+        ----------
+        name : str
+            The name of the namespace
+
+        Returns
+        -------
+        Namespace
+            The removed namespace
+
+        Raises
+        ------
+        KeyError
+            If there is no such namespace
+        """
+        with self._lock:
+            namespace = self.namespace(name)
+            del self._namespaces[name]
+        return namespace
+
+    def _get_table(self, locale: str) -> Dict[str, Language]:
+        """
+        Get the resolution table of a locale
+
+        Raises
+        ------
+        InvalidLocaleError
+            If the locale does not exist on this instance
+        """
+        table = self._resolution.get(locale)
+        if table is None:
+            table = self._build_table(locale)
+        return table
+
+    def _render(
+        self,
+        table: Dict[str, Language],
+        key: str,
+        locale: str,
+        list_formatter,
+        use_translations: bool,
+        should_fallback: bool,
+        kwargs: dict,
+        served: Optional[List[str]] = None
+    ) -> str:
+        """
+        Render a key using an already resolved locale table. If given,
+        ``served`` gets the code of the language serving the key.
+
+        Raises
+        ------
+        InvalidTranslationKeyError
+            If the key could not be found or formatted
+        """
+        language = table.get(key)
+        if language is None or (not should_fallback and language.code != locale):
             if not should_fallback or locale == self._fallback:
                 raise InvalidTranslationKeyError(
-                    f"Translation {key} not found for {locale}!", key=key) from exc
-        else:
-            return result
+                    f"Translation {key} not found for {locale}!", key=key)
+            raise InvalidTranslationKeyError(
+                f"Translation {key} not found for {locale} nor fallback {', '.join(self._chains[locale][1:])}", key=key)
 
-        # We only get here if fallback is enabled and the text wasn't found in
-        # the initial language
+        if served is not None:
+            served[0] = language.code
         try:
-            result = self._languages[self._fallback].get_text(
+            return language.get_text(
                 key, list_formatter=list_formatter, use_translations=use_translations, **kwargs)
         except KeyError as exc:
             raise InvalidTranslationKeyError(
-                f"Translation {key} not found for {locale} nor fallback {self._fallback}", key=key) from exc
-        else:
-            return result
+                f"Translation {key} could not be formatted for {language.code}", key=key) from exc
+
+    def get_text_many(
+        self,
+        keys_or_specs: Iterable[Union[str, Tuple[str, Dict[str, Any]]]],
+        locale: str,
+        list_formatter: bool = None,
+        use_translations: bool = True,
+        should_fallback: bool = True,
+        **kwargs
+    ) -> List[str]:
+        """
+        Get the translations of many keys for one locale. Each key goes
+        through the same snapshot, cache, metrics and key handles as
+        :func:`get_text`, so a batch returns what the separate calls would.
+
+            >>> i18n.get_text_many(["hello", ("welcome", {"name": "Bob"})], "fr")
+            ["Bonjour", "Bienvenue Bob"]
+
+        .. seealso: documentation for :func:`get_text`
+
+        Parameters
+        ----------
+        keys_or_specs : Iterable[Union[str, Tuple[str, Dict[str, Any]]]]
+            Keys, or ``(key, kwargs)`` tuples for keys needing their own
+            parameters
+        locale : str
+            The locale
+        list_formatter : bool, optional
+            Function to format lists, by default None
+        use_translations : bool, optional
+            Whether to use translations in formatting, by default True
+        should_fallback : bool, optional
+            Should fallback to default locale, by default True
+        **kwargs : dict, optional
+            Parameters shared by every key. Parameters given in a spec take
+            priority.
+
+        Returns
+        -------
+        List[str]
+            The translated and formatted strings, in order
+
+        Raises
+        ------
+        InvalidLocaleError
+            If the locale does not exist on this instance
+        InvalidTranslationKeyError
+            If any key could not be found
+        """
+        # Through the instrumented get_text while metrics are enabled
+        lookup = self._lookup if self._metrics is None else None
+        results = []
+        for spec in keys_or_specs:
+            if isinstance(spec, str):
+                key, params = spec, kwargs
+            else:
+                key, params = spec
+                if kwargs:
+                    params = {**kwargs, **params}
+            if lookup is not None:
+                results.append(lookup(
+                    key, locale, list_formatter, use_translations, should_fallback, params, None))
+            else:
+                results.append(self.get_text(
+                    key, locale, list_formatter, use_translations, should_fallback, **params))
+        return results
+
+    def get_text_all_locales(
+        self,
+        key: str,
+        locales: Optional[Iterable[str]] = None,
+        list_formatter: bool = None,
+        use_translations: bool = True,
+        should_fallback: bool = True,
+        **kwargs
+    ) -> Dict[str, str]:
+        """
+        Get the translation of one key in every locale, for example to build
+        Discord's ``name_localizations`` dicts
+
+        Parameters
+        ----------
+        key : str
+            The key to search for
+        locales : Iterable[str], optional
+            The locales to render, by default every locale of this instance
+        list_formatter : bool, optional
+            Function to format lists, by default None
+        use_translations : bool, optional
+            Whether to use translations in formatting, by default True
+        should_fallback : bool, optional
+            Should fallback to default locale, by default True
+
+            If False, locales without their own translation are left out
+            instead of raising an error.
+        **kwargs : dict, optional
+            Parameters to pass to translation
+
+        Returns
+        -------
+        Dict[str, str]
+            Translated and formatted strings by locale
+
+        Raises
+        ------
+        InvalidLocaleError
+            If one of the given locales does not exist on this instance
+        InvalidTranslationKeyError
+            If the key could not be found for a locale while falling back
+        """
+        if locales is None:
+            locales = self._chains
+
+        get_text = self.get_text
+        results = {}
+        for locale in locales:
+            if not should_fallback:
+                language = self._get_table(locale).get(key)
+                if language is None or language.code != locale:
+                    continue
+            results[locale] = get_text(
+                key, locale, list_formatter, use_translations, should_fallback, **kwargs)
+        return results
+
+
+class Namespace(I18n):
+    """
+    The translations of one partition of an :class:`I18n` instance, made by
+    :func:`I18n.add_namespace`.
+
+    Lookups only see the languages of the namespace, then the languages of
+    the instance as shared translations. A namespace has every method of
+    :class:`I18n`, with the locales and fallbacks of its instance.
+    """
+
+    def __init__(self, name: str, root: I18n, languages: List[Language]) -> None:
+        """
+        Initialize the namespace.
+
+        Parameters
+        ----------
+        name : str
+            The name of the namespace
+        root : I18n
+            The instance holding the shared translations
+        languages : List[Language]
+            The languages of the namespace
+        """
+        self.name = name
+        self._root = root
+        # Set while binding the common languages, whose changes notify
+        # this namespace
+        self._binding = False
+        super().__init__(
+            languages, root._fallback, fallbacks=root._fallbacks,
+            derive_parents=root._derive_parents)
+
+    def __repr__(self) -> str:
+        return f"<Namespace {self.name!r}>"
+
+    def _on_language_changed(self, language: Language) -> None:
+        with self._lock:
+            if not self._binding:
+                super()._on_language_changed(language)
+
+    def _build_resolution(self) -> None:
+        root = self._root
+        # Placeholders are filled from the language of the instance that
+        # serves the same locale, so a fallback string stays in one language.
+        # The resolution is built once below rather than on each change.
+        self._binding = True
+        try:
+            for code, language in self._languages.items():
+                language.common = root._languages[root._resolve_chain(code)[0]]
+        finally:
+            self._binding = False
+
+        super()._build_resolution()
+        # Locales of the instance are valid even without a language here
+        for locale in root._chains:
+            if locale not in self._chains:
+                self._chains[locale] = self._resolve_chain(locale)
+
+    def _render(
+        self,
+        table: Dict[str, Language],
+        key: str,
+        locale: str,
+        list_formatter,
+        use_translations: bool,
+        should_fallback: bool,
+        kwargs: dict,
+        served: Optional[List[str]] = None
+    ) -> str:
+        if key not in table:
+            # A shared translation
+            root = self._root
+            if locale not in root._chains:
+                # Only the namespace has a language for this locale
+                locale = root._fallback
+            return root._render(
+                root._get_table(locale), key, locale, list_formatter,
+                use_translations, should_fallback, kwargs, served)
+        return super()._render(
+            table, key, locale, list_formatter, use_translations, should_fallback, kwargs, served)
@@ -0,0 +1,55 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, Optional, Tuple
+
+
+class TranslationKey(str):
+    """
+    A translation key that remembers what it resolved to in each locale,
+    made by :func:`I18n.key`.
+
+    It is a :class:`str`, so it can be used anywhere a key can. When given
+    to :func:`I18n.get_text` of the instance that made it, the language and
+    compiled template serving each locale are fetched directly instead of
+    being looked up through the resolution table and the language's index.
+
+    What a key resolved to is forgotten whenever the languages of the
+    instance change.
+
+        >>> COOLDOWN = i18n.key("errors.cooldown")
+        >>> i18n.get_text(COOLDOWN, "fr", seconds=3)
+    """
+
+    # Subclasses of str cannot have non-empty __slots__
+    _owner: Any
+    _generation: int
+    _entries: Dict[str, Tuple[Any, Any]]
+
+    def __new__(cls, key: str, owner: Optional[Any] = None) -> "TranslationKey":
+        self = super().__new__(cls, key)
+        self._owner = owner
+        self._generation = -1
+        self._entries = {}
+        return self
+
+    def __repr__(self) -> str:
+        return f"<TranslationKey {str.__repr__(self)}>"
+
+    def __reduce__(self):
+        # Handles are not tied to an instance once copied to another process
+        return (TranslationKey, (str(self),))
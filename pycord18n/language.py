@@ -15,7 +15,63 @@
 # You should have received a copy of the GNU General Public License
 # along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Dict
+import json
+import os
+import time
+import weakref
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .formatting import build_formatters
+from .lists import PATTERN_NAMES, ListFormatter
+from .plural import PluralForms, PluralRule, get_plural_rule
+from .template import Template, compile_template
+
+
+def _flatten(translations: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten (possibly nested) translations into a single dict keyed by
+    dotted paths, groups included. Groups of plural forms become
+    :class:`PluralForms`.
+
+    Where a literal dotted key clashes with a nested path, the nested path
+    wins, as it did when keys were walked one level at a time.
+    """
+    index = {}
+    stack = [("", translations)]
+    while stack:
+        prefix, group = stack.pop()
+        for key, value in group.items():
+            path = prefix + key
+            if PluralForms.is_plural(value):
+                value = PluralForms(value)
+            if "." in key:
+                index.setdefault(path, value)
+            else:
+                index[path] = value
+            if isinstance(value, dict):
+                stack.append((path + ".", value))
+    return index
+
+
+def _flatten_leaves(translations: Dict[str, Any]) -> Iterator[Tuple[str, Union[str, PluralForms]]]:
+    """
+    Iterate over the string translations and plural forms of (possibly
+    nested) translations as ``(dotted key, value)`` pairs, for flat stores
+    such as catalogs
+
+    Raises
+    ------
+    TypeError
+        A translation is neither a string nor a nested group
+    """
+    for key, value in _flatten(translations).items():
+        if type(value) is not PluralForms:
+            if isinstance(value, dict):
+                continue
+            if not isinstance(value, str):
+                raise TypeError(
+                    f"Translation {key} must be a string, not {type(value).__name__}")
+        yield key, value
 
 
 class SafeDict(dict):
@@ -24,10 +80,199 @@ class SafeDict(dict):
 
 
 class Language:
-    def __init__(self, name: str, code: str, translations: Dict[str, str]) -> None:
+    __slots__ = (
+        "name", "code", "_translations", "_plural_rules", "_plural_rule", "_templates",
+        "_index", "_list_formatters", "_formatters", "_expansions", "_listeners", "_common", "__weakref__",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        code: str,
+        translations: Dict[str, str],
+        plural_rules: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Initialize the language.
+
+        Parameters
+        ----------
+        name : str
+            The name of the language
+        code : str
+            The locale code of the language
+        translations : Dict[str, str]
+            The (possibly nested) translations
+        plural_rules : Dict[str, str], optional
+            CLDR plural rules by category, by default None (the built-in
+            rules for the locale code)
+
+            .. seealso :: :func:`pycord18n.plural.compile_plural_rule`
+        """
         self.name = name
         self.code = code
         self._translations = translations
+        self._plural_rules = plural_rules
+        # Compiled on first plural lookup
+        self._plural_rule: Optional[PluralRule] = None
+        # Compiled templates, keyed by the translation string itself so that
+        # changed translations are simply compiled again
+        self._templates: Dict[str, Template] = {}
+        # Flat `{"a.b.c": value}` index of every key, built on first lookup
+        self._index: Optional[Dict[str, Any]] = None
+        # List formatters by translation key, built on first use
+        self._list_formatters: Dict[str, ListFormatter] = {}
+        # Formatters for named format specs, built on first use
+        self._formatters: Optional[Dict[str, Callable[[Any], str]]] = None
+        # Fully expanded top level translations used as placeholders, with
+        # every name their expansion looked up, built on first use
+        self._expansions: Dict[str, Tuple[FrozenSet[str], Any]] = {}
+        # Weak references to callbacks run when the translations change
+        self._listeners: List[weakref.WeakMethod] = []
+        # Language filling the placeholders this one has no translation for
+        self._common: Optional[Language] = None
+
+    @property
+    def translations(self) -> Dict[str, Any]:
+        """
+        The translations of this language
+
+        Assigning new translations invalidates everything derived from the
+        old ones, including the caches of any :class:`I18n` using this
+        language. If the dict is mutated in place instead, call
+        :func:`invalidate` afterwards.
+        """
+        return self._translations
+
+    @translations.setter
+    def translations(self, translations: Dict[str, Any]) -> None:
+        self._translations = translations
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Drop everything derived from the translations and notify the
+        :class:`I18n` instances using this language
+        """
+        self._index = None
+        self._templates = {}
+        self._list_formatters = {}
+        self._formatters = None
+        self._expansions = {}
+
+        listeners = []
+        for ref in self._listeners:
+            callback = ref()
+            if callback is not None:
+                listeners.append(ref)
+                callback(self)
+        self._listeners = listeners
+
+    @property
+    def common(self) -> Optional["Language"]:
+        """
+        The language whose top level translations fill the placeholders
+        this language has no translation for, such as the shared
+        translations of the :class:`pycord18n.i18n.Namespace` this language
+        belongs to. By default None.
+
+        Changes of the common language invalidate this one.
+        """
+        return self._common
+
+    @common.setter
+    def common(self, common: Optional["Language"]) -> None:
+        if common is self._common:
+            return
+        if self._common is not None:
+            self._common._remove_listener(self._on_common_changed)
+        if common is not None:
+            common._add_listener(self._on_common_changed)
+        self._common = common
+        self.invalidate()
+
+    def _on_common_changed(self, language: "Language") -> None:
+        # Expansions may hold translations of the common language
+        self.invalidate()
+
+    def _add_listener(self, callback: Callable[["Language"], None]) -> None:
+        """
+        Register a bound method to be called with this language whenever its
+        translations change. Only a weak reference is kept.
+        """
+        self._listeners.append(weakref.WeakMethod(callback))
+
+    def _remove_listener(self, callback: Callable[["Language"], None]) -> None:
+        """
+        Unregister a callback added with :func:`_add_listener`
+        """
+        self._listeners = [
+            ref for ref in self._listeners
+            if ref() is not None and ref() != callback
+        ]
+
+    def _get_index(self) -> Dict[str, Any]:
+        """
+        Get the flat index of all keys, building it if needed
+
+        Returns
+        -------
+        Dict[str, Any]
+            The flat index
+        """
+        index = self._index
+        if index is None:
+            index = self._build_index()
+        return index
+
+    def _source_paths(self) -> Tuple[str, ...]:
+        """
+        Get the files this language is read from, if any
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The paths, empty for languages built from a dict
+        """
+        return ()
+
+    def _reload(self) -> Optional["Language"]:
+        """
+        Build a fully loaded copy of this language from its source
+
+        Returns
+        -------
+        Optional[Language]
+            The new language, or None if this language has no source
+        """
+        return None
+
+    def _served_keys(self) -> Iterable[str]:
+        """
+        Get every key that can be looked up with a non-empty result
+
+        Returns
+        -------
+        Iterable[str]
+            The keys, including dotted paths
+        """
+        return [key for key, value in self._get_index().items() if value != ""]
+
+    def _build_index(self) -> Dict[str, Any]:
+        """
+        Flatten the (possibly nested) translations into a single dict keyed
+        by dotted paths. Groups are indexed as well as their leaves.
+
+        Where a literal dotted key clashes with a nested path, the nested
+        path wins, as it did when keys were walked one level at a time.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The flat index
+        """
+        self._index = _flatten(self._translations)
+        return self._index
 
     def _get_translation_from_key(self, key: str, raise_on_empty: bool = True) -> str:
         """
@@ -49,27 +294,120 @@ class Language:
         Raises
         ------
         KeyError
-            The function attempted to access a key when using dotted nesting,
-            but the value did not have this key
+            The key (or dotted path) was not found
         KeyError
             If ``raise_on_empty`` is True, the value found is an empty string
         """
-        if "." in key:
-            parts = key.split(".")
-            current = self._translations[parts[0]]
-            for part in parts[1:]:
-                if part in current:
-                    current = current[part]
-                else:
-                    raise KeyError(f"{part} was not found under {current}")
-        else:
-            current = self._translations[key]
+        index = self._index
+        if index is None:
+            index = self._build_index()
+
+        current = index[key]
 
         if raise_on_empty and current == "":
             raise KeyError("Resultant string was empty")
 
         return current
 
+    def _get_template(self, base_string: str) -> Template:
+        """
+        Get the compiled template for a translation string, compiling and
+        caching it on first use
+
+        Parameters
+        ----------
+        base_string : str
+            The translation string
+
+        Returns
+        -------
+        Template
+            The compiled template
+        """
+        try:
+            return self._templates[base_string]
+        except KeyError:
+            template = self._templates[base_string] = compile_template(base_string)
+            return template
+
+    def get_plural_category(self, count: Any) -> str:
+        """
+        Get the CLDR plural category of a number in this language
+
+        Parameters
+        ----------
+        count : Any
+            The number
+
+        Returns
+        -------
+        str
+            ``zero``, ``one``, ``two``, ``few``, ``many`` or ``other``.
+            Values that are not numbers are ``other``.
+        """
+        rule = self._plural_rule
+        if rule is None:
+            rule = self._plural_rule = get_plural_rule(self.code, self._plural_rules)
+
+        try:
+            return rule(count)
+        except (TypeError, ValueError, ArithmeticError):
+            return "other"
+
+    def _select_plural(self, forms: PluralForms, count: Any) -> Any:
+        """
+        Choose the plural form for a count, using ``other`` when the count is
+        missing or the language has no form for its category
+        """
+        if count is None:
+            return forms["other"]
+        return forms.get(self.get_plural_category(count)) or forms["other"]
+
+    def get_formatters(self) -> Dict[str, Callable[[Any], str]]:
+        """
+        Get the formatters used for named format specs in translations,
+        such as ``{count:number}`` or ``{until:relative}``, building and
+        caching them on first use
+
+        Separators, date patterns and unit words are read from the
+        ``_formats`` group of the translations, falling back to defaults
+        for the locale::
+
+            "_formats": {
+                "decimal": ",",
+                "group": " ",
+                "date": "%d/%m/%Y",
+                "time": "%H:%M",
+                "datetime": "%d/%m/%Y %H:%M",
+                "now": "maintenant",
+                "future": "dans {0}",
+                "past": "il y a {0}",
+                "duration_separator": " ",
+                "units": {
+                    "hour": {"one": "{count} heure", "other": "{count} heures"}
+                }
+            }
+
+        .. seealso :: :mod:`pycord18n.formatting`
+
+        Returns
+        -------
+        Dict[str, Callable[[Any], str]]
+            Formatters by format spec
+        """
+        formatters = self._formatters
+        if formatters is None:
+            index = self._get_index()
+
+            def plural(forms, count):
+                if isinstance(forms, str):
+                    return forms
+                return self._select_plural(forms, count)
+
+            formatters = self._formatters = build_formatters(
+                self.code, lambda name: index.get(f"_formats.{name}"), plural)
+        return formatters
+
     def join_list(self, value: list, connector: str) -> str:
         """
         Sensibly join list elements together
@@ -82,55 +420,118 @@ class Language:
             The text that goes either between two items when the list is 2
             items long, or between all but the last item of the list
             and the last item of the list when the list has more than 2
-            items
+            items. Other items are separated by ", "
 
         Returns
         -------
         str
             The list as a "sensible" string
         """
-        # Stringify everything first
-        value = [str(v) for v in value]
-        if len(value) == 1:
-            return value[0]
-        elif len(value) == 2:
-            # Just two items
-            return connector.join(value)
+        return ListFormatter(two=connector)(value)
+
+    def get_list_formatter(self, kind: str) -> ListFormatter:
+        """
+        Get the list formatter built from the translation key ``kind``,
+        building and caching it on first use
+
+        The key holds either a connecting word (``"and_": "and"``) or CLDR
+        list patterns::
+
+            "and_": {
+                "two": "{0} y {1}",
+                "start": "{0}, {1}",
+                "middle": "{0}, {1}",
+                "end": "{0} y {1}"
+            }
+
+        .. seealso :: :class:`pycord18n.lists.ListFormatter`
+
+        Parameters
+        ----------
+        kind : str
+            The translation key, such as ``and_`` or ``or_``
+
+        Returns
+        -------
+        ListFormatter
+            The formatter
+
+        Raises
+        ------
+        KeyError
+            The key was not found, or is empty
+        """
+        try:
+            return self._list_formatters[kind]
+        except KeyError:
+            pass
+
+        index = self._get_index()
+        connector = index.get(kind)
+        if isinstance(connector, str):
+            if connector == "":
+                raise KeyError("Resultant string was empty")
+            formatter = ListFormatter.from_connector(connector)
         else:
-            # All but last connected by ",", and last connected by connector
-            return connector.join([','.join(value[:-1]), value[-1]])
+            # Read through the index, since catalogs only keep the leaves
+            patterns = {
+                name: index.get(f"{kind}.{name}")
+                for name in PATTERN_NAMES
+            }
+            if not patterns["two"]:
+                raise KeyError(kind)
+            formatter = ListFormatter.from_patterns(patterns)
+
+        self._list_formatters[kind] = formatter
+        return formatter
 
-    def and_(self, value: list, *args, **kwargs) -> str:
+    def _format_list(self, kind: str, value: list, raise_on_empty: bool) -> str:
+        if not raise_on_empty and self._get_index().get(kind) == "":
+            # Joined around the empty connector, as it always was
+            return self.join_list(value, "  ")
+        return self.get_list_formatter(kind)(value)
+
+    def and_(self, value: list, raise_on_empty: bool = True) -> str:
         """
-        Wraps :func:`join_list` but uses the translation key ``and_``
+        Format a list using the list formatter of the translation key ``and_``
+
+        .. seealso :: :func:`get_list_formatter`
 
         Parameters
         ----------
         value : list
             The list of values to combine. Automatically converted to strings
+        raise_on_empty : bool, optional
+            Whether to raise a KeyError when the connector is an empty
+            string, by default True
 
         Returns
         -------
         str
             The list as a "sensible" string
         """
-        return self.join_list(value, " " + self._get_translation_from_key("and_",  *args, **kwargs) + " ")
+        return self._format_list("and_", value, raise_on_empty)
 
-    def or_(self, value: list, *args, **kwargs) -> str:
+    def or_(self, value: list, raise_on_empty: bool = True) -> str:
         """
-        Wraps :func:`join_list` but uses the translation key ``or_``
+        Format a list using the list formatter of the translation key ``or_``
+
+        .. seealso :: :func:`get_list_formatter`
 
         Parameters
         ----------
         value : list
             The list of values to combine. Automatically converted to strings
+        raise_on_empty : bool, optional
+            Whether to raise a KeyError when the connector is an empty
+            string, by default True
 
         Returns
         -------
         str
             The list as a "sensible" string
         """
-        return self.join_list(value, " " + self._get_translation_from_key("or_",  *args, **kwargs) + " ")
+        return self._format_list("or_", value, raise_on_empty)
 
     def get_text(
         self,
@@ -150,7 +551,11 @@ class Language:
         list_formatter : bool, optional
             Function to format lists, by default None
 
-            .. seealso :: functions :func:`and_`, :func:`or_`, :func:`join_list`
+            It can also be the translation key of a list formatter of this
+            language, such as ``"and_"``. With :class:`I18n` this formats
+            lists in the language that serves the key, even when falling back.
+
+            .. seealso :: functions :func:`and_`, :func:`or_`, :func:`get_list_formatter`
         use_translations : bool, optional
             Whether to use translations in formatting, by default True
 
@@ -165,11 +570,27 @@ class Language:
 
                 >>> language.get_text("you_lost")
                 "You lost the game"
+
+            Translations used this way are expanded recursively, and their
+            own placeholders are also filled from the parameters first. A
+            translation referring back to itself, directly or not, is left
+            as a placeholder at the point the cycle closes.
         safedict : Any, optional
             Class to use as a "Safe dict", by default :cls:`SafeDict`
         **kwargs : dict, optional
             Parameters to pass to translation
 
+            If the key holds plural forms (a group keyed by CLDR plural
+            categories such as ``one`` and ``other``), the ``count``
+            parameter chooses the form.
+
+                >>> language = Language("English", "en", {
+                    "apples": {"one": "{count} apple", "other": "{count} apples"},
+                })
+
+                >>> language.get_text("apples", count=3)
+                "3 apples"
+
         Returns
         -------
         str
@@ -181,20 +602,263 @@ class Language:
             The translation was not found (raised through `_get_translation_from_key`)
         """
         base_string = self._get_translation_from_key(key)
+        if type(base_string) is PluralForms:
+            base_string = self._select_plural(base_string, kwargs.get("count"))
 
-        # Sanitize passed arguments
-        params = kwargs.copy()
-        for key, value in params.items():
-            if list_formatter and isinstance(value, list):
-                params[key] = list_formatter(value)
-
-        # Create the dict using given kwargs
-        mapping = params
-        if use_translations:
-            # Put `**kwargs` after to prioritize given translations
-            mapping = {
-                **self._translations,
-                **mapping
-            }
+        if not isinstance(base_string, str):
+            # Not a translation string (e.g. a nested group), fails the same
+            # way `str.format_map` always did
+            return base_string.format_map(safedict(**kwargs))
+
+        return self._render_template(
+            key, self._get_template(base_string), list_formatter, use_translations, safedict, kwargs)
+
+    def _render_template(
+        self,
+        key: str,
+        template: Template,
+        list_formatter,
+        use_translations: bool,
+        safedict,
+        kwargs: dict
+    ) -> str:
+        """
+        Render the compiled translation string of a key
+        """
+        mapping = self._fill(template, kwargs, list_formatter, use_translations, safedict, (key,))
+        if template.uses_formatters:
+            return template.render(safedict(**mapping), self.get_formatters())
+        return template.render(safedict(**mapping))
+
+    def _fill(
+        self,
+        template: Template,
+        kwargs: dict,
+        list_formatter,
+        use_translations: bool,
+        safedict,
+        active: Tuple[str, ...]
+    ) -> Dict[str, Any]:
+        """
+        Resolve the placeholders of a template, given kwargs first and then
+        translations, then those of the common language, rather than merging
+        every translation of the language on each call. ``active`` holds the
+        translations being expanded.
+        """
+        translations = self._translations
+        common = self._common
+        mapping = {}
+        for name in template.names:
+            if name in kwargs:
+                value = kwargs[name]
+                # Sanitize passed arguments
+                if list_formatter and isinstance(value, list):
+                    if isinstance(list_formatter, str):
+                        list_formatter = self.get_list_formatter(list_formatter)
+                    value = list_formatter(value)
+                mapping[name] = value
+            elif use_translations and name not in active and name in translations:
+                mapping[name] = self._expand(name, kwargs, list_formatter, safedict, active)
+            elif use_translations and common is not None and name in common._translations:
+                # The common language never refers back to this one
+                mapping[name] = common._expand(name, kwargs, list_formatter, safedict, ())
+        return mapping
+
+    def _expand(
+        self,
+        name: str,
+        kwargs: dict,
+        list_formatter,
+        safedict,
+        active: Tuple[str, ...]
+    ) -> Any:
+        """
+        Get a top level translation used as a placeholder, with its own
+        placeholders filled in. The expansion without parameters is
+        memoized and reused whenever the parameters do not affect it.
+        """
+        expansion = self._expansions.get(name)
+        if expansion is None:
+            expansion = self._expand_static(name, active)
+        names, value = expansion
+        if not names or (safedict is SafeDict and names.isdisjoint(kwargs)):
+            return value
+
+        template = self._get_template(self._translations[name])
+        mapping = self._fill(template, kwargs, list_formatter, True, safedict, active + (name,))
+        if template.uses_formatters:
+            return template.render(safedict(**mapping), self.get_formatters())
+        return template.render(safedict(**mapping))
+
+    def _expand_static(
+        self,
+        name: str,
+        active: Tuple[str, ...]
+    ) -> Tuple[FrozenSet[str], Any]:
+        """
+        Expand a top level translation without any parameters, memoizing
+        the result unless a reference cycle had to be cut
+
+        Returns
+        -------
+        Tuple[FrozenSet[str], Any]
+            Every name looked up while expanding, and the expansion
+        """
+        memoize = True
+        value = self._translations[name]
+        if not isinstance(value, str):
+            # Groups, plural forms and other values are used as they are
+            expansion = (frozenset(), value)
+        else:
+            template = self._get_template(value)
+            if not template.names:
+                # Malformed strings are inserted as they are, as they always were
+                expansion = (frozenset(), value if template._fallback else template.render({}))
+            else:
+                names = set(template.names)
+                mapping = {}
+                active = active + (name,)
+                common = self._common
+                for sub in template.names:
+                    if sub in active:
+                        # The expansion depends on where the cycle was cut
+                        memoize = False
+                    if sub not in active and sub in self._translations:
+                        if sub not in self._expansions:
+                            sub_names, mapping[sub] = self._expand_static(sub, active)
+                            # Not memoized when a cycle was cut below
+                            memoize = memoize and sub in self._expansions
+                        else:
+                            sub_names, mapping[sub] = self._expansions[sub]
+                        names |= sub_names
+                    elif common is not None and sub in common._translations:
+                        if sub not in common._expansions:
+                            sub_names, mapping[sub] = common._expand_static(sub, ())
+                        else:
+                            sub_names, mapping[sub] = common._expansions[sub]
+                        names |= sub_names
+
+                if template.uses_formatters:
+                    rendered = template.render(SafeDict(**mapping), self.get_formatters())
+                else:
+                    rendered = template.render(SafeDict(**mapping))
+                expansion = (frozenset(names), rendered)
+
+        if memoize:
+            self._expansions[name] = expansion
+        return expansion
+
+
+class LazyLanguage(Language):
+    """
+    A :class:`Language` whose translations are only read when first needed,
+    and can be unloaded again when unused.
+
+        >>> french = LazyLanguage("French", "fr", "locales/fr.json")
+        >>> french.is_loaded
+        False
+        >>> french.get_text("hello")
+        "Bonjour"
+        >>> french.is_loaded
+        True
+    """
 
-        return base_string.format_map(safedict(**mapping))
+    __slots__ = ("_source", "_data", "_last_used")
+
+    def __init__(
+        self,
+        name: str,
+        code: str,
+        source: Union[str, os.PathLike, Callable[[], Dict[str, Any]]]
+    ) -> None:
+        """
+        Initialize the language without loading it.
+
+        Parameters
+        ----------
+        name : str
+            The name of the language
+        code : str
+            The locale code of the language
+        source : Union[str, os.PathLike, Callable[[], Dict[str, Any]]]
+            Path to a JSON file, or a function returning the translations
+        """
+        self._source = source
+        self._data: Optional[Dict[str, Any]] = None
+        self._last_used: Optional[float] = None
+        super().__init__(name, code, None)
+
+    @property
+    def _translations(self) -> Dict[str, Any]:
+        data = self._data
+        if data is None:
+            data = self._data = self._load()
+            self._last_used = time.monotonic()
+        return data
+
+    @_translations.setter
+    def _translations(self, translations: Optional[Dict[str, Any]]) -> None:
+        if translations is not None:
+            # Assigned translations replace the source, so they survive
+            # being unloaded
+            self._source = lambda: translations
+        self._data = translations
+
+    def _load(self) -> Dict[str, Any]:
+        """
+        Read the translations from the source
+
+        Returns
+        -------
+        Dict[str, Any]
+            The translations
+        """
+        if callable(self._source):
+            return self._source()
+
+        with open(self._source, encoding="utf-8") as file:
+            return json.load(file)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the translations are currently in memory"""
+        return self._data is not None
+
+    @property
+    def last_used(self) -> Optional[float]:
+        """The :func:`time.monotonic` time of the last lookup or load, if any"""
+        return self._last_used
+
+    def load(self) -> None:
+        """
+        Load the translations now rather than on first use
+        """
+        self._get_index()
+
+    def unload(self) -> None:
+        """
+        Drop the translations and everything derived from them. They are
+        read again from the source on next use.
+        """
+        self._data = None
+        self._index = None
+        self._templates = {}
+        self._list_formatters = {}
+        self._formatters = None
+        self._expansions = {}
+
+    def _source_paths(self) -> Tuple[str, ...]:
+        if callable(self._source):
+            return ()
+        return (self._source,)
+
+    def _reload(self) -> "LazyLanguage":
+        language = LazyLanguage(self.name, self.code, self._source)
+        # Languages never used stay unloaded until they are
+        if self.is_loaded:
+            language.load()
+        return language
+
+    def _render_template(self, *args, **kwargs) -> str:
+        self._last_used = time.monotonic()
+        return super()._render_template(*args, **kwargs)
@@ -0,0 +1,194 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Iterable, Mapping, Optional
+
+PATTERN_NAMES = ("two", "start", "middle", "end")
+
+DEFAULT_SEPARATOR = ", "
+
+
+def pattern_separator(pattern: str) -> str:
+    """
+    Get the text between the items of a CLDR list pattern
+
+        >>> pattern_separator("{0} and {1}")
+        " and "
+
+    Parameters
+    ----------
+    pattern : str
+        A pattern of the form ``{0}<separator>{1}``
+
+    Returns
+    -------
+    str
+        The separator
+
+    Raises
+    ------
+    ValueError
+        The pattern is not of the supported form
+    """
+    if not (pattern.startswith("{0}") and pattern.endswith("{1}")) or len(pattern) < 6:
+        raise ValueError(f"Unsupported list pattern {pattern!r}")
+    return pattern[3:-3]
+
+
+class ListFormatter:
+    """
+    Joins the items of a list following the four CLDR list patterns of a
+    locale: ``two`` for lists of two items, and ``start``, ``middle`` and
+    ``end`` for the first, inner and last joins of longer lists.
+
+        >>> formatter = ListFormatter(two=" and ", end=" and ")
+        >>> formatter(["a", "b", "c"])
+        "a, b and c"
+
+    The separators are worked out once, so formatting a list is a single
+    :func:`str.join` over the stringified items.
+    """
+
+    __slots__ = ("two", "start", "middle", "end")
+
+    def __init__(
+        self,
+        two: str,
+        start: str = DEFAULT_SEPARATOR,
+        middle: str = DEFAULT_SEPARATOR,
+        end: Optional[str] = None
+    ) -> None:
+        """
+        Initialize the formatter from separators.
+
+        Parameters
+        ----------
+        two : str
+            Separator of lists with two items
+        start : str, optional
+            Separator after the first item of longer lists, by default ", "
+        middle : str, optional
+            Separator between the inner items of longer lists, by default ", "
+        end : str, optional
+            Separator before the last item of longer lists, by default the
+            same as ``two``
+        """
+        self.two = two
+        self.start = start
+        self.middle = middle
+        self.end = two if end is None else end
+
+    def __repr__(self) -> str:
+        return (
+            f"<ListFormatter two={self.two!r} start={self.start!r} "
+            f"middle={self.middle!r} end={self.end!r}>"
+        )
+
+    @classmethod
+    def from_connector(cls, connector: str) -> "ListFormatter":
+        """
+        Make a formatter from a connecting word such as ``and``
+
+            >>> ListFormatter.from_connector("or")(["a", "b", "c"])
+            "a, b or c"
+
+        Parameters
+        ----------
+        connector : str
+            The word before the last item
+
+        Returns
+        -------
+        ListFormatter
+            The formatter
+        """
+        separator = " " + connector + " "
+        return cls(two=separator, end=separator)
+
+    @classmethod
+    def from_patterns(cls, patterns: Mapping[str, str]) -> "ListFormatter":
+        """
+        Make a formatter from CLDR list patterns such as
+        ``{"two": "{0} y {1}", "end": "{0} y {1}"}``. ``start`` and
+        ``middle`` default to ``{0}, {1}`` and ``end`` defaults to ``two``.
+
+        Parameters
+        ----------
+        patterns : Mapping[str, str]
+            Patterns by name, at least ``two``
+
+        Returns
+        -------
+        ListFormatter
+            The formatter
+
+        Raises
+        ------
+        KeyError
+            The ``two`` pattern is missing
+        ValueError
+            A pattern is not of the form ``{0}<separator>{1}``
+        """
+        separators = {
+            name: pattern_separator(patterns[name])
+            for name in PATTERN_NAMES
+            if patterns.get(name)
+        }
+        return cls(
+            two=separators["two"],
+            start=separators.get("start", DEFAULT_SEPARATOR),
+            middle=separators.get("middle", DEFAULT_SEPARATOR),
+            end=separators.get("end"),
+        )
+
+    def __call__(self, value: Iterable[Any]) -> str:
+        """
+        Join the items, converting them to strings
+
+        Parameters
+        ----------
+        value : Iterable[Any]
+            The items. Any iterable works, including generators
+
+        Returns
+        -------
+        str
+            The joined list
+        """
+        items = value if type(value) is list else list(value)
+        count = len(items)
+        if count > 2:
+            return "".join(self._chunks(items, count))
+        elif count == 2:
+            return str(items[0]) + self.two + str(items[1])
+        elif count == 1:
+            return str(items[0])
+        return ""
+
+    def _chunks(self, items: list, count: int):
+        """
+        Yield the items and separators of a list of more than two items
+        """
+        yield str(items[0])
+        yield self.start
+        middle = self.middle
+        for index in range(1, count - 1):
+            if index > 1:
+                yield middle
+            yield str(items[index])
+        yield self.end
+        yield str(items[-1])
@@ -0,0 +1,361 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import re
+from json import JSONDecodeError
+from json.decoder import scanstring
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .compact import CompactLanguage, CompactTable, KeyStore
+from .plural import CATEGORIES, PluralForms
+
+PathLike = Union[str, os.PathLike]
+# A catalog file, or a ``(prefix, file)`` pair to put its keys under a group
+Source = Union[PathLike, Tuple[str, PathLike]]
+
+YAML_EXTENSIONS = (".yaml", ".yml")
+CHUNK_SIZE = 1 << 16
+
+# Parser events
+START = "start"
+END = "end"
+VALUE = "value"
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_SCALAR = re.compile(r"(-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?|true|false|null)")
+_LITERALS = {"true": True, "false": False, "null": None}
+
+
+class _JSONReader:
+    """
+    Incremental JSON tokenizer over a text file, keeping only the unread
+    part of the current chunk in memory
+    """
+
+    def __init__(self, file: IO[str], chunk_size: int) -> None:
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def error(self, message: str) -> JSONDecodeError:
+        return JSONDecodeError(message, self.buffer, self.pos)
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, "" at the end"""
+        while True:
+            buffer, pos = self.buffer, self.pos
+            if pos < len(buffer):
+                char = buffer[pos]
+                if char not in " \t\n\r":
+                    return char
+                self.pos = pos = _WHITESPACE.match(buffer, pos).end()
+                if pos < len(buffer):
+                    return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expecting {char!r}")
+        self.pos += 1
+
+    def string(self) -> str:
+        while True:
+            try:
+                value, end = scanstring(self.buffer, self.pos + 1)
+            except JSONDecodeError:
+                # Possibly cut by the end of the chunk
+                if self._fill():
+                    continue
+                raise
+            self.pos = end
+            return value
+
+    def scalar(self) -> Any:
+        while True:
+            match = _SCALAR.match(self.buffer, self.pos)
+            # A match reaching the end of the chunk may go on in the next one
+            if match is not None and (match.end() < len(self.buffer) or self.eof):
+                break
+            if not self._fill():
+                match = _SCALAR.match(self.buffer, self.pos)
+                break
+        if match is None:
+            raise self.error("Expecting value")
+        self.pos = match.end()
+        text = match.group()
+        if text in _LITERALS:
+            return _LITERALS[text]
+        return float(text) if "." in text or "e" in text or "E" in text else int(text)
+
+
+def _json_events(file: IO[str], chunk_size: int) -> Iterator[Tuple]:
+    """
+    Parse a JSON document into ``(START, key)``, ``(END,)`` and
+    ``(VALUE, key, value)`` events, where arrays are values of type list
+    """
+    reader = _JSONReader(file, chunk_size)
+    reader.expect("{")
+    yield (START, None)
+    # Number of members read so far in each open object
+    counts = [0]
+    while counts:
+        char = reader.peek()
+        if char == "}":
+            reader.pos += 1
+            counts.pop()
+            yield (END,)
+            continue
+        if counts[-1]:
+            reader.expect(",")
+            char = reader.peek()
+        counts[-1] += 1
+
+        if char != '"':
+            raise reader.error("Expecting property name enclosed in double quotes")
+        key = reader.string()
+        reader.expect(":")
+
+        char = reader.peek()
+        if char == "{":
+            reader.pos += 1
+            counts.append(0)
+            yield (START, key)
+        elif char == '"':
+            yield (VALUE, key, reader.string())
+        elif char == "[":
+            # Not a translation, report it as such without reading it
+            yield (VALUE, key, [])
+            return
+        else:
+            yield (VALUE, key, reader.scalar())
+
+    if reader.peek():
+        raise reader.error("Extra data")
+
+
+def _yaml_events(file: IO[str]) -> Iterator[Tuple]:
+    """
+    Parse a YAML document into the same events as :func:`_json_events`,
+    from the event stream of PyYAML. Scalars are read as strings.
+    """
+    try:
+        import yaml
+    except ImportError as exc:
+        raise ImportError("Loading YAML catalogs requires PyYAML (pip install pyyaml)") from exc
+
+    # Whether each open mapping expects a key next, and the pending key
+    expecting_key: List[bool] = []
+    key: Optional[str] = None
+    for event in yaml.parse(file, Loader=yaml.SafeLoader):
+        if isinstance(event, yaml.MappingStartEvent):
+            if expecting_key and expecting_key[-1]:
+                raise TypeError("Only strings can be used as translation keys")
+            yield (START, key)
+            if expecting_key:
+                expecting_key[-1] = True
+            expecting_key.append(True)
+        elif isinstance(event, yaml.MappingEndEvent):
+            expecting_key.pop()
+            yield (END,)
+        elif isinstance(event, yaml.ScalarEvent):
+            if not expecting_key:
+                raise TypeError("A catalog must be a mapping")
+            if expecting_key[-1]:
+                key = event.value
+                expecting_key[-1] = False
+            else:
+                yield (VALUE, key, event.value)
+                expecting_key[-1] = True
+        elif isinstance(event, (yaml.SequenceStartEvent, yaml.AliasEvent)):
+            yield (VALUE, key, [])
+            return
+
+
+def _open_events(path: PathLike, chunk_size: int) -> Iterator[Tuple]:
+    with open(path, encoding="utf-8") as file:
+        if os.fspath(path).lower().endswith(YAML_EXTENSIONS):
+            yield from _yaml_events(file)
+        else:
+            yield from _json_events(file, chunk_size)
+
+
+def stream_translations(source: Source, chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    Read a JSON or YAML catalog incrementally, yielding its translations as
+    ``(dotted key, value)`` pairs without building the nested dict.
+
+    Values are strings, or :class:`PluralForms` for groups of plural forms
+    (whose forms are also yielded on their own, as ``key.one`` and so on).
+    Pairs come in file order, except that plural forms are yielded once
+    their group ends.
+
+    Parameters
+    ----------
+    source : Union[PathLike, Tuple[str, PathLike]]
+        The file, read as YAML if its extension is ``.yaml`` or ``.yml``,
+        or a ``(prefix, file)`` pair to put every key under ``prefix``
+    chunk_size : int, optional
+        Characters read at a time from JSON files, by default 65536
+
+    Yields
+    ------
+    Tuple[str, Any]
+        The dotted key and its translation
+
+    Raises
+    ------
+    TypeError
+        A translation is neither a string nor a nested group
+    json.JSONDecodeError
+        The JSON is malformed
+    """
+    if isinstance(source, tuple):
+        prefix, path = source
+        prefix += "."
+    else:
+        prefix, path = "", source
+
+    # Dotted path of each open group, and its forms while it may still
+    # turn out to be plural forms (None once it cannot)
+    paths: List[str] = []
+    forms: List[Optional[Dict[str, str]]] = []
+    for event in _open_events(path, chunk_size):
+        kind = event[0]
+        if kind is START:
+            key = event[1]
+            if forms:
+                # A group holding groups is not plural forms
+                yield from _flush(paths, forms)
+            paths.append(prefix if key is None else f"{paths[-1]}{key}.")
+            forms.append({})
+        elif kind is END:
+            path_prefix = paths.pop()
+            group = forms.pop()
+            if group and "other" in group:
+                yield (path_prefix[:-1], PluralForms(group))
+            if group:
+                for key, value in group.items():
+                    yield (path_prefix + key, value)
+        else:
+            _, key, value = event
+            if not isinstance(value, str):
+                raise TypeError(
+                    f"Translation {paths[-1]}{key} must be a string, not {type(value).__name__}")
+            group = forms[-1]
+            if group is not None and key in CATEGORIES:
+                group[key] = value
+                continue
+            if group is not None:
+                yield from _flush(paths, forms)
+            yield (paths[-1] + key, value)
+
+
+def _flush(paths: List[str], forms: List[Optional[Dict[str, str]]]) -> Iterator[Tuple[str, Any]]:
+    """
+    Give up on the innermost group being plural forms, yielding the forms
+    held so far as ordinary translations
+    """
+    group = forms[-1]
+    forms[-1] = None
+    if group:
+        for name, value in group.items():
+            yield (paths[-1] + name, value)
+
+
+def load_language(
+    name: str,
+    code: str,
+    *sources: Source,
+    store: Optional[KeyStore] = None,
+    plural_rules: Optional[Dict[str, str]] = None,
+    chunk_size: int = CHUNK_SIZE
+) -> CompactLanguage:
+    """
+    Build a :class:`CompactLanguage` straight from JSON or YAML catalog
+    files, streaming them into its table instead of loading them into a
+    nested dict first.
+
+    Several files can be given, for example one per feature. They are
+    merged in order, keys of later files replacing those of earlier ones.
+    :func:`I18n.reload` and :func:`I18n.watch` read them all again, into
+    the same store.
+
+        >>> french = load_language(
+                "French", "fr", "locales/fr/common.json", ("music", "locales/fr/music.yaml"))
+        >>> french.get_text("music.play")
+
+    Parameters
+    ----------
+    name : str
+        The name of the language
+    code : str
+        The locale code of the language
+    *sources : Union[PathLike, Tuple[str, PathLike]]
+        The catalog files, or ``(prefix, file)`` pairs to put the keys of a
+        file under a group
+
+        .. seealso :: :func:`stream_translations`
+    store : KeyStore, optional
+        The store to share with other languages, by default a new one
+    plural_rules : Dict[str, str], optional
+        CLDR plural rules by category, by default None (the built-in rules
+        for the locale code)
+    chunk_size : int, optional
+        Characters read at a time from JSON files, by default 65536
+
+    Returns
+    -------
+    CompactLanguage
+        The language
+
+    Raises
+    ------
+    TypeError
+        A translation is neither a string nor a nested group
+    json.JSONDecodeError
+        A JSON file is malformed
+    """
+    if store is None:
+        store = KeyStore()
+
+    values: Dict[int, Any] = {}
+    key_id = store.key_id
+    share = store.share
+    for source in sources:
+        for key, value in stream_translations(source, chunk_size):
+            values[key_id(key)] = share(value)
+
+    language = CompactLanguage(
+        name, code, CompactTable.from_ids(values, store), store, plural_rules=plural_rules)
+    # Read again by I18n.reload and I18n.watch
+    language._sources = sources
+    return language
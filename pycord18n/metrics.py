@@ -0,0 +1,149 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+import bisect
+import random
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Optional, Sequence
+
+# Upper bounds of the latency histogram buckets, in seconds
+DEFAULT_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 1e-3, float("inf")
+)
+
+HIT = "hit"
+FALLBACK = "fallback"
+MISSING = "missing"
+
+
+class Metrics:
+    """
+    Lookup statistics of an :class:`I18n` instance, enabled with
+    :func:`I18n.enable_metrics`.
+
+    Only sampled lookups are recorded, so counts should be divided by
+    :attr:`sample_rate` to estimate the real totals.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        callback: Optional[Callable[[str, str, str, float], Any]] = None
+    ) -> None:
+        """
+        Initialize the metrics.
+
+        Parameters
+        ----------
+        sample_rate : float, optional
+            Fraction of lookups recorded, by default 1.0 (all of them)
+        buckets : Sequence[float], optional
+            Upper bounds of the latency histogram buckets in seconds, by
+            default :data:`DEFAULT_BUCKETS`
+        callback : Callable[[str, str, str, float], Any], optional
+            Called for every recorded lookup with the locale, the key, the
+            outcome (``"hit"``, ``"fallback"`` or ``"missing"``) and the
+            latency in seconds, for example to update Prometheus metrics
+        """
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+
+        self.sample_rate = sample_rate
+        self.buckets = tuple(sorted(buckets))
+        if self.buckets[-1] != float("inf"):
+            self.buckets += (float("inf"),)
+        self.callback = callback
+        self._lock = threading.Lock()
+        self.reset()
+
+    def should_sample(self) -> bool:
+        """Whether the next lookup should be recorded"""
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def record(self, locale: str, key: str, outcome: str, seconds: float) -> None:
+        """
+        Record one lookup
+
+        Parameters
+        ----------
+        locale : str
+            The requested locale
+        key : str
+            The requested key
+        outcome : str
+            ``"hit"``, ``"fallback"`` or ``"missing"``
+        seconds : float
+            How long the lookup took
+        """
+        with self._lock:
+            self._lookups[locale, key] += 1
+            if outcome == FALLBACK:
+                self._fallbacks[locale, key] += 1
+            elif outcome == MISSING:
+                self._missing[locale, key] += 1
+
+            self._latency_counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self._latency_sum += seconds
+
+        if self.callback is not None:
+            self.callback(locale, key, outcome, seconds)
+
+    def reset(self) -> None:
+        """
+        Forget everything recorded so far
+        """
+        with self._lock:
+            self._lookups: Counter = Counter()
+            self._fallbacks: Counter = Counter()
+            self._missing: Counter = Counter()
+            self._latency_counts = [0] * len(self.buckets)
+            self._latency_sum = 0.0
+
+    @staticmethod
+    def _by_locale(counter: Counter) -> Dict[str, Dict[str, int]]:
+        result: Dict[str, Dict[str, int]] = {}
+        for (locale, key), count in counter.items():
+            result.setdefault(locale, {})[key] = count
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a JSON serializable copy of the recorded statistics
+
+        Returns
+        -------
+        Dict[str, Any]
+            ``lookups``, ``fallbacks`` and ``missing`` counts as
+            ``{locale: {key: count}}``, the ``latency`` histogram (bucket
+            upper bounds, counts per bucket, sum and count) and the
+            ``sample_rate``
+        """
+        with self._lock:
+            return {
+                "sample_rate": self.sample_rate,
+                "lookups": self._by_locale(self._lookups),
+                "fallbacks": self._by_locale(self._fallbacks),
+                "missing": self._by_locale(self._missing),
+                "latency": {
+                    "buckets": list(self.buckets),
+                    "counts": list(self._latency_counts),
+                    "sum": self._latency_sum,
+                    "count": sum(self._latency_counts),
+                },
+            }
@@ -0,0 +1,293 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from decimal import Decimal
+from typing import Callable, Dict, Optional, Tuple, Union
+
+Number = Union[int, float, Decimal, str]
+PluralRule = Callable[[Number], str]
+
+CATEGORIES = ("zero", "one", "two", "few", "many", "other")
+
+# CLDR plural rules for cardinals, by language. Languages that are not
+# listed, such as Japanese or Chinese, only use "other".
+RULES: Dict[str, Dict[str, str]] = {
+    "en": {"one": "i = 1 and v = 0"},
+    "fr": {"one": "i = 0,1"},
+    "pt": {"one": "i = 0..1"},
+    "pt-PT": {"one": "i = 1 and v = 0"},
+    "hi": {"one": "i = 0 or n = 1"},
+    "bg": {"one": "n = 1"},
+    "el": {"one": "n = 1"},
+    "hu": {"one": "n = 1"},
+    "tr": {"one": "n = 1"},
+    "ru": {
+        "one": "v = 0 and i % 10 = 1 and i % 100 != 11",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14",
+        "many": "v = 0 and i % 10 = 0 or v = 0 and i % 10 = 5..9 or v = 0 and i % 100 = 11..14",
+    },
+    "pl": {
+        "one": "i = 1 and v = 0",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14",
+        "many": "v = 0 and i != 1 and i % 10 = 0..1 or v = 0 and i % 10 = 5..9 or v = 0 and i % 100 = 12..14",
+    },
+    "cs": {"one": "i = 1 and v = 0", "few": "i = 2..4 and v = 0", "many": "v != 0"},
+    "hr": {
+        "one": "v = 0 and i % 10 = 1 and i % 100 != 11 or f % 10 = 1 and f % 100 != 11",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14 or f % 10 = 2..4 and f % 100 != 12..14",
+    },
+    "lt": {
+        "one": "n % 10 = 1 and n % 100 != 11..19",
+        "few": "n % 10 = 2..9 and n % 100 != 11..19",
+        "many": "f != 0",
+    },
+    "ro": {"one": "i = 1 and v = 0", "few": "v != 0 or n = 0 or n != 1 and n % 100 = 1..19"},
+    "he": {"one": "i = 1 and v = 0 or i = 0 and v != 0", "two": "i = 2 and v = 0"},
+    "ar": {
+        "zero": "n = 0",
+        "one": "n = 1",
+        "two": "n = 2",
+        "few": "n % 100 = 3..10",
+        "many": "n % 100 = 11..99",
+    },
+    "ja": {}, "ko": {}, "zh": {}, "th": {}, "vi": {}, "id": {},
+}
+for _language in ("de", "nl", "sv", "da", "no", "nb", "fi", "it", "es", "et"):
+    RULES[_language] = RULES["en"]
+for _language, _same_as in (("uk", "ru"), ("sk", "cs"), ("sr", "hr"), ("bs", "hr")):
+    RULES[_language] = RULES[_same_as]
+
+_TOKEN = re.compile(r"\s*(\.\.|!=|=|%|,|[a-z]+|\d+)")
+_OPERANDS = "nivwft"
+
+
+class PluralForms(dict):
+    """
+    A group of translations holding the plural forms of one message, keyed
+    by CLDR plural category. It must at least have an ``other`` form.
+    """
+
+    @staticmethod
+    def is_plural(value: object) -> bool:
+        """
+        Whether a group of translations is a set of plural forms
+
+        Parameters
+        ----------
+        value : object
+            The translation value
+
+        Returns
+        -------
+        bool
+            True for dicts only keyed by plural categories, including ``other``
+        """
+        return (
+            isinstance(value, dict)
+            and "other" in value
+            and all(key in CATEGORIES for key in value)
+        )
+
+
+def plural_operands(value: Number) -> Tuple[Number, int, int, int, int, int]:
+    """
+    Get the CLDR plural operands ``n, i, v, w, f, t`` of a number
+
+    Parameters
+    ----------
+    value : Number
+        The number. Strings and decimals keep their visible fraction digits,
+        so ``"1.0"`` has ``v = 1``
+
+    Returns
+    -------
+    Tuple
+        The operands
+    """
+    if type(value) is int:
+        value = abs(value)
+        return value, value, 0, 0, 0, 0
+
+    text = str(value).lstrip("-")
+    if "e" in text.lower():
+        text = format(Decimal(text), "f")
+    integer, _, fraction = text.partition(".")
+    i = int(integer or 0)
+    if not fraction:
+        return i, i, 0, 0, 0, 0
+
+    trimmed = fraction.rstrip("0")
+    n = abs(Decimal(text))
+    return n, i, len(fraction), len(trimmed), int(fraction), int(trimmed or 0)
+
+
+def _compile_condition(condition: str) -> str:
+    """
+    Translate a CLDR plural condition into a Python expression over the
+    operands
+    """
+    tokens = _TOKEN.findall(condition)
+    if "".join(tokens) != re.sub(r"\s+", "", condition):
+        raise ValueError(f"Invalid plural condition {condition!r}")
+
+    position = 0
+
+    def take(expected=None):
+        nonlocal position
+        if position >= len(tokens):
+            raise ValueError(f"Unexpected end of plural condition {condition!r}")
+        token = tokens[position]
+        if expected is not None and token != expected:
+            raise ValueError(f"Expected {expected!r} in plural condition {condition!r}")
+        position += 1
+        return token
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def relation():
+        operand = take()
+        if operand not in _OPERANDS and operand != "e":
+            raise ValueError(f"Unknown operand {operand!r} in {condition!r}")
+        # The compact decimal exponent is always 0 here
+        expression = "0" if operand == "e" else operand
+        if peek() == "%":
+            take()
+            expression = f"{expression} % {int(take())}"
+
+        negate = take() == "!="
+        checks = []
+        while True:
+            low = int(take())
+            if peek() == "..":
+                take()
+                high = int(take())
+                check = f"{low} <= {expression} <= {high}"
+                if operand == "n":
+                    # Ranges only match integers
+                    check = f"({check} and {expression} % 1 == 0)"
+                checks.append(check)
+            else:
+                checks.append(f"{expression} == {low}")
+            if peek() != ",":
+                break
+            take()
+
+        joined = " or ".join(checks)
+        return f"not ({joined})" if negate else f"({joined})"
+
+    def and_condition():
+        parts = [relation()]
+        while peek() == "and":
+            take()
+            parts.append(relation())
+        return " and ".join(parts)
+
+    parts = [and_condition()]
+    while peek() == "or":
+        take()
+        parts.append(and_condition())
+    if peek() is not None:
+        raise ValueError(f"Unexpected {peek()!r} in plural condition {condition!r}")
+
+    return "(" + ") or (".join(parts) + ")"
+
+
+def compile_plural_rule(rules: Dict[str, str]) -> PluralRule:
+    """
+    Compile CLDR plural rules into a function choosing the plural category
+    of a number. The rules are turned into Python code once, so choosing a
+    category does not interpret them again.
+
+        >>> rule = compile_plural_rule({"one": "i = 1 and v = 0"})
+        >>> rule(1), rule(2), rule("1.0")
+        ("one", "other", "other")
+
+    Parameters
+    ----------
+    rules : Dict[str, str]
+        Conditions by category, for example ``{"one": "i = 1 and v = 0"}``.
+        Samples after ``@`` are ignored. ``other`` is implied.
+
+    Returns
+    -------
+    PluralRule
+        Function taking a number and returning its category
+
+    Raises
+    ------
+    ValueError
+        A category or a condition is invalid
+    """
+    lines = ["def rule(value):", "    n, i, v, w, f, t = operands(value)"]
+    for category in CATEGORIES:
+        if category not in rules or category == "other":
+            continue
+        condition = rules[category].split("@")[0].strip()
+        lines.append(f"    if {_compile_condition(condition)}:")
+        lines.append(f"        return {category!r}")
+    unknown = set(rules) - set(CATEGORIES)
+    if unknown:
+        raise ValueError(f"Unknown plural categories {sorted(unknown)}")
+    lines.append("    return 'other'")
+
+    namespace = {"operands": plural_operands}
+    exec(compile("\n".join(lines), "<plural rule>", "exec"), namespace)
+    return namespace["rule"]
+
+
+_compiled: Dict[str, PluralRule] = {}
+
+
+def get_plural_rule(locale: str, rules: Optional[Dict[str, str]] = None) -> PluralRule:
+    """
+    Get the compiled plural rule of a locale
+
+    Parameters
+    ----------
+    locale : str
+        The locale code. Unknown regional locales use the rules of their
+        language, and unknown languages use the English rules.
+    rules : Dict[str, str], optional
+        Custom CLDR rules to compile instead, by default None
+
+    Returns
+    -------
+    PluralRule
+        Function taking a number and returning its category
+    """
+    if rules is not None:
+        return compile_plural_rule(rules)
+
+    code = locale.replace("_", "-")
+    while code not in RULES and "-" in code:
+        code = code.rpartition("-")[0]
+    if code not in RULES:
+        code = "en"
+
+    rule = _compiled.get(code)
+    if rule is None:
+        # Locales sharing the same rules share the compiled function too
+        for other, compiled in _compiled.items():
+            if RULES[other] is RULES[code]:
+                rule = compiled
+                break
+        else:
+            rule = compile_plural_rule(RULES[code])
+        _compiled[code] = rule
+    return rule
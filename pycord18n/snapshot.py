@@ -0,0 +1,205 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .catalog import compile_catalog
+from .i18n import SERVED_SEPARATOR, I18n, InvalidLocaleError, Namespace
+from .language import Language, SafeDict
+
+# Languages as (name, code, translations, plural rules), with the fallback
+# settings and, for a namespace, its name and the payload of its instance:
+# enough to build the instance again in a worker process
+_Payload = Tuple[
+    List[Tuple[str, str, Dict[str, Any], Optional[Dict[str, str]]]],
+    str, Dict[str, Tuple[str, ...]], bool, Optional[Tuple[str, Any]]
+]
+
+# The instance rebuilt in each worker process
+_worker_i18n: Optional[I18n] = None
+
+
+def _payload(i18n: I18n) -> _Payload:
+    languages = []
+    for language in i18n._languages.values():
+        translations = language.translations
+        if not isinstance(translations, dict):
+            # Catalogs and compact tables are flat mappings
+            translations = dict(translations)
+        languages.append((language.name, language.code, translations, language._plural_rules))
+    parent = None
+    if isinstance(i18n, Namespace):
+        parent = (i18n.name, _payload(i18n._root))
+    return languages, i18n._fallback, i18n._fallbacks, i18n._derive_parents, parent
+
+
+def _build(payload: _Payload) -> I18n:
+    languages, fallback, fallbacks, derive_parents, parent = payload
+    languages = [
+        Language(name, code, translations, plural_rules)
+        for name, code, translations, plural_rules in languages
+    ]
+    if parent is not None:
+        name, root = parent
+        return _build(root).add_namespace(name, languages)
+    return I18n(languages, fallback, fallbacks=fallbacks, derive_parents=derive_parents)
+
+
+def _init_worker(payload: _Payload) -> None:
+    global _worker_i18n
+    _worker_i18n = _build(payload)
+
+
+def _render_worker(locale: str) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+    return _render_locale(_worker_i18n, locale)
+
+
+def _render_locale(i18n: I18n, locale: str) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+    """
+    Render a locale, with the locale serving each key served by another
+    """
+    rendered = render_static(i18n, locale)
+    table = i18n._get_table(locale)
+    served = {
+        key: table[key].code
+        for key in rendered
+        if key in table and table[key].code != locale
+    }
+    return locale, rendered, served
+
+
+def render_static(i18n: I18n, locale: str) -> Dict[str, str]:
+    """
+    Render every translation of a locale that needs no parameters,
+    including fallbacks and nested translations
+
+    Parameters
+    ----------
+    i18n : I18n
+        The instance
+    locale : str
+        The locale
+
+    Returns
+    -------
+    Dict[str, str]
+        The rendered strings by key
+
+    Raises
+    ------
+    InvalidLocaleError
+        If the locale does not exist on the instance
+    """
+    missing = []
+
+    class Recorder(SafeDict):
+        def __missing__(self, key):
+            missing.append(key)
+            return super().__missing__(key)
+
+    rendered = {}
+    for key, language in i18n._get_table(locale).items():
+        if not isinstance(language._get_translation_from_key(key, raise_on_empty=False), str):
+            # Groups, and plural forms which need a count
+            continue
+        try:
+            text = language.get_text(key, safedict=Recorder)
+        except (KeyError, IndexError, ValueError, AttributeError, TypeError):
+            # Positional or attribute fields need parameters too
+            missing.clear()
+            continue
+        if missing:
+            missing.clear()
+            continue
+        rendered[key] = text
+    return rendered
+
+
+def prerender(
+    i18n: I18n,
+    path: Union[str, os.PathLike],
+    locales: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None
+) -> int:
+    """
+    Render every translation needing no parameters, in every locale, and
+    write them to a snapshot file that :func:`I18n.load_snapshot` serves.
+
+    Locales are rendered in parallel on a process pool, each worker
+    building the languages again from their translations, together with
+    the instance of a :class:`pycord18n.i18n.Namespace`. Subclasses of
+    :class:`Language` are therefore rendered as plain languages.
+
+    The snapshot is a catalog (see :func:`pycord18n.catalog.compile_catalog`)
+    keyed by ``<locale>.<key>``, so it is memory mapped when loaded and
+    shared by processes on the same machine.
+
+    Parameters
+    ----------
+    i18n : I18n
+        The instance
+    path : Union[str, os.PathLike]
+        Where to write the snapshot
+    locales : Iterable[str], optional
+        The locales to render, by default every locale of the instance
+    max_workers : int, optional
+        Number of worker processes, by default the number of CPUs. With 1,
+        locales are rendered in this process.
+
+    Returns
+    -------
+    int
+        The number of strings written
+
+    Raises
+    ------
+    InvalidLocaleError
+        If one of the given locales does not exist on the instance
+    """
+    if locales is None:
+        locales = list(i18n._chains)
+    else:
+        locales = list(locales)
+        for locale in locales:
+            if locale not in i18n._chains:
+                raise InvalidLocaleError(f"Given locale `{locale}` does not exist!", locale=locale)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(locales))
+
+    if max_workers <= 1:
+        results = [_render_locale(i18n, locale) for locale in locales]
+    else:
+        with ProcessPoolExecutor(
+            max_workers, initializer=_init_worker, initargs=(_payload(i18n),)
+        ) as executor:
+            results = list(executor.map(_render_worker, locales))
+
+    snapshot = {}
+    count = 0
+    for locale, rendered, served in results:
+        for key, text in rendered.items():
+            snapshot[f"{locale}.{key}"] = text
+        count += len(rendered)
+        # Read by metrics to tell fallbacks apart
+        for key, code in served.items():
+            snapshot[f"{locale}{SERVED_SEPARATOR}{key}"] = code
+    compile_catalog(snapshot, path)
+    return count
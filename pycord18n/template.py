@@ -0,0 +1,219 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+from string import Formatter
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from .formatting import NAMED_FORMATS
+
+_parse = Formatter().parse
+
+_CONVERTERS = {
+    None: None,
+    "r": repr,
+    "s": str,
+    "a": ascii,
+}
+
+
+def _field_names(parsed: List[Tuple[str, Optional[str], Optional[str], Optional[str]]]) -> FrozenSet[str]:
+    """
+    Collect the mapping keys a parsed format string will look up, including
+    those used in nested format specs
+    """
+    names = set()
+    for _, field_name, format_spec, _ in parsed:
+        if field_name is None:
+            continue
+
+        name = field_name.partition(".")[0].partition("[")[0]
+        if name and not name.isdigit():
+            names.add(name)
+
+        if format_spec and "{" in format_spec:
+            try:
+                names.update(_field_names(list(_parse(format_spec))))
+            except ValueError:
+                pass
+
+    return frozenset(names)
+
+
+class _NamedFormatter(Formatter):
+    """
+    Formatter applying named format specs, for the templates that fall
+    back to the standard formatting
+    """
+
+    def __init__(self, formatters: Dict[str, Callable[[Any], str]]) -> None:
+        self.formatters = formatters
+
+    def format_field(self, value: Any, format_spec: str) -> Any:
+        formatter = self.formatters.get(format_spec)
+        if formatter is not None:
+            return formatter(value)
+        return super().format_field(value, format_spec)
+
+
+class Template:
+    """
+    A translation string that has been parsed once into literal chunks and
+    placeholder slots.
+
+    Rendering a template is equivalent to calling :func:`str.format_map`
+    on the source string with the same mapping, but the string is not
+    parsed again on every call.
+
+    Only plain ``{name}`` placeholders (optionally with a conversion and a
+    static format spec) are compiled. Anything else, such as attribute or
+    index access, positional fields or nested format specs, makes the whole
+    template fall back to :func:`str.format_map` so that the output and the
+    errors raised stay exactly the same. Named format specs are still
+    applied to such fields.
+
+    :attr:`names` holds every key the template will look up in the mapping,
+    so callers only need to resolve those.
+
+    Placeholders whose format spec is one of
+    :data:`pycord18n.formatting.NAMED_FORMATS`, as in ``{count:number}``,
+    are rendered by the formatters given to :func:`render`.
+    """
+
+    __slots__ = ("source", "names", "uses_formatters", "_chunks", "_slots", "_static", "_fallback")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self._chunks: List[str] = []
+        self._slots: Tuple[Tuple[int, str, Any, str, bool], ...] = ()
+        self._static: Optional[str] = None
+        self._fallback = False
+        self.names: FrozenSet[str] = frozenset()
+        self.uses_formatters = False
+
+        try:
+            parsed = list(_parse(source))
+        except ValueError:
+            # Malformed, let format_map raise the error when rendering
+            self._fallback = True
+            return
+
+        self.names = _field_names(parsed)
+
+        chunks = []
+        slots = []
+        for literal, field_name, format_spec, conversion in parsed:
+            if literal:
+                chunks.append(literal)
+            if field_name is None:
+                continue
+
+            if (
+                not field_name
+                or field_name.isdigit()
+                or "." in field_name
+                or "[" in field_name
+                or "{" in format_spec
+                or conversion not in _CONVERTERS
+            ):
+                self._fallback = True
+                # Named specs still apply, to fields such as {user.joined:date}
+                self.uses_formatters = any(
+                    field is not None and spec in NAMED_FORMATS
+                    for _, field, spec, _ in parsed
+                )
+                return
+
+            named = format_spec in NAMED_FORMATS
+            self.uses_formatters = self.uses_formatters or named
+            slots.append((len(chunks), field_name,
+                          _CONVERTERS[conversion], format_spec, named))
+            chunks.append("")
+
+        self._chunks = chunks
+        self._slots = tuple(slots)
+        if not slots:
+            # Still joined, since escaped braces differ from the source
+            self._static = "".join(chunks)
+
+    def __repr__(self) -> str:
+        return f"<Template {self.source!r}>"
+
+    @property
+    def is_static(self) -> bool:
+        """Whether the template has no placeholders at all"""
+        return self._static is not None
+
+    def render(
+        self,
+        mapping: Mapping[str, Any],
+        formatters: Optional[Dict[str, Callable[[Any], str]]] = None
+    ) -> str:
+        """
+        Fill the placeholder slots from ``mapping``
+
+        Parameters
+        ----------
+        mapping : Mapping[str, Any]
+            Values for the placeholders. Missing keys are handled by the
+            mapping itself, for example :cls:`SafeDict` leaves them as
+            ``{name}``
+        formatters : Dict[str, Callable[[Any], str]], optional
+            Formatters for named format specs, by default None (such specs
+            are passed to :func:`format` like any other)
+
+        Returns
+        -------
+        str
+            The rendered string
+        """
+        if self._fallback:
+            if self.uses_formatters and formatters is not None:
+                return _NamedFormatter(formatters).vformat(self.source, (), mapping)
+            return self.source.format_map(mapping)
+
+        if self._static is not None:
+            return self._static
+
+        chunks = self._chunks[:]
+        for index, name, converter, format_spec, named in self._slots:
+            value = mapping[name]
+            if converter is not None:
+                value = converter(value)
+            if named and formatters is not None:
+                value = formatters[format_spec](value)
+            elif format_spec or type(value) is not str:
+                value = format(value, format_spec)
+            chunks[index] = value
+
+        return "".join(chunks)
+
+
+def compile_template(source: str) -> Template:
+    """
+    Compile a translation string into a :class:`Template`
+
+    Parameters
+    ----------
+    source : str
+        The translation string
+
+    Returns
+    -------
+    Template
+        The compiled template
+    """
+    return Template(source)
@@ -0,0 +1,289 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+from string import Formatter
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .i18n import I18n, InvalidLocaleError
+from .language import Language
+from .plural import PluralForms
+from .template import _field_names
+
+_parse = Formatter().parse
+_NO_NAMES: FrozenSet[str] = frozenset()
+
+# Top level groups holding settings rather than translations
+SETTINGS_GROUPS = ("_formats",)
+
+
+class LocaleReport:
+    """
+    Validation results of one locale, compared with the fallback locale.
+
+    Attributes
+    ----------
+    locale : str
+        The locale code
+    total : int
+        Number of translation keys of the fallback locale
+    missing : List[str]
+        Keys of the fallback locale this locale does not translate
+    extra : List[str]
+        Keys this locale translates that the fallback locale does not
+    placeholders : Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]]
+        Keys whose placeholders differ from the fallback locale's, with the
+        ``(expected, found)`` placeholder names
+    malformed : List[str]
+        Keys whose string is not a valid format string
+    cycles : List[Tuple[str, ...]]
+        Translations referencing each other through placeholders, such as
+        ``("a", "b")`` when ``a`` uses ``{b}`` and ``b`` uses ``{a}``
+    """
+
+    __slots__ = ("locale", "total", "missing", "extra", "placeholders", "malformed", "cycles")
+
+    def __init__(self, locale: str, total: int) -> None:
+        self.locale = locale
+        self.total = total
+        self.missing: List[str] = []
+        self.extra: List[str] = []
+        self.placeholders: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        self.malformed: List[str] = []
+        self.cycles: List[Tuple[str, ...]] = []
+
+    def __repr__(self) -> str:
+        return f"<LocaleReport {self.locale} coverage={self.coverage:.1f}%>"
+
+    @property
+    def coverage(self) -> float:
+        """Percentage of the fallback locale's keys this locale translates"""
+        if not self.total:
+            return 100.0
+        return 100.0 * (self.total - len(self.missing)) / self.total
+
+    @property
+    def ok(self) -> bool:
+        """Whether no errors were found. Missing and extra keys are not errors."""
+        return not (self.placeholders or self.malformed or self.cycles)
+
+
+class ValidationReport:
+    """
+    Validation results of every locale of an :class:`I18n` instance, made
+    by :func:`validate`.
+
+    Attributes
+    ----------
+    fallback : str
+        The locale every other locale was compared with
+    locales : Dict[str, LocaleReport]
+        The report of each locale, including the fallback locale
+    """
+
+    __slots__ = ("fallback", "locales")
+
+    def __init__(self, fallback: str, locales: Dict[str, LocaleReport]) -> None:
+        self.fallback = fallback
+        self.locales = locales
+
+    def __repr__(self) -> str:
+        return f"<ValidationReport ok={self.ok} locales={len(self.locales)}>"
+
+    @property
+    def ok(self) -> bool:
+        """Whether no locale has errors"""
+        return all(report.ok for report in self.locales.values())
+
+    @property
+    def coverage(self) -> Dict[str, float]:
+        """Coverage percentage of each locale"""
+        return {locale: report.coverage for locale, report in self.locales.items()}
+
+    def summary(self) -> str:
+        """
+        Describe the report in a few lines per locale, for example to print
+        in CI logs
+
+        Returns
+        -------
+        str
+            The summary
+        """
+        lines = []
+        for locale, report in self.locales.items():
+            lines.append(
+                f"{locale}: {report.coverage:.1f}% coverage, {len(report.missing)} missing, "
+                f"{len(report.extra)} extra")
+            for key, (expected, found) in report.placeholders.items():
+                lines.append(
+                    f"  {key}: placeholders {sorted(found)} do not match {sorted(expected)}")
+            for key in report.malformed:
+                lines.append(f"  {key}: malformed format string")
+            for cycle in report.cycles:
+                lines.append(f"  cycle: {' -> '.join(cycle + cycle[:1])}")
+        return "\n".join(lines)
+
+
+def _translation_strings(language: Language) -> Dict[str, Any]:
+    """
+    Get the translation strings and plural forms of a language by dotted
+    key, without groups, settings and empty strings
+    """
+    index = language._get_index()
+    strings = {}
+    for key, value in index.items():
+        if type(value) is PluralForms:
+            if not value:
+                continue
+        elif not isinstance(value, str) or value == "":
+            continue
+        else:
+            parent, dot, _ = key.rpartition(".")
+            if dot and type(index.get(parent)) is PluralForms:
+                # A single plural form, checked with the others
+                continue
+        if key.partition(".")[0] in SETTINGS_GROUPS:
+            continue
+        strings[key] = value
+    return strings
+
+
+def _placeholders(value: Any, memo: Dict[str, Optional[FrozenSet[str]]]) -> Optional[FrozenSet[str]]:
+    """
+    Get the placeholder names of a string, or of every form of plural forms,
+    or None if a string is malformed. Each distinct string is parsed once.
+    """
+    sources = value.values() if type(value) is PluralForms else (value,)
+    names = _NO_NAMES
+    for source in sources:
+        if not isinstance(source, str):
+            continue
+        found = memo.get(source, memo)
+        if found is memo:
+            if "{" not in source and "}" not in source:
+                found = _NO_NAMES
+            else:
+                try:
+                    found = _field_names(list(_parse(source)))
+                except ValueError:
+                    found = None
+            memo[source] = found
+        if found is None:
+            return None
+        names = names | found if names else found
+    return names
+
+
+def _find_cycles(references: Dict[str, FrozenSet[str]]) -> List[Tuple[str, ...]]:
+    """
+    Find the cycles of a reference graph, each reported once starting from
+    its first key in iteration order
+    """
+    cycles = []
+    # 0 unvisited, 1 on the current path, 2 done
+    state = dict.fromkeys(references, 0)
+    for root in references:
+        if state[root]:
+            continue
+        path = [root]
+        state[root] = 1
+        stack = [iter(references[root])]
+        while stack:
+            for name in stack[-1]:
+                if name not in state:
+                    continue
+                if state[name] == 1:
+                    cycles.append(tuple(path[path.index(name):]))
+                elif state[name] == 0:
+                    state[name] = 1
+                    path.append(name)
+                    stack.append(iter(references[name]))
+                    break
+            else:
+                stack.pop()
+                state[path.pop()] = 2
+    return cycles
+
+
+def validate(i18n: I18n, locales: Optional[Iterable[str]] = None) -> ValidationReport:
+    """
+    Check the languages of an :class:`I18n` instance before serving them.
+
+    Every distinct translation string is parsed once, and each locale's
+    keys and placeholders are compared with the fallback locale's.
+    Placeholders naming another top level translation are followed to find
+    cycles.
+
+    Parameters
+    ----------
+    i18n : I18n
+        The instance to validate
+    locales : Iterable[str], optional
+        The locales to validate, by default every language of the instance
+
+    Returns
+    -------
+    ValidationReport
+        The results
+
+    Raises
+    ------
+    InvalidLocaleError
+        If one of the given locales has no language on this instance
+    """
+    languages = i18n._languages
+    fallback = i18n._fallback
+    if locales is None:
+        locales = list(languages)
+
+    fallback_language = languages[fallback]
+    expected_strings = _translation_strings(fallback_language)
+    memo: Dict[str, Optional[FrozenSet[str]]] = {}
+    expected = {key: _placeholders(value, memo) for key, value in expected_strings.items()}
+
+    reports = {}
+    for locale in locales:
+        if locale not in languages:
+            raise InvalidLocaleError(f"Given locale `{locale}` does not exist!", locale=locale)
+
+        language = languages[locale]
+        if language is fallback_language:
+            strings, placeholders = expected_strings, expected
+        else:
+            strings = _translation_strings(language)
+            placeholders = {key: _placeholders(value, memo) for key, value in strings.items()}
+
+        report = LocaleReport(locale, len(expected))
+        report.missing = [key for key in expected if key not in strings]
+        report.extra = [key for key in strings if key not in expected]
+
+        references = {}
+        for key, names in placeholders.items():
+            if names is None:
+                report.malformed.append(key)
+                continue
+            wanted = expected.get(key)
+            if wanted is not None and names != wanted:
+                report.placeholders[key] = (wanted, names)
+            if names and "." not in key:
+                # Only top level translations can be referenced
+                references[key] = names
+
+        report.cycles = _find_cycles(references)
+        reports[locale] = report
+
+    return ValidationReport(fallback, reports)
@@ -1,6 +1,18 @@
+from .test_cache import *
+from .test_catalog import *
+from .test_compact import *
 from .test_extension import *
+from .test_formatting import *
 from .test_i18n import *
 from .test_language import *
+from .test_lists import *
+from .test_loader import *
+from .test_metrics import *
+from .test_namespace import *
+from .test_plural import *
+from .test_snapshot import *
+from .test_template import *
+from .test_validation import *
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
\ No newline at end of file
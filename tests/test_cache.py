@@ -0,0 +1,54 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from pycord18n.cache import MISSING, RenderCache, make_key
+
+class CacheTesting(unittest.TestCase):
+    def test_lru_eviction(self):
+        cache = RenderCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("c", 3)
+        self.assertIs(cache.get("b"), MISSING)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.info(), (2, 1, 2, 2))
+
+    def test_ttl(self):
+        cache = RenderCache(2, ttl=-1)
+        cache.set("a", 1)
+        self.assertIs(cache.get("a"), MISSING)
+        self.assertEqual(len(cache), 0)
+
+    def test_make_key(self):
+        self.assertEqual(make_key("en", "hello", kwargs={}), ("en", "hello"))
+        self.assertNotEqual(make_key("en", kwargs={"a": 1}), make_key("en", kwargs={"a": True}))
+        self.assertEqual(
+            make_key("en", kwargs={"a": 1, "b": "x"}), make_key("en", kwargs={"b": "x", "a": 1}))
+        self.assertIsNone(make_key("en", kwargs={"a": ["x"]}))
+        self.assertNotEqual(make_key("en", kwargs={"a": 0.0}), make_key("en", kwargs={"a": -0.0}))
+        self.assertNotEqual(make_key("en", kwargs={"a": 1.5}), make_key("en", kwargs={"a": "1.5"}))
+        self.assertEqual(
+            make_key("en", kwargs={"a": float("nan")}), make_key("en", kwargs={"a": float("nan")}))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
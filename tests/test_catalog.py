@@ -0,0 +1,89 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import tempfile
+import unittest
+from pycord18n.catalog import Catalog, CatalogLanguage, compile_catalog
+from pycord18n.i18n import I18n
+from pycord18n.language import Language
+
+class CatalogTesting(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "fr.p18c")
+        compile_catalog({
+            "hello": "Bonjour, {place}!",
+            "place": "monde",
+            "empty": "",
+            "apples": {"one": "{count} pomme", "other": "{count} pommes"},
+            "errors": {
+                "perm": "Permission manquante",
+                "same": "monde"
+            }
+        }, self.path)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_catalog_mapping(self):
+        catalog = Catalog(self.path)
+        self.assertEqual(len(catalog), 8)
+        self.assertEqual(catalog["errors.perm"], "Permission manquante")
+        self.assertIn("place", catalog)
+        self.assertNotIn("errors", catalog)
+        self.assertEqual(
+            sorted(catalog.non_empty_keys()),
+            ["apples", "apples.one", "apples.other", "errors.perm", "errors.same", "hello", "place"])
+        with self.assertRaises(KeyError):
+            catalog["nope"]
+        catalog.close()
+
+    @unittest.skipIf(os.name != "posix", "POSIX permissions")
+    def test_permissions(self):
+        umask = os.umask(0o022)
+        try:
+            compile_catalog({"hello": "Bonjour"}, self.path)
+        finally:
+            os.umask(umask)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o644)
+
+    def test_catalog_language(self):
+        language = CatalogLanguage("French", "fr", self.path)
+        self.assertEqual(language.get_text("hello"), "Bonjour, monde!")
+        self.assertEqual(language.get_text("hello", place="tous"), "Bonjour, tous!")
+        with self.assertRaises(KeyError):
+            language.get_text("empty")
+        self.assertEqual(language.get_text("apples", count=2), "2 pommes")
+
+    def test_catalog_fallback(self):
+        i18n = I18n([
+            Language("English", "en", {"empty": "Empty", "bye": "Bye"}),
+            CatalogLanguage("French", "fr", self.path),
+        ], fallback="en")
+        self.assertEqual(i18n.get_text("empty", "fr"), "Empty")
+        self.assertEqual(i18n.get_text("errors.perm", "fr"), "Permission manquante")
+
+    def test_invalid_values(self):
+        with self.assertRaises(TypeError):
+            compile_catalog({"count": 3}, self.path)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,87 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from pycord18n.compact import CompactLanguage, KeyStore, compact
+from pycord18n.i18n import I18n
+from pycord18n.language import Language
+
+
+class CompactTesting(unittest.TestCase):
+    def setUp(self):
+        self.english, self.french = compact([
+            Language("English", "en", {
+                "hello": "Hello {name}",
+                "brand": "Acme",
+                "apples": {"one": "{count} apple", "other": "{count} apples"},
+                "menu": {"open": "Open", "close": "Close"},
+                "and_": "and",
+            }),
+            Language("French", "fr", {
+                "hello": "Bonjour {name}",
+                "brand": "Acme",
+                "menu": {"open": "Ouvrir", "close": "Close", "help": ""},
+            }),
+        ])
+
+    def test_shared_store(self):
+        store = self.english._store
+        self.assertIs(self.french._store, store)
+        self.assertEqual(
+            sorted(store.keys),
+            ["and_", "apples", "apples.one", "apples.other", "brand", "hello",
+             "menu.close", "menu.help", "menu.open"])
+        # Identical values are stored once
+        self.assertIs(self.english.translations["menu.close"], self.french.translations["menu.close"])
+
+        table = self.english.translations
+        self.assertEqual(len(table), 8)
+        self.assertNotIn("menu.help", table)
+        self.assertNotIn("menu", table)
+        self.assertEqual(sorted(self.french.translations.non_empty_keys()),
+                         ["brand", "hello", "menu.close", "menu.open"])
+
+    def test_get_text(self):
+        self.assertEqual(self.english.get_text("hello", name="Bob"), "Hello Bob")
+        self.assertEqual(self.english.get_text("apples", count=2), "2 apples")
+        self.assertEqual(self.english.get_text("menu.open"), "Open")
+        self.assertEqual(self.english.and_(["a", "b"]), "a and b")
+        with self.assertRaises(KeyError):
+            self.english.get_text("menu")
+
+        i18n = I18n([self.english, self.french], fallback="en")
+        self.assertEqual(i18n.get_text("menu.open", "fr"), "Ouvrir")
+        self.assertEqual(i18n.get_text("apples", "fr", count=1), "1 apple")
+
+        self.french.translations = {"hello": "Salut {name}"}
+        self.assertEqual(i18n.get_text("hello", "fr", name="Bob"), "Salut Bob")
+        self.assertEqual(i18n.get_text("menu.open", "fr"), "Open")
+
+    def test_slots(self):
+        language = CompactLanguage("English", "en", {"hello": "Hello"}, KeyStore())
+        with self.assertRaises(AttributeError):
+            language.anything = True
+        # Already compact in the same store
+        self.assertIs(compact([self.english], self.english._store)[0], self.english)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -18,8 +18,11 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import asyncio
 import unittest
+from types import SimpleNamespace
 
+import discord
 from discord.ext import commands
 
 from pycord18n.extension import I18nExtension, _
@@ -45,6 +48,8 @@ class I18nExtensionTesting(unittest.TestCase):
         self.assertEqual(_("hello"), "Hello")
         self.i18n.set_current_locale("fr")
         self.assertEqual(_("hello"), "Bonjour")
+        self.assertEqual(
+            I18nExtension.contextual_get_text_many(["hello", "english"]), ["Bonjour", "English"])
     
     def test_no_i18n_set(self):
         # Manually get rid of it
@@ -70,7 +75,169 @@ class I18nExtensionTesting(unittest.TestCase):
         ], bot=commands.Bot("!"), get_locale_func=get_locale, fallback="en")
 
         self.assertEqual(self.i18n.contextual_get_text("hello"), "Hello")
-    
+
+    def test_async_locale_cache(self):
+        calls = []
+
+        async def get_locale(ctx):
+            calls.append(ctx.author.id)
+            await asyncio.sleep(0)
+            return "fr"
+
+        i18n = I18nExtension([
+            Language("English", "en", {"hello": "Hello"}),
+            Language("French", "fr", {"hello": "Bonjour"}),
+        ], fallback="en")
+        ctx = SimpleNamespace(guild=SimpleNamespace(id=1), author=SimpleNamespace(id=2))
+
+        async def run():
+            i18n.init_bot(commands.Bot("!"), get_locale, locale_cache_size=16)
+            locales = await asyncio.gather(*(i18n.resolve_locale(ctx) for _ in range(5)))
+            self.assertEqual(locales, ["fr"] * 5)
+            # Single flight, then cached
+            self.assertEqual(calls, [2])
+            await i18n.resolve_locale(ctx)
+            self.assertEqual(calls, [2])
+
+            self.assertEqual(i18n.invalidate_locale(user_id=2), 1)
+            await i18n.resolve_locale(ctx)
+            self.assertEqual(calls, [2, 2])
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(run())
+        finally:
+            loop.close()
+
+    def test_locale_scope(self):
+        i18n = I18nExtension([
+            Language("English", "en", {"hello": "Hello"}),
+            Language("French", "fr", {"hello": "Bonjour"}),
+        ], fallback="en")
+
+        with i18n.locale_scope("fr"):
+            self.assertEqual(_("hello"), "Bonjour")
+            with i18n.locale_scope("en"):
+                self.assertEqual(_("hello"), "Hello")
+            self.assertEqual(_("hello"), "Bonjour")
+        self.assertEqual(i18n.get_current_locale(), "en")
+
+        @i18n.locale_scope(lambda locale: locale)
+        def greet(locale):
+            return _("hello")
+
+        self.assertEqual(greet("fr"), "Bonjour")
+        self.assertEqual(i18n.get_current_locale(), "en")
+
+        with self.assertRaises(TypeError):
+            with i18n.locale_scope(lambda: "fr"):
+                pass
+
+    def test_async_locale_scope_per_bot(self):
+        english = I18nExtension([Language("English", "en", {"hello": "Hello"})], fallback="en")
+        french = I18nExtension([Language("French", "fr", {"hello": "Bonjour"})], fallback="fr")
+
+        async def locale_of(user):
+            await asyncio.sleep(0)
+            return user
+
+        @english.locale_scope(locale_of)
+        async def in_english(user):
+            await asyncio.sleep(0)
+            return _("hello")
+
+        @french.locale_scope("fr")
+        async def in_french():
+            await asyncio.sleep(0)
+            # Tasks made inside the scope keep its locale and instance
+            task = asyncio.ensure_future(asyncio.sleep(0, _("hello")))
+            return _("hello"), await task
+
+        async def run():
+            bot = commands.Bot("!")
+            english.init_bot(bot)
+            self.assertIs(I18nExtension.for_bot(bot), english)
+
+            # The hooks set this bot's instance for the command only
+            ctx = SimpleNamespace(guild=None, author=SimpleNamespace(id=1))
+            await bot._before_invoke(ctx)
+            self.assertEqual(_("hello"), "Hello")
+            await bot._after_invoke(ctx)
+            self.assertEqual(_("hello"), "Bonjour")
+
+            results = await asyncio.gather(in_english("en"), in_french(), in_english("en"))
+            self.assertEqual(results, ["Hello", ("Bonjour", "Bonjour"), "Hello"])
+
+            async with french.locale_scope("fr"):
+                self.assertEqual(_("hello"), "Bonjour")
+            self.assertIs(I18nExtension.default_i18n_instance, french)
+
+            # One scope entered by concurrent tasks
+            shared = english.locale_scope("en")
+
+            async def reuse():
+                async with shared:
+                    await asyncio.sleep(0)
+                    with shared:
+                        await asyncio.sleep(0)
+                    return _("hello")
+
+            self.assertEqual(await asyncio.gather(reuse(), reuse(), reuse()), ["Hello"] * 3)
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(run())
+        finally:
+            loop.close()
+
+
+    def test_localize_commands(self):
+        i18n = I18nExtension([
+            Language("English", "en-US", {"commands": {
+                "ping": {"name": "ping", "description": "Ping the bot"},
+            }}),
+            Language("French", "fr", {"commands": {
+                "ping": {
+                    "description": "Tester le bot",
+                    "options": {"target": {
+                        "name": "cible",
+                        "choices": {"me": "moi"},
+                    }},
+                },
+                "music": {"play": {"description": "Jouer un morceau"}},
+            }}),
+            # Not a Discord locale
+            Language("Pirate", "en-PIRATE", {"commands": {"ping": {"name": "arr"}}}),
+        ], fallback="en-US")
+        bot = commands.Bot("!")
+
+        @bot.slash_command(name="ping", description="Ping the bot")
+        async def ping(ctx, target: discord.Option(str, "Who", choices=["me", "you"])):
+            pass
+
+        music = bot.create_group("music", "Music commands")
+
+        @music.command(description="Play a song")
+        async def play(ctx):
+            pass
+
+        i18n.init_bot(bot)
+        self.assertEqual(i18n.localize_commands(), 5)
+
+        self.assertEqual(ping.name_localizations, {"en-US": "ping"})
+        self.assertEqual(ping.description_localizations, {"en-US": "Ping the bot", "fr": "Tester le bot"})
+        target = ping.options[0]
+        self.assertEqual(target.name_localizations, {"fr": "cible"})
+        self.assertEqual(target.choices[0].name_localizations, {"fr": "moi"})
+        self.assertEqual(play.description_localizations, {"fr": "Jouer un morceau"})
+
+        # Memoized until the languages change
+        localizations = i18n.command_localizations()
+        self.assertIs(i18n.command_localizations(), localizations)
+        i18n.add_language(Language("German", "de", {"commands": {"ping": {"description": "Bot testen"}}}))
+        self.assertEqual(
+            i18n.command_localizations()["commands.ping.description"]["de"], "Bot testen")
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
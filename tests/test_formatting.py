@@ -0,0 +1,92 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import datetime
+import unittest
+from decimal import Decimal
+from pycord18n.formatting import DateFormatter, NumberFormatter
+from pycord18n.language import Language
+
+class FormattingTesting(unittest.TestCase):
+    def setUp(self) -> None:
+        self.english = Language("English", "en", {
+            "members": "{count:number} members",
+            "cooldown": "Try again {until:relative}",
+            "uptime": "Up for {uptime:duration}",
+            "joined": "Joined on {when:date}",
+            "padded": "{count:>5}",
+            "user_joined": "Joined on {user.joined:date}",
+            "first_count": "{counts[0]:number} members"
+        })
+        self.french = Language("French", "fr", {
+            "members": "{count:number} membres",
+            "cooldown": "Réessayez {until:relative}",
+            "_formats": {
+                "date": "%d/%m/%Y",
+                "future": "dans {0}",
+                "units": {
+                    "minute": {"one": "{count} minute", "other": "{count} minutes"},
+                    "second": {"one": "{count} seconde", "other": "{count} secondes"}
+                }
+            }
+        })
+
+    def test_number(self):
+        self.assertEqual(NumberFormatter(",", ".")(1234567.5), "1.234.567,5")
+        self.assertEqual(NumberFormatter()(Decimal("1234.50")), "1,234.50")
+        self.assertEqual(self.english.get_text("members", count=12345), "12,345 members")
+        self.assertEqual(self.french.get_text("members", count=12345), "12\u202f345 membres")
+
+    def test_date(self):
+        when = datetime.date(2021, 9, 1)
+        self.assertEqual(DateFormatter("%d/%m/%Y")(when), "01/09/2021")
+        self.assertEqual(self.english.get_text("joined", when=when), "Joined on 2021-09-01")
+
+    def test_duration_and_relative(self):
+        self.assertEqual(self.english.get_text("uptime", uptime=3725), "Up for 1 hour 2 minutes 5 seconds")
+        self.assertEqual(
+            self.english.get_text("uptime", uptime=datetime.timedelta(days=2)), "Up for 2 days")
+        self.assertEqual(self.english.get_text("cooldown", until=-90), "Try again 1 minute ago")
+        self.assertEqual(self.french.get_text("cooldown", until=30), "Réessayez dans 30 secondes")
+
+        until = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=5, seconds=30)
+        self.assertEqual(self.french.get_text("cooldown", until=until), "Réessayez dans 5 minutes")
+
+    def test_formatters_cached(self):
+        self.assertIs(self.english.get_formatters(), self.english.get_formatters())
+        self.english.translations = {"members": "{count:number}"}
+        self.assertEqual(self.english.get_text("members", count=1000), "1,000")
+
+    def test_missing_and_regular_specs(self):
+        self.assertEqual(self.english.get_text("members"), "{count} members")
+        self.assertEqual(self.english.get_text("padded", count=42), "   42")
+
+    def test_attribute_and_index_fields(self):
+        class User:
+            joined = datetime.date(2021, 9, 1)
+
+        self.assertEqual(
+            self.english.get_text("user_joined", user=User()), "Joined on 2021-09-01")
+        self.assertEqual(
+            self.english.get_text("first_count", counts=[12345]), "12,345 members")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
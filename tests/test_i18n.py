@@ -18,10 +18,13 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import asyncio
+import json
+import tempfile
 import unittest
 
-from pycord18n.i18n import I18n, InvalidLocaleError, InvalidTranslationKeyError
-from pycord18n.language import Language
+from pycord18n.i18n import I18n, InvalidLocaleError, InvalidTranslationKeyError, parent_locale
+from pycord18n.language import Language, LazyLanguage
 
 class I18nTesting(unittest.TestCase):
     def setUp(self) -> None:
@@ -48,6 +51,206 @@ class I18nTesting(unittest.TestCase):
         with self.assertRaises(InvalidTranslationKeyError):
             self.i18n.get_text("english", "fr", should_fallback=False)
     
+    def test_fallback_on_empty(self):
+        i18n = I18n([
+            Language("English", "en", {"english": "English"}),
+            Language("French", "fr", {"english": ""}),
+        ], fallback="en")
+        self.assertEqual(i18n.get_text("english", "fr"), "English")
+        with self.assertRaises(InvalidTranslationKeyError):
+            i18n.get_text("english", "fr", should_fallback=False)
+
+    def test_fallback_index(self):
+        i18n = I18n([
+            Language("English", "en", {"hello": "Hello"}),
+            Language("French", "fr", {}),
+        ], fallback=0)
+        self.assertEqual(i18n.get_text("hello", "fr"), "Hello")
+
+    def test_add_remove_language(self):
+        self.i18n.add_language(Language("German", "de", {"hello": "Hallo"}))
+        self.assertEqual(self.i18n.get_text("hello", "de"), "Hallo")
+        self.assertEqual(self.i18n.get_text("goodbye", "de"), "Goodbye")
+
+        self.i18n.remove_language("de")
+        with self.assertRaises(InvalidLocaleError):
+            self.i18n.get_text("hello", "de")
+        with self.assertRaises(ValueError):
+            self.i18n.remove_language("en")
+
+    def test_parent_locale(self):
+        self.assertEqual(parent_locale("zh-Hant-TW"), "zh-Hant")
+        self.assertEqual(parent_locale("pt_BR"), "pt")
+        self.assertIsNone(parent_locale("en"))
+
+    def test_fallback_chain(self):
+        i18n = I18n([
+            Language("English", "en", {"hello": "Hello", "bye": "Bye", "yes": "Yes"}),
+            Language("Portuguese", "pt", {"hello": "Olá", "bye": "Tchau"}),
+            Language("Brazilian Portuguese", "pt-BR", {"hello": "Oi"}),
+            Language("Spanish", "es", {"hello": "Hola"}),
+        ], fallback="en", fallbacks={"es-ES": ["es"]})
+        self.assertEqual(i18n.get_fallback_chain("pt-BR"), ("pt-BR", "pt", "en"))
+        self.assertEqual(i18n.get_text("hello", "pt-BR"), "Oi")
+        self.assertEqual(i18n.get_text("bye", "pt-BR"), "Tchau")
+        self.assertEqual(i18n.get_text("yes", "pt-BR"), "Yes")
+
+        # Locales with explicit fallbacks need no language of their own
+        self.assertEqual(i18n.get_fallback_chain("es-ES"), ("es", "en"))
+        self.assertEqual(i18n.get_text("hello", "es-ES"), "Hola")
+
+    def test_render_cache(self):
+        english = Language("English", "en", {"hello": "Hello, {name}"})
+        i18n = I18n([english], fallback="en", cache_size=8)
+        self.assertEqual(i18n.get_text("hello", "en", name="Bob"), "Hello, Bob")
+        self.assertEqual(i18n.get_text("hello", "en", name="Bob"), "Hello, Bob")
+        self.assertEqual(i18n.cache_info().hits, 1)
+
+        # Unhashable arguments bypass the cache
+        i18n.get_text("hello", "en", name=["Bob"])
+        self.assertEqual(i18n.cache_info().currsize, 1)
+
+        english.translations = {"hello": "Hi, {name}"}
+        self.assertEqual(i18n.cache_info().currsize, 0)
+        self.assertEqual(i18n.get_text("hello", "en", name="Bob"), "Hi, Bob")
+
+    def test_get_text_many(self):
+        i18n = I18n([
+            Language("English", "en", {"hello": "Hello", "welcome": "Welcome {name}{end}"}),
+            Language("French", "fr", {"hello": "Bonjour"}),
+        ], fallback="en")
+        self.assertEqual(
+            i18n.get_text_many(["hello", ("welcome", {"name": "Bob"})], "fr", end="!"),
+            ["Bonjour", "Welcome Bob!"])
+        with self.assertRaises(InvalidTranslationKeyError):
+            i18n.get_text_many(["hello", "nope"], "fr")
+        with self.assertRaises(InvalidLocaleError):
+            i18n.get_text_many(["hello"], "de")
+
+        # Batches go through metrics like single calls
+        metrics = i18n.enable_metrics()
+        i18n.get_text_many(["hello", ("welcome", {"name": "Bob", "end": "."})], "fr")
+        i18n.get_text_all_locales("hello")
+        self.assertEqual(metrics.snapshot()["lookups"], {"fr": {"hello": 2, "welcome": 1}, "en": {"hello": 1}})
+        self.assertEqual(metrics.snapshot()["fallbacks"], {"fr": {"welcome": 1}})
+
+    def test_get_text_all_locales(self):
+        self.assertEqual(self.i18n.get_text_all_locales("hello"), {"en": "Hello", "fr": "Bonjour"})
+        self.assertEqual(self.i18n.get_text_all_locales("goodbye", locales=["fr"]), {"fr": "Au revoir"})
+        self.assertEqual(self.i18n.get_text_all_locales("english", should_fallback=False), {"en": "English"})
+
+    def test_lazy_languages(self):
+        french = LazyLanguage("French", "fr", lambda: {"hello": "Bonjour"})
+        i18n = I18n([Language("English", "en", {"hello": "Hello", "bye": "Bye"}), french], fallback="en")
+        self.assertFalse(french.is_loaded)
+        self.assertEqual(i18n.get_text("hello", "en"), "Hello")
+        self.assertFalse(french.is_loaded)
+
+        self.assertEqual(i18n.get_text("bye", "fr"), "Bye")
+        self.assertTrue(french.is_loaded)
+        self.assertEqual(i18n.unload_unused(60), [])
+        self.assertEqual(i18n.unload_unused(0), ["fr"])
+        self.assertFalse(french.is_loaded)
+        self.assertEqual(i18n.get_text("hello", "fr"), "Bonjour")
+
+    def test_reload(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "fr.json")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"hello": "Bonjour"}, file)
+
+            i18n = I18n([
+                Language("English", "en", {"hello": "Hello"}),
+                LazyLanguage("French", "fr", path),
+            ], fallback="en", cache_size=8)
+            self.assertEqual(i18n.get_text("hello", "fr"), "Bonjour")
+
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"hello": "Salut"}, file)
+            self.assertEqual(i18n.get_text("hello", "fr"), "Bonjour")
+            self.assertEqual(i18n.reload(), ["fr"])
+            self.assertEqual(i18n.get_text("hello", "fr"), "Salut")
+
+            # Languages never used are not loaded by reloading
+            unused = LazyLanguage("German", "de", path)
+            i18n.add_language(unused)
+            self.assertEqual(sorted(i18n.reload()), ["de", "fr"])
+            self.assertFalse(i18n._languages["de"].is_loaded)
+            self.assertTrue(i18n._languages["fr"].is_loaded)
+            i18n.remove_language("de")
+
+            async def run():
+                with open(path, "w", encoding="utf-8") as file:
+                    json.dump({"hello": "Coucou"}, file)
+                self.assertEqual(await i18n.reload_async(["fr"]), ["fr"])
+                self.assertEqual(i18n.get_text("hello", "fr"), "Coucou")
+
+                i18n.watch(interval=0.01)
+                await asyncio.sleep(0.05)
+                with open(path, "w", encoding="utf-8") as file:
+                    json.dump({"hello": "Bonsoir"}, file)
+                os.utime(path, ns=(0, 10 ** 18))
+                for _ in range(100):
+                    await asyncio.sleep(0.01)
+                    if i18n.get_text("hello", "fr") == "Bonsoir":
+                        break
+                self.assertEqual(i18n.get_text("hello", "fr"), "Bonsoir")
+
+                # A malformed file is skipped, and retried until fixed
+                with open(path, "w", encoding="utf-8") as file:
+                    file.write('{"hello": ')
+                os.utime(path, ns=(0, 2 * 10 ** 18))
+                with self.assertLogs("pycord18n.i18n", "ERROR"):
+                    await asyncio.sleep(0.05)
+                self.assertEqual(i18n.get_text("hello", "fr"), "Bonsoir")
+                with open(path, "w", encoding="utf-8") as file:
+                    json.dump({"hello": "Bonne nuit"}, file)
+                os.utime(path, ns=(0, 3 * 10 ** 18))
+                for _ in range(100):
+                    await asyncio.sleep(0.01)
+                    if i18n.get_text("hello", "fr") == "Bonne nuit":
+                        break
+                i18n.stop_watching()
+                self.assertEqual(i18n.get_text("hello", "fr"), "Bonne nuit")
+
+                plain = I18n([Language("English", "en", {})], fallback="en")
+                with self.assertLogs("pycord18n.i18n", "WARNING"):
+                    plain.watch()
+                plain.stop_watching()
+
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(run())
+            finally:
+                loop.close()
+
+    def test_key_handles(self):
+        english = Language("English", "en", {
+            "errors": {"cooldown": "Wait {seconds}s"},
+            "apples": {"one": "{count} apple", "other": "{count} apples"},
+        })
+        french = Language("French", "fr", {"errors": {"cooldown": "Attends {seconds}s"}})
+        i18n = I18n([english, french], fallback="en")
+
+        cooldown = i18n.key("errors.cooldown")
+        self.assertEqual(cooldown, "errors.cooldown")
+        self.assertEqual(i18n.get_text(cooldown, "fr", seconds=3), "Attends 3s")
+        self.assertEqual(i18n.get_text(cooldown, "en", seconds=3), "Wait 3s")
+        self.assertEqual(set(cooldown._entries), {"fr", "en"})
+
+        # Forgotten when the languages change
+        french.translations = {}
+        self.assertEqual(i18n.get_text(cooldown, "fr", seconds=3), "Wait 3s")
+        with self.assertRaises(InvalidTranslationKeyError):
+            i18n.get_text(cooldown, "fr", should_fallback=False)
+
+        apples = i18n.key("apples")
+        self.assertEqual(i18n.get_text(apples, "en", count=1), "1 apple")
+        with self.assertRaises(InvalidTranslationKeyError):
+            i18n.get_text(i18n.key("missing"), "en")
+        # Handles of another instance are plain keys
+        self.assertEqual(I18n([english], fallback="en").get_text(cooldown, "en", seconds=1), "Wait 1s")
+
     def test_locale_error(self):
         with self.assertRaises(InvalidLocaleError):
             self.i18n.get_text("foo", "bar", should_fallback=False)
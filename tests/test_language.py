@@ -18,8 +18,10 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import json
+import tempfile
 import unittest
-from pycord18n.language import Language
+from pycord18n.language import Language, LazyLanguage, SafeDict
 
 class LanguageTesting(unittest.TestCase):
     def setUp(self) -> None:
@@ -27,7 +29,12 @@ class LanguageTesting(unittest.TestCase):
             "you_lost": "You lost the {game}",
             "game": "game",
             "hello": "Hello, {place}!",
-            "and_": "and"
+            "and_": "and",
+            "errors": {
+                "perm": {
+                    "missing": "Missing {perm}"
+                }
+            }
         })
     
     def test_basic_get(self):
@@ -42,6 +49,87 @@ class LanguageTesting(unittest.TestCase):
     def test_formatted_list(self):
         self.assertEqual(self.language.get_text("hello", list_formatter=self.language.and_, place=["World", "Universe"]), "Hello, World and Universe!")
 
+    def test_list_formatters(self):
+        self.assertEqual(self.language.and_(["a", "b", "c"]), "a, b and c")
+        self.assertEqual(self.language.get_text("hello", list_formatter="and_", place=["a", "b", "c"]), "Hello, a, b and c!")
+        self.assertIs(self.language.get_list_formatter("and_"), self.language.get_list_formatter("and_"))
+        with self.assertRaises(KeyError):
+            self.language.or_(["a", "b"])
+
+        empty = Language("Empty", "xx", {"or_": ""})
+        with self.assertRaises(KeyError):
+            empty.or_(["a", "b"])
+        self.assertEqual(empty.or_(["a", "b"], raise_on_empty=False), "a  b")
+
+        spanish = Language("Spanish", "es", {"and_": {"two": "{0} y {1}", "end": "{0} y {1}"}})
+        self.assertEqual(spanish.and_(["a", "b", "c"]), "a, b y c")
+
+    def test_dotted_get(self):
+        self.assertEqual(self.language.get_text("errors.perm.missing", perm="admin"), "Missing admin")
+        with self.assertRaises(KeyError):
+            self.language.get_text("errors.perm.unknown")
+        with self.assertRaises(KeyError):
+            self.language.get_text("errors.nope.missing")
+
+    def test_missing_placeholder(self):
+        self.assertEqual(self.language.get_text("hello"), "Hello, {place}!")
+        self.assertEqual(self.language.get_text("you_lost", use_translations=False), "You lost the {game}")
+
+    def test_safedict_hook(self):
+        class UpperSafeDict(SafeDict):
+            def __missing__(self, key):
+                return key.upper()
+
+        self.assertEqual(self.language.get_text("hello", safedict=UpperSafeDict), "Hello, PLACE!")
+
+
+    def test_nested_translations(self):
+        language = Language("English", "en", {
+            "brand": "Acme",
+            "emoji": ":wave:",
+            "bot": "{brand} Bot {emoji}",
+            "welcome": "Welcome to {bot}, {name}!",
+            "ping": "{pong}",
+            "pong": "Pong {ping}",
+        })
+        self.assertEqual(language.get_text("welcome", name="Bob"), "Welcome to Acme Bot :wave:, Bob!")
+        # Expanded once, then reused
+        self.assertEqual(language._expansions["bot"], (frozenset({"brand", "emoji"}), "Acme Bot :wave:"))
+        # Parameters still take priority at every level
+        self.assertEqual(
+            language.get_text("welcome", name="Bob", brand="Other"), "Welcome to Other Bot :wave:, Bob!")
+        # Cycles are left as placeholders
+        self.assertEqual(language.get_text("ping"), "Pong {ping}")
+        self.assertNotIn("pong", language._expansions)
+
+        language.translations = {**language.translations, "brand": "Widget"}
+        self.assertEqual(language.get_text("welcome", name="Bob"), "Welcome to Widget Bot :wave:, Bob!")
+
+    def test_lazy_language(self):
+        loads = []
+
+        def load():
+            loads.append(1)
+            return {"hello": "Hello, {place}!"}
+
+        language = LazyLanguage("English", "en", load)
+        self.assertFalse(language.is_loaded)
+        self.assertEqual(language.get_text("hello", place="World"), "Hello, World!")
+        self.assertTrue(language.is_loaded)
+
+        language.unload()
+        self.assertFalse(language.is_loaded)
+        self.assertEqual(language.get_text("hello", place="World"), "Hello, World!")
+        self.assertEqual(len(loads), 2)
+
+    def test_lazy_language_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "en.json")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"game": {"lost": "You lost"}}, file)
+
+            language = LazyLanguage("English", "en", path)
+            self.assertEqual(language.get_text("game.lost"), "You lost")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,51 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from pycord18n.lists import ListFormatter, pattern_separator
+
+class ListsTesting(unittest.TestCase):
+    def test_connector(self):
+        formatter = ListFormatter.from_connector("and")
+        self.assertEqual(formatter([]), "")
+        self.assertEqual(formatter([1]), "1")
+        self.assertEqual(formatter([1, 2]), "1 and 2")
+        self.assertEqual(formatter([1, 2, 3, 4]), "1, 2, 3 and 4")
+        self.assertEqual(formatter(str(i) for i in range(3)), "0, 1 and 2")
+
+    def test_patterns(self):
+        formatter = ListFormatter.from_patterns({
+            "two": "{0} y {1}",
+            "start": "{0}; {1}",
+            "end": "{0} e {1}"
+        })
+        self.assertEqual(formatter(["a", "b"]), "a y b")
+        self.assertEqual(formatter(["a", "b", "c", "d"]), "a; b, c e d")
+
+    def test_invalid_pattern(self):
+        self.assertEqual(pattern_separator("{0}、{1}"), "、")
+        with self.assertRaises(ValueError):
+            pattern_separator("{1} and {0}")
+        with self.assertRaises(KeyError):
+            ListFormatter.from_patterns({"end": "{0} and {1}"})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
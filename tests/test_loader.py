@@ -0,0 +1,94 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import tempfile
+import unittest
+from pycord18n.compact import CompactLanguage, KeyStore
+from pycord18n.i18n import I18n
+from pycord18n.loader import load_language, stream_translations
+
+
+class LoaderTesting(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.translations = {
+            "hello": "Hello \"{name}\" é\\n",
+            "apples": {"one": "{count} apple", "other": "{count} apples"},
+            "menu": {"one": "One", "open": "Open", "sub": {"deep": "Deep"}},
+            "few": {"few": "Few"},
+            "empty": {},
+        }
+        self.json_path = self.write("common.json", json.dumps(self.translations, indent=2))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+        return path
+
+    def test_stream_json(self):
+        expected = dict(CompactLanguage("English", "en", self.translations).translations)
+        # Tokens cut at every possible place
+        for chunk_size in (1, 2, 3, 7, 65536):
+            self.assertEqual(dict(stream_translations(self.json_path, chunk_size)), expected)
+
+    def test_load_and_merge(self):
+        music = self.write("music.yaml", "play: Play {song}\nqueue:\n  one: '{count} song'\n  other: '{count} songs'\n")
+        override = self.write("override.json", '{"hello": "Hi {name}", "menu": {"open": "Show"}}')
+
+        store = KeyStore()
+        language = load_language(
+            "English", "en", self.json_path, ("music", music), override, store=store)
+        self.assertIs(language._store, store)
+        self.assertEqual(language.get_text("hello", name="Bob"), "Hi Bob")
+        self.assertEqual(language.get_text("menu.open"), "Show")
+        self.assertEqual(language.get_text("menu.sub.deep"), "Deep")
+        self.assertEqual(language.get_text("music.play", song="Song"), "Play Song")
+        self.assertEqual(language.get_text("music.queue", count=3), "3 songs")
+
+    def test_reload(self):
+        music = self.write("music.json", '{"play": "Play"}')
+        i18n = I18n([load_language("English", "en", self.json_path, ("music", music))], fallback="en")
+        self.assertEqual(len(i18n._source_mtimes()["en"]), 2)
+        self.write("music.json", '{"play": "Start"}')
+        self.assertEqual(i18n.reload(), ["en"])
+        self.assertEqual(i18n.get_text("music.play", "en"), "Start")
+        self.assertEqual(i18n.get_text("menu.open", "en"), "Open")
+        # Built from a dict, nothing to reload
+        self.assertEqual(I18n([CompactLanguage("English", "en", {})], fallback="en").reload(), [])
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            load_language("English", "en", self.write("list.json", '{"a": {"b": ["c"]}}'))
+        with self.assertRaises(TypeError):
+            load_language("English", "en", self.write("number.json", '{"a": 1}'))
+        with self.assertRaises(json.JSONDecodeError):
+            load_language("English", "en", self.write("bad.json", '{"a": "b",}'))
+        with self.assertRaises(json.JSONDecodeError):
+            load_language("English", "en", self.write("extra.json", '{"a": "b"} {}'))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
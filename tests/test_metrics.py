@@ -0,0 +1,107 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import tempfile
+import unittest
+from pycord18n.i18n import I18n, InvalidTranslationKeyError
+from pycord18n.language import Language
+from pycord18n.metrics import Metrics
+from pycord18n.snapshot import prerender
+
+class MetricsTesting(unittest.TestCase):
+    def setUp(self) -> None:
+        self.i18n = I18n([
+            Language("English", "en", {"hello": "Hello", "bye": "Bye"}),
+            Language("French", "fr", {"hello": "Bonjour"}),
+        ], fallback="en")
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.i18n.metrics)
+        self.assertNotIn("get_text", vars(self.i18n))
+
+    def test_counts(self):
+        events = []
+        metrics = self.i18n.enable_metrics(callback=lambda *event: events.append(event[:3]))
+        self.i18n.get_text("hello", "fr")
+        self.i18n.get_text("hello", "fr")
+        self.i18n.get_text("bye", "fr")
+        with self.assertRaises(InvalidTranslationKeyError):
+            self.i18n.get_text("nope", "fr")
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["lookups"], {"fr": {"hello": 2, "bye": 1, "nope": 1}})
+        self.assertEqual(snapshot["fallbacks"], {"fr": {"bye": 1}})
+        self.assertEqual(snapshot["missing"], {"fr": {"nope": 1}})
+        self.assertEqual(snapshot["latency"]["count"], 4)
+        self.assertEqual(events[2], ("fr", "bye", "fallback"))
+
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()["lookups"], {})
+
+        self.i18n.disable_metrics()
+        self.assertNotIn("get_text", vars(self.i18n))
+        self.assertEqual(self.i18n.get_text("hello", "fr"), "Bonjour")
+
+    def test_snapshot_fallbacks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "snapshot.p18c")
+            prerender(self.i18n, path, max_workers=1)
+            self.i18n.load_snapshot(path)
+            metrics = self.i18n.enable_metrics()
+            self.i18n._resolution.clear()
+            self.assertEqual(self.i18n.get_text("bye", "fr"), "Bye")
+            self.assertEqual(self.i18n.get_text("hello", "fr"), "Bonjour")
+            self.assertEqual(metrics.snapshot()["fallbacks"], {"fr": {"bye": 1}})
+            # Served without building the resolution table
+            self.assertEqual(self.i18n._resolution, {})
+            self.i18n._snapshot.close()
+
+    def test_cached_fallbacks(self):
+        i18n = I18n(list(self.i18n._languages.values()), fallback="en", cache_size=8)
+        metrics = i18n.enable_metrics()
+        for _ in range(2):
+            self.assertEqual(i18n.get_text("bye", "fr"), "Bye")
+        self.assertEqual(metrics.snapshot()["fallbacks"], {"fr": {"bye": 2}})
+        self.assertEqual(i18n.cache_info().hits, 1)
+
+    def test_namespace(self):
+        music = self.i18n.add_namespace("music", [
+            Language("English", "en", {"play": "Play"}),
+            Language("French", "fr", {"play": "Jouer"}),
+        ])
+        metrics = music.enable_metrics()
+        music.get_text("play", "fr")
+        music.get_text("hello", "fr")
+        music.get_text("bye", "fr")
+        self.assertEqual(metrics.snapshot()["lookups"], {"fr": {"play": 1, "hello": 1, "bye": 1}})
+        self.assertEqual(metrics.snapshot()["fallbacks"], {"fr": {"bye": 1}})
+
+    def test_sampling(self):
+        with self.assertRaises(ValueError):
+            Metrics(sample_rate=0)
+
+        metrics = self.i18n.enable_metrics(sample_rate=0.000001)
+        for _ in range(100):
+            self.i18n.get_text("hello", "en")
+        self.assertLess(metrics.snapshot()["latency"]["count"], 100)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
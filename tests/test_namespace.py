@@ -0,0 +1,96 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from pycord18n.i18n import I18n, InvalidTranslationKeyError, Namespace
+from pycord18n.language import Language, LazyLanguage
+
+
+class NamespaceTesting(unittest.TestCase):
+    def setUp(self):
+        self.loaded = []
+        self.i18n = I18n([
+            Language("English", "en", {"brand": "Bot", "hello": "Hi {brand}"}),
+            Language("French", "fr", {"brand": "Robot"}),
+            Language("German", "de", {"brand": "Roboter"}),
+        ], fallback="en")
+        self.music = self.i18n.add_namespace("music", [
+            LazyLanguage("English", "en", self.source("en", {
+                "play": "{brand} plays {title}",
+                "brand": "{brand} Music",
+            })),
+            LazyLanguage("French", "fr", self.source("fr", {"play": "{brand} joue {title}"})),
+        ])
+
+    def source(self, code, translations):
+        def load():
+            self.loaded.append(code)
+            return translations
+        return load
+
+    def test_lookup(self):
+        self.assertIsInstance(self.music, Namespace)
+        self.assertIs(self.i18n.namespace("music"), self.music)
+        # Placeholders are filled from the namespace, then shared translations
+        self.assertEqual(self.music.get_text("play", "fr", title="x"), "Robot joue x")
+        self.assertEqual(self.music.get_text("play", "en", title="x"), "Bot Music plays x")
+        # Shared keys are served too
+        self.assertEqual(self.music.get_text("hello", "fr"), "Hi Bot")
+        # Locales of the instance without a namespace language fall back
+        self.assertEqual(self.music.get_text("play", "de", title="x"), "Bot Music plays x")
+        with self.assertRaises(InvalidTranslationKeyError):
+            self.music.get_text("missing", "fr")
+        # Namespaced keys are not visible from the instance
+        with self.assertRaises(InvalidTranslationKeyError):
+            self.i18n.get_text("play", "fr")
+        with self.assertRaises(KeyError):
+            self.i18n.namespace("admin")
+
+    def test_load_and_unload(self):
+        self.assertEqual(self.loaded, [])
+        self.music.get_text("play", "fr", title="x")
+        self.assertIn("fr", self.loaded)
+        self.assertNotIn("fr", self.i18n.unload_unused(0))
+        self.assertEqual(sorted(self.music.unload_unused(0)), sorted(set(self.loaded)))
+        self.assertEqual(self.music.get_text("play", "fr", title="y"), "Robot joue y")
+
+    def test_shared_changes(self):
+        self.assertEqual(self.music.get_text("play", "fr", title="x"), "Robot joue x")
+        self.i18n._languages["fr"].translations = {"brand": "Robo"}
+        self.assertEqual(self.music.get_text("play", "fr", title="x"), "Robo joue x")
+        self.i18n.add_language(Language("French", "fr", {"brand": "Automate"}))
+        self.assertEqual(self.music.get_text("play", "fr", title="x"), "Automate joue x")
+
+    def test_single_rebuild(self):
+        codes = [f"l{i}" for i in range(30)]
+        i18n = I18n([Language(code, code, {"brand": code}) for code in codes], fallback="l0")
+        namespace = i18n.add_namespace("many", [Language(code, code, {"name": "{brand}"}) for code in codes])
+        self.assertEqual(namespace._generation, 1)
+        i18n.add_language(Language("l1", "l1", {"brand": "new"}))
+        self.assertEqual(namespace._generation, 2)
+        self.assertEqual(namespace.get_text("name", "l1"), "new")
+
+    def test_remove(self):
+        with self.assertRaises(KeyError):
+            self.i18n.add_namespace("music", [Language("English", "en", {})])
+        music = self.i18n.remove_namespace("music")
+        self.assertIs(music, self.music)
+        with self.assertRaises(KeyError):
+            self.i18n.namespace("music")
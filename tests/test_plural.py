@@ -0,0 +1,89 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from decimal import Decimal
+from pycord18n.i18n import I18n
+from pycord18n.language import Language
+from pycord18n.plural import PluralForms, compile_plural_rule, get_plural_rule, plural_operands
+
+class PluralTesting(unittest.TestCase):
+    def test_operands(self):
+        self.assertEqual(plural_operands(-3), (3, 3, 0, 0, 0, 0))
+        self.assertEqual(plural_operands("1.50"), (Decimal("1.50"), 1, 2, 1, 50, 5))
+        self.assertEqual(plural_operands(2.5), (Decimal("2.5"), 2, 1, 1, 5, 5))
+
+    def test_builtin_rules(self):
+        english = get_plural_rule("en-US")
+        self.assertEqual([english(n) for n in (0, 1, 2, "1.0")], ["other", "one", "other", "other"])
+
+        russian = get_plural_rule("ru")
+        self.assertEqual(
+            [russian(n) for n in (1, 2, 5, 11, 21, 22, 1.5)],
+            ["one", "few", "many", "many", "one", "few", "other"])
+
+        arabic = get_plural_rule("ar")
+        self.assertEqual(
+            [arabic(n) for n in (0, 1, 2, 3, 11, 100)],
+            ["zero", "one", "two", "few", "many", "other"])
+
+        self.assertEqual(get_plural_rule("ja")(1), "other")
+        self.assertIs(get_plural_rule("de"), get_plural_rule("en"))
+
+    def test_compile_rule(self):
+        rule = compile_plural_rule({"one": "n = 1 @integer 1", "few": "n % 10 = 2..4, 7"})
+        self.assertEqual([rule(n) for n in (1, 3, 7, 5, 3.5)], ["one", "few", "few", "other", "other"])
+        with self.assertRaises(ValueError):
+            compile_plural_rule({"one": "n = "})
+        with self.assertRaises(ValueError):
+            compile_plural_rule({"single": "n = 1"})
+
+    def test_is_plural(self):
+        self.assertTrue(PluralForms.is_plural({"one": "a", "other": "b"}))
+        self.assertFalse(PluralForms.is_plural({"one": "a"}))
+        self.assertFalse(PluralForms.is_plural({"title": "a", "other": "b"}))
+
+    def test_language_plurals(self):
+        language = Language("Polish", "pl", {
+            "files": {
+                "one": "{count} plik",
+                "few": "{count} pliki",
+                "many": "{count} plików",
+                "other": "{count} pliku"
+            }
+        })
+        self.assertEqual(language.get_text("files", count=1), "1 plik")
+        self.assertEqual(language.get_text("files", count=3), "3 pliki")
+        self.assertEqual(language.get_text("files", count=5), "5 plików")
+        self.assertEqual(language.get_text("files", count="1.5"), "1.5 pliku")
+        self.assertEqual(language.get_text("files"), "{count} pliku")
+
+    def test_custom_rules_and_fallback(self):
+        i18n = I18n([
+            Language("English", "en", {"apples": {"one": "{count} apple", "other": "{count} apples"}}),
+            Language("Custom", "xx", {}, plural_rules={"one": "n = 0..1"}),
+        ], fallback="en")
+        self.assertEqual(i18n.get_text("apples", "xx", count=1), "1 apple")
+        self.assertEqual(i18n.get_text("apples", "en", count=0), "0 apples")
+        self.assertEqual(i18n._languages["xx"].get_plural_category(0), "one")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,106 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pickle
+import tempfile
+import unittest
+from pycord18n.catalog import Catalog
+from pycord18n.i18n import I18n, InvalidLocaleError, InvalidTranslationKeyError
+from pycord18n.language import Language
+from pycord18n.snapshot import prerender, render_static
+
+
+class SnapshotTesting(unittest.TestCase):
+    def setUp(self):
+        self.english = Language("English", "en", {
+            "brand": "Acme",
+            "about": "About {brand}",
+            "hello": "Hello {name}",
+            "greeting": "{hello}!",
+            "escaped": "{{brand}}",
+            "apples": {"one": "{count} apple", "other": "{count} apples"},
+            "menu": {"open": "Open {brand}"},
+        })
+        self.french = Language("French", "fr", {"brand": "Acmé", "about": "À propos de {brand}"})
+        self.i18n = I18n([self.english, self.french], fallback="en")
+
+    def test_render_static(self):
+        self.assertEqual(render_static(self.i18n, "fr"), {
+            "brand": "Acmé",
+            "about": "À propos de Acmé",
+            "escaped": "{brand}",
+            "menu.open": "Open Acme",
+        })
+
+    def test_prerender(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "snapshot.p18c")
+            self.assertEqual(prerender(self.i18n, path, max_workers=2), 8)
+            catalog = Catalog(path)
+            self.assertEqual(catalog["fr.about"], "À propos de Acmé")
+            self.assertNotIn("fr.hello", catalog)
+            catalog.close()
+
+            shard = I18n([self.english, self.french], fallback="en")
+            shard.load_snapshot(path)
+            self.assertEqual(shard.get_text("escaped", "fr"), "{brand}")
+            self.assertEqual(shard.get_text("hello", "fr", name="Bob"), "Hello Bob")
+            self.assertIs(shard.get_text("about", "fr"), shard._snapshot["fr.about"])
+            with self.assertRaises(InvalidLocaleError):
+                shard.get_text("about", None)
+            self.assertEqual(
+                shard.get_text_many(["about", "escaped"], "fr"),
+                [shard.get_text("about", "fr"), shard.get_text("escaped", "fr")])
+            self.assertIs(shard.get_text_many(["about"], "fr")[0], shard._snapshot["fr.about"])
+
+            # Dropped once the languages change
+            self.french.translations = {"brand": "Acmé", "about": "Infos sur {brand}"}
+            self.assertIsNone(shard._snapshot)
+            self.assertEqual(shard.get_text("about", "fr"), "Infos sur Acmé")
+
+    def test_prerender_namespace(self):
+        german = Language("German", "de", {"brand": "Acme DE"})
+        i18n = I18n([self.english, self.french, german], fallback="en")
+        music = i18n.add_namespace("music", [
+            Language("English", "en", {"play": "Play on {brand}"}),
+            Language("French", "fr", {"play": "Jouer sur {brand}"}),
+        ])
+        with tempfile.TemporaryDirectory() as directory:
+            serial = os.path.join(directory, "serial.p18c")
+            parallel = os.path.join(directory, "parallel.p18c")
+            prerender(music, serial, max_workers=1)
+            prerender(music, parallel, max_workers=2)
+            serial, parallel = Catalog(serial), Catalog(parallel)
+            self.assertEqual(dict(serial), dict(parallel))
+            self.assertEqual(parallel["fr.play"], "Jouer sur Acmé")
+            self.assertEqual(parallel["de.play"], "Play on Acme")
+            serial.close()
+            parallel.close()
+
+    def test_errors_pickle(self):
+        error = pickle.loads(pickle.dumps(InvalidLocaleError("Nope", locale="xx")))
+        self.assertEqual((error.args, error.locale), (("Nope",), "xx"))
+        error = pickle.loads(pickle.dumps(InvalidTranslationKeyError("Nope", key="a.b")))
+        self.assertEqual((error.args, error.key), (("Nope",), "a.b"))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
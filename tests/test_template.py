@@ -0,0 +1,58 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from pycord18n.language import SafeDict
+from pycord18n.template import compile_template
+
+class TemplateTesting(unittest.TestCase):
+    def assertSameAsFormatMap(self, source, **mapping):
+        self.assertEqual(
+            compile_template(source).render(SafeDict(**mapping)),
+            source.format_map(SafeDict(**mapping)))
+
+    def test_basic_render(self):
+        template = compile_template("Hello, {place}!")
+        self.assertEqual(template.names, frozenset({"place"}))
+        self.assertEqual(template.render({"place": "World"}), "Hello, World!")
+
+    def test_static(self):
+        template = compile_template("Hello {{world}}")
+        self.assertTrue(template.is_static)
+        self.assertEqual(template.render({}), "Hello {world}")
+
+    def test_matches_format_map(self):
+        self.assertSameAsFormatMap("{a} and {b}", a=1)
+        self.assertSameAsFormatMap("{a!r:>10}|{b:05d}", b=42)
+        self.assertSameAsFormatMap("{a:>{b}}", b="5")
+        self.assertSameAsFormatMap("{a[0]}", a=["x"])
+        self.assertSameAsFormatMap("{{{a}}}", a=3.5)
+
+    def test_errors_match_format_map(self):
+        with self.assertRaises(ValueError):
+            compile_template("{0}").render(SafeDict())
+        with self.assertRaises(ValueError):
+            compile_template("unbalanced {").render(SafeDict())
+        with self.assertRaises(KeyError):
+            compile_template("{missing}").render({})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
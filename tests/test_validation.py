@@ -0,0 +1,82 @@
+# Copyright (C) 2021 YoungTrep
+
+# This file is part of pycord18n.
+
+# pycord18n is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# pycord18n is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with pycord18n.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from pycord18n.i18n import I18n, InvalidLocaleError
+from pycord18n.language import Language
+from pycord18n.validation import validate
+
+
+class ValidationTesting(unittest.TestCase):
+    def setUp(self):
+        self.i18n = I18n([
+            Language("English", "en", {
+                "hello": "Hello {name}",
+                "game": "the game",
+                "lost": "You lost {game}",
+                "apples": {"one": "an apple", "other": "{count} apples"},
+                "menu": {"open": "Open", "close": "Close"},
+                "_formats": {"date": "%d/%m/%Y"},
+            }),
+            Language("French", "fr", {
+                "hello": "Bonjour {nom}",
+                "game": "le jeu {lost}",
+                "lost": "Tu as perdu {game}",
+                "apples": {"one": "{count} pomme", "other": "{count} pommes"},
+                "menu": {"open": "Ouvrir {"},
+                "bonus": "Bonus",
+            }),
+        ], fallback="en")
+
+    def test_report(self):
+        report = validate(self.i18n)
+        self.assertFalse(report.ok)
+
+        english = report.locales["en"]
+        self.assertTrue(english.ok)
+        self.assertEqual(english.total, 6)
+        self.assertEqual(english.coverage, 100.0)
+
+        french = report.locales["fr"]
+        self.assertEqual(french.missing, ["menu.close"])
+        self.assertEqual(french.extra, ["bonus"])
+        self.assertAlmostEqual(french.coverage, 500 / 6)
+        self.assertEqual(
+            french.placeholders,
+            {
+                "hello": (frozenset({"name"}), frozenset({"nom"})),
+                "game": (frozenset(), frozenset({"lost"})),
+            })
+        self.assertEqual(french.malformed, ["menu.open"])
+        self.assertEqual(french.cycles, [("game", "lost")])
+
+        summary = report.summary()
+        self.assertIn("fr: 83.3% coverage, 1 missing, 1 extra", summary)
+        self.assertIn("cycle: game -> lost -> game", summary)
+
+    def test_locales(self):
+        self.assertEqual(list(validate(self.i18n, ["fr"]).locales), ["fr"])
+        with self.assertRaises(InvalidLocaleError):
+            validate(self.i18n, ["de"])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)